@@ -21,6 +21,12 @@ _DOC_DIR_PATH = _REPO_ROOT_PATH / "doc"
 
 _SOURCE_DIR_NAMES = ["pytrnsys_process", "tests", "dev-tools"]
 
+_BENCHMARKS_DIR_PATH = pl.Path("tests") / "pytrnsys_process" / "benchmarks"
+
+_BENCHMARK_BASELINE_NAME = "baseline"
+
+_BENCHMARK_MAX_MEDIAN_REGRESSION = "25%"
+
 
 def main():
     """Run the tool"""
@@ -42,6 +48,8 @@ def main():
 
     _maybe_run_pytest(arguments, test_results_dir_path)
 
+    _maybe_run_benchmarks(arguments, test_results_dir_path)
+
     _maybe_create_documentation(arguments)
 
 
@@ -102,6 +110,18 @@ def _parse_arguments() -> ap.Namespace:
         nargs="?",
         dest="pytestMarkersExpression",
     )
+    parser.add_argument(
+        "-p",
+        "--benchmark",
+        help="Run the benchmarks and compare them to the stored baseline, "
+        "or save them as the new baseline. Baselines depend on the machine, "
+        "so they are not committed: save one before comparing",
+        nargs="?",
+        default=None,
+        const="compare",
+        choices=["compare", "save"],
+        dest="benchmarkMode",
+    )
     parser.add_argument(
         "-d",
         "--diagram",
@@ -220,6 +240,7 @@ def _maybe_run_pytest(arguments, test_results_dir_path):
         and arguments.lintArguments is None
         and arguments.blackArguments is None
         and arguments.diagramsFormat is None
+        and arguments.benchmarkMode is None
         and not arguments.shallCreateDocumentation
     )
     if (
@@ -254,6 +275,26 @@ def _run_unit_tests_with_pytest(arguments, test_results_dir_path):
     _print_and_run(args)
 
 
+def _maybe_run_benchmarks(arguments, test_results_dir_path):
+    if arguments.benchmarkMode is None:
+        return
+
+    cmd = [
+        _SCRIPTS_DIR / "pytest",
+        "--benchmark-only",
+        f"--benchmark-storage={_BENCHMARKS_DIR_PATH / 'baselines'}",
+        f"--benchmark-json={test_results_dir_path / 'benchmarks.json'}",
+    ]
+    if arguments.benchmarkMode == "save":
+        mode_args = [f"--benchmark-save={_BENCHMARK_BASELINE_NAME}"]
+    else:
+        mode_args = [
+            f"--benchmark-compare=*{_BENCHMARK_BASELINE_NAME}",
+            f"--benchmark-compare-fail=median:{_BENCHMARK_MAX_MEDIAN_REGRESSION}",
+        ]
+    _print_and_run([*cmd, *mode_args, _BENCHMARKS_DIR_PATH])
+
+
 def _run_doctests_with_pytest():
     cmd = [_SCRIPTS_DIR / "pytest", "--doctest-modules", "pytrnsys_process"]
     _print_and_run(cmd)
@@ -29,11 +29,17 @@ from pytrnsys_process.process import (
     process_single_simulation,
     process_whole_result_set,
     process_whole_result_set_parallel,
+    iterate_whole_result_set,
+    WorkerPool,
 )
 from pytrnsys_process.util import (
     export_plots_in_configured_formats,
+    load_simulation_from_cache,
     load_simulation_from_pickle,
     load_simulations_data_from_pickle,
+    exporting_plots_in_background,
+    wait_for_plot_exports,
+    convert_pending_svgs_to_emf,
 )
 
 __all__ = [
@@ -47,10 +53,15 @@ __all__ = [
     "scalar_compare_plot",
     "get_figure_with_twin_x_axis",
     "process_whole_result_set_parallel",
+    "iterate_whole_result_set",
     "process_single_simulation",
     "process_whole_result_set",
     "do_comparison",
+    "WorkerPool",
     "export_plots_in_configured_formats",
+    "exporting_plots_in_background",
+    "wait_for_plot_exports",
+    "convert_pending_svgs_to_emf",
     "global_settings",
     "Defaults",
     "REPO_ROOT",
@@ -58,6 +69,7 @@ __all__ = [
     "SimulationsData",
     "load_simulations_data_from_pickle",
     "load_simulation_from_pickle",
+    "load_simulation_from_cache",
     "get_date_time_axis_locator_and_formatter",
     "get_frequency_of_data",
     "format_date_time_twin_axis",
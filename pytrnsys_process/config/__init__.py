@@ -5,11 +5,16 @@ from pytrnsys_process.config.constants import (
     FileNames,
     REPO_ROOT,
 )
-from pytrnsys_process.config.settings import global_settings, Defaults
+from pytrnsys_process.config.settings import (
+    global_settings,
+    Defaults,
+    Settings,
+)
 
 __all__ = [
     "global_settings",
     "Defaults",
+    "Settings",
     "PlotSizes",
     "FilePattern",
     "FileType",
@@ -32,7 +32,11 @@ class FileType(Enum):
 
 class FileNames(Enum):
     SIMULATION_PICKLE_FILE = "simulation.pickle"
+    SIMULATION_CACHE_FOLDER = "simulation_cache"
+    FILE_CACHE_FOLDER = "file_cache"
     SIMULATIONS_DATA_PICKLE_FILE = "simulations_data.pickle"
+    PROCESSING_DURATIONS_FILE = "processing_durations.json"
+    PROCESSING_TIMINGS_FILE = "processing_timings.csv"
 
 
 REPO_ROOT: _pl.Path = _pl.Path(pp.__file__).parents[1]
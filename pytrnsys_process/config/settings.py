@@ -1,3 +1,4 @@
+import typing as _tp
 from collections import abc as _abc
 from dataclasses import dataclass, field
 from enum import Enum
@@ -25,6 +26,13 @@ class Plot:  # pylint: disable=too-many-instance-attributes
         Path to the installation of Inkscape.
         This is required to save plots to the EMF format.
 
+    export_workers:
+        Number of background threads exporting plots.
+        Use 0 to export plots in the calling thread.
+
+    inkscape_processes:
+        Maximum number of Inkscape processes converting the pending SVG files to EMF at the same time.
+
 
     date_format:
         Formatting to use when plotting datetimes.
@@ -45,6 +53,10 @@ class Plot:  # pylint: disable=too-many-instance-attributes
 
     inkscape_path: str = "C://Program Files//Inkscape//bin//inkscape.exe"
 
+    export_workers: int = 2
+
+    inkscape_processes: int = 4
+
     date_format: str = "%b %Y"
     label_font_size: int = 10
     legend_font_size: int = 8
@@ -65,6 +77,35 @@ class Plot:  # pylint: disable=too-many-instance-attributes
     )
 
 
+@dataclass
+class ReaderPerformance:
+    """
+    Class holding the settings trading memory or completeness of the data for reading speed.
+
+    Attributes
+    __________
+        max_read_workers: int
+            Number of threads reading the input files of a single simulation concurrently.
+            Mostly useful when processing a single large simulation, as batches already process simulations in parallel.
+            The files are read one after the other by default.
+
+        dtype: str, optional
+            Type to parse the data columns of the printer files into, e.g. "float32" to halve their memory.
+            By default the types are inferred, which is float64 for TRNSYS outputs.
+            Cached simulations and files of a different type are read again.
+
+        columns_to_read: list of str, optional
+            Names of the data columns to read from the printer files, all by default.
+            The other columns are skipped by the parser, which saves time and memory for wide printer files.
+            Simulations read this way are not cached.
+            Simulations with an up-to-date cache only load these columns from it.
+    """
+
+    max_read_workers: int = 1
+    dtype: _tp.Optional[str] = None
+    columns_to_read: _tp.Optional[_abc.Sequence[str]] = None
+
+
 @dataclass
 class Reader:
     """
@@ -82,17 +123,45 @@ class Reader:
             Deck files are parsed for constants by default.
 
         force_reread_prt: bool
-            Processing will use the faster pickle files, unless this is True.
+            Processing will use the faster cached files, unless this is True.
+            Simulations whose input files changed since they were cached are always reread.
+
+        hash_input_files: bool
+            If True, a content hash of every input file is recorded when a simulation is cached.
+            Files which were only touched, but whose content is the same, then don't trigger a reread.
+
+        incremental_deck_parsing: bool
+            If True, decks which only differ in a few constants or equations from a previously read deck,
+            e.g. in a parametric study, are evaluated by only parsing the differing lines.
+            Identical decks are only evaluated once in any case.
 
         starting_year: int
             The reader will use this to set the year in which the data starts in the datetime index.
+
+        lazy_loading: bool
+            If True, the monthly, hourly and step data of cached simulations is only loaded when accessed,
+            and released again after the processing scenarios ran.
+            DataFrames which were replaced, or got columns added or removed, are kept in memory.
+            Values changed in place in existing columns are not kept, use new columns or the scalar values instead.
+
+        validate_duplicate_columns: bool
+            Columns written by several printers are checked to contain the same values by default.
+            If False, the first occurrence is kept without checking, which is faster for large step files.
+
+        performance: ReaderPerformance
+            class holding the settings trading memory or completeness of the data for reading speed
     """
 
     folder_name_for_printer_files: str = "temp"
     read_step_files: bool = False
     read_deck_files: bool = True
     force_reread_prt: bool = False
+    hash_input_files: bool = False
+    incremental_deck_parsing: bool = False
     starting_year: int = 2024
+    lazy_loading: bool = False
+    validate_duplicate_columns: bool = True
+    performance: ReaderPerformance = field(default_factory=ReaderPerformance)
 
 
 @dataclass
@@ -1,5 +1,9 @@
-from pytrnsys_process.deck.extractor import parse_deck_for_constant_expressions
+from pytrnsys_process.deck.extractor import (
+    DeckCache,
+    parse_deck_for_constant_expressions,
+)
 
 __all__ = [
+    "DeckCache",
     "parse_deck_for_constant_expressions",
 ]
@@ -1,6 +1,12 @@
+import collections as _collections
 import collections.abc as _cabc
+import contextlib as _contextlib
+import dataclasses as _dc
+import hashlib as _hashlib
+import itertools as _itertools
 import logging as _logging
 import math as _math
+import threading as _threading
 
 import lark as _lark
 
@@ -17,6 +23,8 @@ def parse_deck_for_constant_expressions(
     This function parses a TRNSYS deck file string, identifies constant expressions,
     and evaluates them to their numerical values. It handles mathematical operations,
     functions, and variable references.
+    Each equation is evaluated once, after the equations it references.
+    Equations which can't be evaluated due to circular or unresolved references are reported in a single log message.
 
     Parameters
     __________
@@ -35,68 +43,8 @@ def parse_deck_for_constant_expressions(
 
     """
 
-    equations = _get_equation_trees(deck_as_string)
-    sub_trees_to_process = _get_expression_sub_trees_by_variable_name(
-        equations
-    )
-
-    evaluated_variables: dict[str, float | int] = {}
-    original_variable_names: list[str] = []
-    new_constants_found = True
-
-    while new_constants_found:
-        sub_trees_before_processing = sub_trees_to_process.copy()
-        # Needs to be converted into list, so items can be deleted while iteration over
-        # Described in this answer:
-        # https://stackoverflow.com/questions/5384914/how-to-delete-items-from-a-dictionary-while-iterating-over-it
-        for var, tree in list(sub_trees_to_process.items()):
-            try:
-
-                maybe_evaluated_value = (
-                    _evaluate_or_none_if_variable_could_not_be_found(
-                        tree, evaluated_variables
-                    )
-                )
-
-                if maybe_evaluated_value is not None:
-                    var_lower = var.casefold()
-                    original_variable_names.append(var)
-                    evaluated_variables[var_lower] = maybe_evaluated_value
-                    del sub_trees_to_process[var]
-
-            except MathFuncNotFoundError as e:
-                failed_equation = deck_as_string[
-                    e.meta.start_pos : e.meta.end_pos
-                ]
-                func_name, _ = failed_equation.split("(")
-                logger.warning(
-                    "On line %s, %s is not supported in %s=%s",
-                    e.meta.line,
-                    func_name,
-                    var,
-                    failed_equation,
-                )
-                del sub_trees_to_process[var]
-
-            except _lark.exceptions.VisitError as e:
-                failed_equation = deck_as_string[
-                    e.obj.meta.start_pos : e.obj.meta.end_pos  # type: ignore
-                ]
-                logger.error(
-                    "On line %s, unable to compute equation %s=%s because: %s",
-                    e.obj.meta.line,  # type: ignore
-                    var,
-                    failed_equation,
-                    str(e),
-                    exc_info=True,
-                )
-
-        if sub_trees_before_processing == sub_trees_to_process:
-            new_constants_found = False
-
-    return _rename_dict_keys_to_original_format(
-        evaluated_variables, original_variable_names
-    )
+    equations = _get_equation_trees(deck_as_string, logger)
+    return _evaluate_equations(equations, deck_as_string, logger)
 
 
 class EquationsCollectorVisitor(_lark.Visitor):
@@ -236,8 +184,291 @@ class ReferencedVariableNotEvaluatedError(Exception):
     """Raised if an equation could not be found in the dictionary of resolved equations."""
 
 
-def _get_equation_trees(deck_as_string):
-    whole_tree = parser.parse_dck(deck_as_string)
+class DeckCache:
+    """Cache the evaluated constant expressions of decks.
+
+    Decks are identified by the hash of their content, so identical decks are only parsed and evaluated once.
+    The log messages of the first evaluation are repeated, whenever the cached values are returned.
+    Only messages logged by the evaluation itself are repeated,
+    not those logged by other threads to the same logger at the same time.
+
+    In incremental mode, fully parsed decks serve as templates for sibling decks,
+    e.g. those of the other simulations of a parametric study.
+    If a deck only differs from a template in some lines of its CONSTANTS and EQUATIONS blocks,
+    only these lines are parsed, and only the equations on them and their dependents are evaluated again.
+
+    Parameters
+    __________
+        max_number_of_decks: int
+            Number of evaluated decks to keep
+
+        max_number_of_templates: int
+            Number of parsed decks to keep as templates for the incremental mode
+
+    Example
+    _______
+        >>> deck_cache = DeckCache()
+        >>> for deck_as_string in decks_of_parametric_study:
+        ...     values = deck_cache.parse_deck_for_constant_expressions(
+        ...         deck_as_string, incremental=True
+        ...     )
+    """
+
+    def __init__(
+        self, max_number_of_decks: int = 64, max_number_of_templates: int = 4
+    ):
+        self.max_number_of_decks = max_number_of_decks
+        self.max_number_of_templates = max_number_of_templates
+        self._evaluated_decks: _collections.OrderedDict[
+            str, tuple[dict[str, float | int], list[_logging.LogRecord]]
+        ] = _collections.OrderedDict()
+        self._templates: _collections.deque[_DeckTemplate] = (
+            _collections.deque(maxlen=max_number_of_templates)
+        )
+
+    def parse_deck_for_constant_expressions(
+        self,
+        deck_as_string: str,
+        logger: _logging.Logger = log.default_console_logger,
+        incremental: bool = False,
+    ) -> dict[str, float | int]:
+        """Same as :func:`parse_deck_for_constant_expressions`, but using and filling the cache.
+
+        Parameters
+        __________
+            deck_as_string: str
+                A string containing the contents of a TRNSYS deck file.
+            logger: Logger
+                provide your own logger. to for example log per simulation
+            incremental: bool
+                Whether to only parse and evaluate the differences to a previously parsed sibling deck.
+        """
+        key = _hashlib.sha256(deck_as_string.encode()).hexdigest()
+        if key in self._evaluated_decks:
+            self._evaluated_decks.move_to_end(key)
+            cached_values, cached_records = self._evaluated_decks[key]
+            for record in cached_records:
+                logger.handle(record)
+            return dict(cached_values)
+
+        with _collect_log_records(logger) as records:
+            values: dict[str, float | int] | None = None
+            if incremental:
+                values = self._evaluate_using_template(deck_as_string, logger)
+            if values is None:
+                values = self._evaluate_and_keep_template(
+                    deck_as_string, logger, incremental
+                )
+
+        self._evaluated_decks[key] = (values, records)
+        if len(self._evaluated_decks) > self.max_number_of_decks:
+            self._evaluated_decks.popitem(last=False)
+        return dict(values)
+
+    def clear(self) -> None:
+        self._evaluated_decks.clear()
+        self._templates.clear()
+
+    def _evaluate_and_keep_template(
+        self, deck_as_string: str, logger: _logging.Logger, keep_template: bool
+    ) -> dict[str, float | int]:
+        equations = _get_equation_trees(deck_as_string, logger)
+        values = _evaluate_equations(equations, deck_as_string, logger)
+
+        is_equation_line = parser.get_equation_lines(deck_as_string)
+        if keep_template and is_equation_line is not None:
+            self._templates.append(
+                _DeckTemplate(
+                    deck_as_string,
+                    deck_as_string.split("\n"),
+                    is_equation_line,
+                    {
+                        equation.meta.line - 1: equation
+                        for equation in equations
+                    },
+                    {var.casefold(): value for var, value in values.items()},
+                )
+            )
+        return values
+
+    def _evaluate_using_template(
+        self, deck_as_string: str, logger: _logging.Logger
+    ) -> dict[str, float | int] | None:
+        lines = deck_as_string.split("\n")
+        is_equation_line = parser.get_equation_lines(deck_as_string)
+        template = next(
+            (
+                t
+                for t in reversed(self._templates)
+                if t.is_equation_line == is_equation_line
+            ),
+            None,
+        )
+        if template is None or is_equation_line is None:
+            return None
+
+        line_start_positions = _itertools.accumulate(
+            (len(line) + 1 for line in lines), initial=0
+        )
+        equations_by_line = dict(template.equations_by_line)
+        changed_variables: set[str] = set()
+        for line_index, (line, line_start_position) in enumerate(
+            zip(lines, line_start_positions)
+        ):
+            if (
+                not is_equation_line[line_index]
+                or line == template.lines[line_index]
+            ):
+                continue
+            try:
+                equation = parser.parse_equation_line(
+                    line, line_index, line_start_position
+                )
+            except _lark.exceptions.LarkError:
+                return None
+
+            equations_by_line.pop(line_index, None)
+            equations_collector_visitor = EquationsCollectorVisitor()
+            equations_collector_visitor.visit(equation)
+            if equations_collector_visitor.equations_to_transform:
+                equations_by_line[line_index] = equation
+                changed_variables.update(
+                    _get_expression_sub_trees_by_variable_name([equation])
+                )
+
+        logger.debug(
+            "Evaluating deck incrementally, %d equations changed",
+            len(changed_variables),
+        )
+        return _evaluate_equations(
+            [equations_by_line[i] for i in sorted(equations_by_line)],
+            template.deck_as_string,
+            logger,
+            _IncrementalChanges(
+                template.values, changed_variables, deck_as_string
+            ),
+        )
+
+
+@_dc.dataclass
+class _DeckTemplate:
+    deck_as_string: str
+    lines: list[str]
+    is_equation_line: list[bool]
+    equations_by_line: dict[int, _lark.Tree]
+    values: dict[str, float | int]
+
+
+@_dc.dataclass
+class _IncrementalChanges:
+    previous_values: _cabc.Mapping[str, float | int]
+    changed_variables: _cabc.Set[str]
+    changed_deck_as_string: str
+
+
+@_contextlib.contextmanager
+def _collect_log_records(
+    logger: _logging.Logger,
+) -> _cabc.Iterator[list[_logging.LogRecord]]:
+    collector = _LogRecordCollector()
+    logger.addHandler(collector)
+    try:
+        yield collector.records
+    finally:
+        logger.removeHandler(collector)
+
+
+class _LogRecordCollector(_logging.Handler):
+    """Collects the records logged by the thread which created it."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[_logging.LogRecord] = []
+        self._thread_id = _threading.get_ident()
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        if record.thread == self._thread_id:
+            self.records.append(record)
+
+
+def _evaluate_equations(
+    equations: _cabc.Sequence[_lark.Tree],
+    deck_as_string: str,
+    logger: _logging.Logger,
+    changes: _IncrementalChanges | None = None,
+) -> dict[str, float | int]:
+    """Evaluate the equations in the order of their dependencies.
+
+    With ``changes``, the previous values (keyed by case folded names) are reused for all variables,
+    which are not changed and don't depend on a changed variable.
+    Changed equations were parsed from the changed deck, all others from ``deck_as_string``.
+    """
+    changes = changes or _IncrementalChanges({}, frozenset(), deck_as_string)
+    sub_trees_to_process = _get_expression_sub_trees_by_variable_name(
+        equations
+    )
+    referenced_variables = {
+        var: _get_referenced_variables(tree)
+        for var, tree in sub_trees_to_process.items()
+    }
+    evaluation_order = _get_evaluation_order(referenced_variables)
+
+    evaluated_variables: dict[str, float | int] = {}
+    original_variable_names: list[str] = []
+    unresolved_references: dict[str, list[str]] = {}
+    reevaluated_variables: set[str] = set()
+
+    for var in evaluation_order:
+        missing_variables = [
+            referenced_variable
+            for referenced_variable in referenced_variables[var]
+            if referenced_variable not in evaluated_variables
+        ]
+        if missing_variables:
+            unresolved_references[var] = missing_variables
+            continue
+
+        var_lower = var.casefold()
+        maybe_evaluated_value: float | int | None
+        if (
+            var not in changes.changed_variables
+            and var_lower in changes.previous_values
+            and reevaluated_variables.isdisjoint(referenced_variables[var])
+        ):
+            maybe_evaluated_value = changes.previous_values[var_lower]
+        else:
+            reevaluated_variables.add(var_lower)
+            maybe_evaluated_value = _evaluate_and_log_errors(
+                var,
+                sub_trees_to_process[var],
+                evaluated_variables,
+                (
+                    changes.changed_deck_as_string
+                    if var in changes.changed_variables
+                    else deck_as_string
+                ),
+                logger,
+            )
+        if maybe_evaluated_value is not None:
+            original_variable_names.append(var)
+            evaluated_variables[var_lower] = maybe_evaluated_value
+
+    _log_unevaluated_equations(
+        _get_variables_in_cycles(sub_trees_to_process, evaluation_order),
+        unresolved_references,
+        len(sub_trees_to_process),
+        logger,
+    )
+
+    return _rename_dict_keys_to_original_format(
+        evaluated_variables, original_variable_names
+    )
+
+
+def _get_equation_trees(
+    deck_as_string: str, logger: _logging.Logger
+) -> list[_lark.Tree]:
+    whole_tree = parser.parse_equations(deck_as_string, logger)
     equations_collector_visitor = EquationsCollectorVisitor()
     equations_collector_visitor.visit(whole_tree)
     equations = equations_collector_visitor.equations_to_transform
@@ -254,8 +485,18 @@ def _rename_dict_keys_to_original_format(
     return evaluated_variables
 
 
+def _get_variables_in_cycles(
+    variables: _cabc.Iterable[str], evaluation_order: _cabc.Iterable[str]
+) -> list[str]:
+    """Variables missing in the evaluation order, because they are part of or depend on a cycle."""
+    evaluated_or_failed_variables = set(evaluation_order)
+    return [
+        var for var in variables if var not in evaluated_or_failed_variables
+    ]
+
+
 def _get_expression_sub_trees_by_variable_name(
-    list_of_equation_trees: list[_lark.Tree],
+    list_of_equation_trees: _cabc.Sequence[_lark.Tree],
 ) -> dict[str, _lark.Tree]:
     equations_dict = {}
     for equation_tree in list_of_equation_trees:
@@ -270,6 +511,127 @@ def _get_expression_sub_trees_by_variable_name(
     return equations_dict
 
 
+def _get_referenced_variables(tree: _lark.Tree) -> list[str]:
+    """Case folded names of all variables referenced in the tree, without duplicates."""
+    referenced_variables = {
+        vh.get_child_token_value("NAME", variable_tree, str).casefold(): None
+        for variable_tree in tree.find_data("default_visibility_var")
+    }
+    return list(referenced_variables)
+
+
+def _get_evaluation_order(
+    referenced_variables: _cabc.Mapping[str, _cabc.Sequence[str]],
+) -> list[str]:
+    """Sort the variables topologically, so each equation comes after the equations it references.
+
+    Variables which are part of a cycle, or reference one, are not contained in the result.
+    References to variables without an equation don't restrict the order.
+    """
+    remaining_definitions: dict[str, int] = _collections.Counter(
+        var.casefold() for var in referenced_variables
+    )
+    dependents: dict[str, list[str]] = _collections.defaultdict(list)
+    number_of_dependencies: dict[str, int] = {}
+    for var, references in referenced_variables.items():
+        defined_references = [
+            reference
+            for reference in references
+            if reference in remaining_definitions
+        ]
+        number_of_dependencies[var] = len(defined_references)
+        for reference in defined_references:
+            dependents[reference].append(var)
+
+    ready_variables = _collections.deque(
+        var for var, count in number_of_dependencies.items() if count == 0
+    )
+    evaluation_order = []
+    while ready_variables:
+        var = ready_variables.popleft()
+        evaluation_order.append(var)
+        var_lower = var.casefold()
+        remaining_definitions[var_lower] -= 1
+        if remaining_definitions[var_lower] > 0:
+            continue
+        for dependent in dependents[var_lower]:
+            number_of_dependencies[dependent] -= 1
+            if number_of_dependencies[dependent] == 0:
+                ready_variables.append(dependent)
+
+    return evaluation_order
+
+
+def _evaluate_and_log_errors(
+    var: str,
+    tree: _lark.Tree,
+    evaluated_variables: _cabc.Mapping[str, float | int],
+    deck_as_string: str,
+    logger: _logging.Logger,
+) -> float | int | None:
+    try:
+        return _evaluate_or_none_if_variable_could_not_be_found(
+            tree, evaluated_variables
+        )
+
+    except MathFuncNotFoundError as e:
+        failed_equation = deck_as_string[e.meta.start_pos : e.meta.end_pos]
+        func_name, _ = failed_equation.split("(")
+        logger.warning(
+            "On line %s, %s is not supported in %s=%s",
+            e.meta.line,
+            func_name,
+            var,
+            failed_equation,
+        )
+
+    except _lark.exceptions.VisitError as e:
+        failed_equation = deck_as_string[
+            e.obj.meta.start_pos : e.obj.meta.end_pos  # type: ignore
+        ]
+        logger.error(
+            "On line %s, unable to compute equation %s=%s because: %s",
+            e.obj.meta.line,  # type: ignore
+            var,
+            failed_equation,
+            str(e),
+            exc_info=True,
+        )
+
+    return None
+
+
+def _log_unevaluated_equations(
+    variables_in_cycles: _cabc.Sequence[str],
+    unresolved_references: _cabc.Mapping[str, _cabc.Sequence[str]],
+    number_of_equations: int,
+    logger: _logging.Logger,
+) -> None:
+    """Report all equations which could not be evaluated because of their references in a single message.
+
+    Referencing outputs of types is common, so this is only a warning if there are circular references.
+    """
+    if not variables_in_cycles and not unresolved_references:
+        return
+
+    message = (
+        f"{len(variables_in_cycles) + len(unresolved_references)} of {number_of_equations} "
+        "equations could not be evaluated."
+    )
+    if variables_in_cycles:
+        message += "\nCircular references in or through: " + ", ".join(
+            variables_in_cycles
+        )
+    if unresolved_references:
+        message += "\nUnresolved references: " + ", ".join(
+            f"{var} ({', '.join(references)})"
+            for var, references in unresolved_references.items()
+        )
+    logger.log(
+        _logging.WARNING if variables_in_cycles else _logging.INFO, message
+    )
+
+
 def _evaluate_or_none_if_variable_could_not_be_found(
     tree: _lark.Tree, evaluated_variables: _cabc.Mapping[str, float]
 ):
@@ -1,22 +1,63 @@
+import functools as _ft
+import logging as _logging
 import pkgutil as _pu
+import re as _re
 
 import lark as _lark
 
+from pytrnsys_process import log
+
+_BLOCK_KEYWORD = _re.compile(r"^\s*(constants|equations)\b", _re.IGNORECASE)
+_BLOCK_HEADER = _re.compile(
+    r"^\s*(constants|equations)\s+(?P<count>[1-9][0-9]*|#)\s*(![^\n]*)?$",
+    _re.IGNORECASE,
+)
+_COMMENT_OR_EMPTY_LINE = _re.compile(r"^\s*(\*.*)?$")
+
+
+def _load_grammar(file_name: str) -> str:
+    data = _pu.get_data("pytrnsys_process.deck", file_name)
+    assert data, f"Could not find Lark grammar file {file_name}."
+    return data.decode()
+
 
 def _create_parser() -> _lark.Lark:
-    data = _pu.get_data("pytrnsys_process.deck", "ddck.lark")
-    assert data, "Could not find ddck Lark grammar file."
-    grammar = data.decode()
+    grammar = _load_grammar("ddck.lark")
     parser = _lark.Lark(grammar, parser="earley", propagate_positions=True)
     return parser
 
 
+def _create_equations_parser() -> _lark.Lark:
+    grammar = _load_grammar("equations.lark")
+    # LALR parsers can be serialized, Lark stores them in the temp folder.
+    # This speeds up the start of every further process, e.g. pool workers.
+    parser = _lark.Lark(
+        grammar,
+        parser="lalr",
+        start=["start", "equation"],
+        propagate_positions=True,
+        cache=True,
+    )
+    return parser
+
+
+@_ft.cache
+def _get_parser() -> _lark.Lark:
+    return _create_parser()
+
+
+@_ft.cache
+def _get_equations_parser() -> _lark.Lark:
+    return _create_equations_parser()
+
+
 def parse_dck(ddck_content: str) -> _lark.Tree:
     """
     Parse the provided dck content string and generate a tree structure using the Lark parser.
 
     The function utilizes an internal parser to interpret the given dck_content and produce
     a parsed tree object. It requires the content to be in a format understood by the parser.
+    The parser is only created once per process.
 
     Args:
         ddck_content (str): The string content of the dck file to be parsed.
@@ -27,5 +68,122 @@ def parse_dck(ddck_content: str) -> _lark.Tree:
     Raises:
         Any exceptions raised by the underlying parser.
     """
-    tree = _create_parser().parse(ddck_content)
+    tree = _get_parser().parse(ddck_content)
     return tree
+
+
+def parse_equations(
+    ddck_content: str, logger: _logging.Logger = log.default_console_logger
+) -> _lark.Tree:
+    """
+    Parse only the CONSTANTS and EQUATIONS blocks of the provided dck content string.
+
+    All other lines are blanked out, and the blocks are parsed with an LALR parser,
+    which is much faster than parsing the whole deck with :func:`parse_dck`.
+    Line numbers and positions in the tree still refer to the provided content.
+    If the blocks can't be identified or parsed this way, the whole deck is parsed with :func:`parse_dck`.
+
+    Args:
+        ddck_content (str): The string content of the dck file to be parsed.
+        logger (logging.Logger): Logger to report the fallback to the complete parser.
+
+    Returns:
+        _lark.Tree: A ``ddck`` tree with the same shape as the one of :func:`parse_dck`,
+        only containing the ``constants`` and ``equations`` blocks.
+
+    Raises:
+        Any exceptions raised by the underlying parser.
+    """
+    equation_blocks = _blank_out_all_but_equation_blocks(ddck_content)
+    if equation_blocks is not None:
+        try:
+            return _get_equations_parser().parse(
+                equation_blocks, start="start"
+            )
+        except _lark.exceptions.LarkError as e:
+            logger.debug("Unable to parse equations on their own: %s", e)
+    logger.debug("Parsing the complete deck")
+    return parse_dck(ddck_content)
+
+
+def get_equation_lines(ddck_content: str) -> list[bool] | None:
+    """Tell for every line of the deck, whether it belongs to a CONSTANTS or EQUATIONS block.
+
+    Block headers and equations belong to a block, comment lines inside of blocks don't.
+    Every equation is expected on its own line.
+
+    Returns:
+        list[bool] | None: One flag per line, or None, if the deck doesn't follow this layout.
+    """
+    lines = ddck_content.split("\n")
+    is_equation_line = [False] * len(lines)
+    remaining_equations = 0
+    is_counted_by_hash = False
+    for i, line in enumerate(lines):
+        if _COMMENT_OR_EMPTY_LINE.match(line):
+            continue
+
+        header = _BLOCK_HEADER.match(line)
+        if header:
+            if remaining_equations:
+                return None
+            is_equation_line[i] = True
+            count = header.group("count")
+            is_counted_by_hash = count == "#"
+            remaining_equations = 0 if is_counted_by_hash else int(count)
+            continue
+        if _BLOCK_KEYWORD.match(line):
+            return None
+
+        is_equation = "=" in line.split("!", 1)[0]
+        if remaining_equations:
+            if not is_equation:
+                return None
+            is_equation_line[i] = True
+            remaining_equations -= 1
+        elif is_counted_by_hash and is_equation:
+            is_equation_line[i] = True
+        else:
+            is_counted_by_hash = False
+
+    if remaining_equations:
+        return None
+
+    return is_equation_line
+
+
+def parse_equation_line(
+    line: str, line_index: int, line_start_position: int
+) -> _lark.Tree:
+    """
+    Parse a single line of a deck, containing exactly one equation.
+
+    Args:
+        line (str): The line to parse.
+        line_index (int): Zero based index of the line in the deck.
+        line_start_position (int): Position of the first character of the line in the deck.
+
+    Returns:
+        _lark.Tree: An ``equation`` tree, whose line numbers and positions refer to the deck.
+
+    Raises:
+        Any exceptions raised by the underlying parser.
+    """
+    # Padding the line keeps line numbers and positions the same as when parsing the whole deck.
+    padding = "\n" * line_index + " " * (line_start_position - line_index)
+    return _get_equations_parser().parse(padding + line, start="equation")
+
+
+def _blank_out_all_but_equation_blocks(ddck_content: str) -> str | None:
+    """Replace all lines outside of CONSTANTS and EQUATIONS blocks with spaces, keeping all positions.
+
+    Returns None, if the deck doesn't have one equation per line.
+    """
+    is_equation_line = get_equation_lines(ddck_content)
+    if is_equation_line is None:
+        return None
+
+    return "\n".join(
+        line if keep else " " * len(line)
+        for line, keep in zip(ddck_content.split("\n"), is_equation_line)
+    )
@@ -3,6 +3,8 @@ from pytrnsys_process.log.logger import (
     get_simulation_logger,
     get_main_logger,
     default_console_logger,
+    initialize_worker_logging,
+    WorkerLogListener,
 )
 
 __all__ = [
@@ -10,4 +12,6 @@ __all__ = [
     "get_simulation_logger",
     "get_main_logger",
     "default_console_logger",
+    "initialize_worker_logging",
+    "WorkerLogListener",
 ]
@@ -11,11 +11,20 @@ in each output.
 
 All handlers use the same log record.
 Once the log record is modified and anything removed from it, will not be available in the other handlers.
+
+Worker processes of batch runs don't write any files themselves.
+Their records are sent through a queue to a :class:`WorkerLogListener` in the main process,
+whose single thread writes the main, debug and simulation log files in the order the records arrive.
 """
 
+import collections as _collections
+import copy as _copy
 import logging as _logging
+import multiprocessing as _mp
 import pathlib as _pl
 import sys as _sys
+import threading as _threading
+import typing as _tp
 
 
 class _TracebackInfoFilter(_logging.Filter):
@@ -49,6 +58,14 @@ _default_console_handler.setLevel(_logging.INFO)
 default_console_logger.addHandler(_default_console_handler)
 
 
+# Set in worker processes, whose records are written by the WorkerLogListener of the main process.
+# pylint: disable-next=invalid-name
+_worker_log_queue: _tp.Optional[_mp.SimpleQueue] = None
+
+# Simulation log files kept open by a WorkerLogListener, the others are reopened when needed.
+_MAX_OPEN_SIMULATION_LOG_FILES = 32
+
+
 def get_main_logger(path: _pl.Path) -> _logging.Logger:
     main_logger = _logging.getLogger("main_logger")
 
@@ -56,6 +73,11 @@ def get_main_logger(path: _pl.Path) -> _logging.Logger:
     if main_logger.handlers:
         return main_logger
 
+    if _worker_log_queue is not None:
+        main_logger.addHandler(_WorkerQueueHandler(_worker_log_queue))
+        main_logger.setLevel(_logging.DEBUG)
+        return main_logger
+
     console_handler = _logging.StreamHandler(_sys.stdout)
     console_handler.setLevel(_logging.INFO)
 
@@ -124,8 +146,188 @@ def get_simulation_logger(simulation_path: _pl.Path) -> _logging.Logger:
     if sim_logger.handlers:
         return sim_logger
 
+    if _worker_log_queue is not None:
+        sim_handler: _logging.Handler = _WorkerQueueHandler(
+            _worker_log_queue, simulation_path
+        )
+        sim_handler.setLevel(_logging.INFO)
+    else:
+        sim_handler = _get_simulation_file_handler(simulation_path, mode="w")
+
+    sim_logger.addHandler(sim_handler)
+
+    sim_logger.setLevel(_logging.INFO)
+
+    return sim_logger
+
+
+def initialize_worker_logging(log_queue: _mp.SimpleQueue) -> None:
+    """Send the records of the main and simulation loggers of this worker process to a queue.
+
+    Used as initializer of worker processes, with the queue of a running :class:`WorkerLogListener`.
+
+    Parameters
+    __________
+        log_queue:
+            Queue of the :class:`WorkerLogListener` of the main process
+    """
+    global _worker_log_queue  # pylint: disable=global-statement
+    _worker_log_queue = log_queue
+    # Forked workers inherit the file handlers of the loggers already created in the main process.
+    for name, logger in list(_logging.root.manager.loggerDict.items()):
+        if isinstance(logger, _logging.Logger) and (
+            name == "main_logger" or name.startswith("simulation_logger.")
+        ):
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+
+
+class _StopListening:
+    """Put into the queue to stop a :class:`WorkerLogListener`.
+
+    It is recognized by its type, as it is pickled on its way through the queue.
+    """
+
+
+class WorkerLogListener:
+    """Writes the log records sent by worker processes, using one thread in the main process.
+
+    Records of simulation loggers are written to the log file of their simulation,
+    all others are handled by the logger of the same name in the main process.
+    The queue is written to directly by the workers, without a feeder thread,
+    so all records of a simulation have arrived once its result has been received.
+
+    Example
+    _______
+        >>> from concurrent import futures
+        >>> from pytrnsys_process import log
+        ...
+        >>> with log.WorkerLogListener() as listener, futures.ProcessPoolExecutor(
+        ...     initializer=log.initialize_worker_logging, initargs=(listener.queue,)
+        ... ) as executor:
+        ...     pass
+    """
+
+    def __init__(self):
+        self.queue: _mp.SimpleQueue = _mp.SimpleQueue()
+        self._router = _WorkerRecordRouter()
+        self._thread: _tp.Optional[_threading.Thread] = None
+
+    def start(self) -> None:
+        """Start writing the records in a background thread."""
+        self._thread = _threading.Thread(
+            target=self._write_records, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write all records sent so far and close the simulation log files."""
+        if self._thread is not None:
+            # Records sent before are written first, as the queue keeps their order.
+            self.queue.put(_StopListening())
+            self._thread.join()
+            self._thread = None
+        self._router.close()
+
+    def _write_records(self) -> None:
+        while True:
+            # Blocks until the next record, the thread only ends with the stop marker.
+            record = self.queue.get()
+            if isinstance(record, _StopListening):
+                return
+            self._router.handle(record)
+
+    def __enter__(self) -> "WorkerLogListener":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class _WorkerQueueHandler(_logging.Handler):
+    def __init__(
+        self,
+        log_queue: _mp.SimpleQueue,
+        simulation_path: _tp.Optional[_pl.Path] = None,
+    ):
+        super().__init__()
+        self.queue = log_queue
+        self.simulation_path = simulation_path
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            self.queue.put(self.prepare(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def prepare(self, record: _logging.LogRecord) -> _logging.LogRecord:
+        # Unlike logging.handlers.QueueHandler, the traceback is kept apart from the message,
+        # so the handlers of the main process can still decide whether to show it.
+        record = _copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        if self.simulation_path is not None:
+            record.simulation_path = self.simulation_path
+        return record
+
+
+class _WorkerRecordRouter(_logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self._simulation_handlers: _collections.OrderedDict[
+            _pl.Path, _logging.FileHandler
+        ] = _collections.OrderedDict()
+        self._started_simulation_logs: set[_pl.Path] = set()
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        simulation_path = getattr(record, "simulation_path", None)
+        if simulation_path is None:
+            _logging.getLogger(record.name).handle(record)
+        else:
+            self._get_simulation_handler(simulation_path).handle(record)
+
+    def _get_simulation_handler(
+        self, simulation_path: _pl.Path
+    ) -> _logging.FileHandler:
+        if simulation_path in self._simulation_handlers:
+            self._simulation_handlers.move_to_end(simulation_path)
+            return self._simulation_handlers[simulation_path]
+
+        if len(self._simulation_handlers) >= _MAX_OPEN_SIMULATION_LOG_FILES:
+            _, oldest_handler = self._simulation_handlers.popitem(last=False)
+            oldest_handler.close()
+        # Each run starts with an empty log file, like for simulations processed in the main process.
+        handler = _get_simulation_file_handler(
+            simulation_path,
+            mode=(
+                "a"
+                if simulation_path in self._started_simulation_logs
+                else "w"
+            ),
+        )
+        self._started_simulation_logs.add(simulation_path)
+        self._simulation_handlers[simulation_path] = handler
+        return handler
+
+    def close(self) -> None:
+        for handler in self._simulation_handlers.values():
+            handler.close()
+        self._simulation_handlers.clear()
+        self._started_simulation_logs.clear()
+        super().close()
+
+
+def _get_simulation_file_handler(
+    simulation_path: _pl.Path, mode: str
+) -> _logging.FileHandler:
     log_file = simulation_path / "processing.log"
-    sim_file_handler = _logging.FileHandler(log_file, mode="w")
+    sim_file_handler = _logging.FileHandler(log_file, mode=mode)
     sim_file_handler.setLevel(_logging.INFO)
 
     # Use same format as main logger but without name since it's simulation specific
@@ -134,8 +336,4 @@ def get_simulation_logger(simulation_path: _pl.Path) -> _logging.Logger:
     )
     sim_file_handler.setFormatter(sim_format)
 
-    sim_logger.addHandler(sim_file_handler)
-
-    sim_logger.setLevel(_logging.INFO)
-
-    return sim_logger
+    return sim_file_handler
@@ -368,9 +368,12 @@ def energy_balance_with_lines(
 
     if q_imb_column is None:
         q_imb_column = "Qimb"
-        df_modified[q_imb_column] = df_modified[
-            q_in_columns + q_out_columns
-        ].sum(axis=1)
+        # Accumulated in float64, also if the data is stored as float32.
+        df_modified[q_imb_column] = (
+            df_modified[q_in_columns + q_out_columns]
+            .astype("float64")
+            .sum(axis=1)
+        )
 
     # imbalance is visually added where it is missing.
     df_modified[q_imb_column] *= -1
@@ -3,8 +3,11 @@ from pytrnsys_process.process.data_structures import (
     SimulationsData,
 )
 from pytrnsys_process.process.file_type_detector import (
+    ReaderPlan,
     get_file_type_using_file_content,
     get_file_type_using_file_name,
+    get_reader_plan,
+    get_reader_plan_using_file_content,
     has_pattern,
 )
 
@@ -12,17 +15,24 @@ from pytrnsys_process.process.process_batch import (
     process_single_simulation,
     process_whole_result_set,
     process_whole_result_set_parallel,
+    iterate_whole_result_set,
     do_comparison,
 )
+from pytrnsys_process.process.worker_pool import WorkerPool
 
 __all__ = [
     "Simulation",
     "SimulationsData",
     "get_file_type_using_file_content",
     "get_file_type_using_file_name",
+    "get_reader_plan",
+    "get_reader_plan_using_file_content",
+    "ReaderPlan",
     "has_pattern",
     "process_single_simulation",
     "process_whole_result_set",
     "process_whole_result_set_parallel",
+    "iterate_whole_result_set",
     "do_comparison",
+    "WorkerPool",
 ]
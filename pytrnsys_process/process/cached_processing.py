@@ -0,0 +1,228 @@
+"""
+Loading the simulations of a batch, from their caches where possible.
+
+A simulation is loaded from the first of these sources which is usable:
+
+- its columnar cache, if its input files didn't change since it was written,
+- the pickle file written by earlier versions,
+- its raw input files, which are cached afterwards, unless only part of the data is requested.
+
+With lazy loading, the time series of cached simulations are only loaded when they are accessed.
+"""
+
+import dataclasses as _dc
+import logging as _logging
+import pathlib as _pl
+import typing as _tp
+from collections import abc as _abc
+
+from pytrnsys_process import config as conf
+from pytrnsys_process import util
+from pytrnsys_process.process import data_structures as ds
+from pytrnsys_process.process import process_sim as ps
+from pytrnsys_process.process import timing
+from pytrnsys_process.util import simulation_cache as sc
+
+
+@_dc.dataclass(frozen=True)
+class ProcessingOptions:
+    """Options for processing the simulations of a batch, which are sent to the worker processes.
+
+    Attributes
+    __________
+        keep_time_series: bool
+            If False, only the scalar values of the simulations are kept after the scenarios ran
+
+        columns_to_read: list of str, optional
+            Data columns to read from the printer files,
+            overriding ``global_settings.reader.performance.columns_to_read``
+
+        time_window: tuple of (timestamp, timestamp), optional
+            First and last timestamp of the step data to read
+    """
+
+    keep_time_series: bool = True
+    columns_to_read: _tp.Optional[_abc.Sequence[str]] = None
+    time_window: _tp.Optional[sc.TimeWindow] = None
+
+
+def load_simulation(
+    sim_folder: _pl.Path,
+    options: ProcessingOptions,
+    sim_logger: _logging.Logger,
+) -> ds.Simulation:
+    """Load the simulation in the folder from the first usable source, see the module documentation."""
+    force_reread_prt = conf.global_settings.reader.force_reread_prt
+    columns_to_read = options.columns_to_read
+    if columns_to_read is None:
+        columns_to_read = (
+            conf.global_settings.reader.performance.columns_to_read
+        )
+    time_window = options.time_window
+    sim_cache_folder = (
+        sim_folder / conf.FileNames.SIMULATION_CACHE_FOLDER.value
+    )
+    sim_pickle_file = sim_folder / conf.FileNames.SIMULATION_PICKLE_FILE.value
+    with timing.stage("get_files"):
+        sim_files = util.get_files([sim_folder])
+    with timing.stage("check_cache"):
+        is_cache_up_to_date = not force_reread_prt and _is_cache_up_to_date(
+            sim_folder, sim_files, sim_cache_folder, sim_logger
+        )
+
+    if is_cache_up_to_date:
+        sim_logger.info("Loading simulation from cache")
+        if (
+            conf.global_settings.reader.lazy_loading
+            and columns_to_read is None
+            and time_window is None
+        ):
+            return util.LazySimulation(sim_folder.as_posix(), sim_cache_folder)
+        with timing.stage("load_cache", read_path=sim_cache_folder):
+            return util.load_simulation_from_cache(
+                sim_cache_folder,
+                _get_cached_columns_to_read(sim_cache_folder, columns_to_read),
+                logger=sim_logger,
+                time_window=time_window,
+            )
+
+    if (
+        not sim_cache_folder.is_dir()
+        and not force_reread_prt
+        and columns_to_read is None
+        and time_window is None
+        and _is_newer_than_files(sim_pickle_file, sim_files)
+    ):
+        # Simulations processed by earlier versions are only available as pickle.
+        # The pickle holds all data, so it is not used when only part of it is requested.
+        sim_logger.info("Loading simulation from pickle file")
+        with timing.stage("load_pickle", read_path=sim_pickle_file):
+            return util.load_simulation_from_pickle(
+                sim_pickle_file, sim_logger
+            )
+
+    if columns_to_read is not None or time_window is not None:
+        # Only part of the data is read, which must not end up in the caches.
+        sim_logger.info(
+            "Processing simulation from raw files, reading only the requested data"
+        )
+        return ps.process_sim(
+            sim_files,
+            sim_folder,
+            columns_to_read=columns_to_read,
+            time_window=time_window,
+        )
+
+    sim_logger.info("Processing simulation from raw files")
+    return _read_and_cache_simulation(
+        sim_folder, sim_files, sim_cache_folder, sim_logger
+    )
+
+
+def evict_lazy_simulations(simulations_data: ds.SimulationsData) -> None:
+    """Release the unmodified data loaded by a comparison step, so only one step at a time holds it in memory."""
+    for simulation in simulations_data.simulations.values():
+        if isinstance(simulation, util.LazySimulation):
+            simulation.evict()
+
+
+def relocate_lazy_simulations(
+    simulations_data: ds.SimulationsData, results_folder: _pl.Path
+) -> None:
+    """Point the lazy simulations to their caches in the results folder, after it was moved."""
+    for sim_name, simulation in simulations_data.simulations.items():
+        if isinstance(simulation, util.LazySimulation):
+            simulation.cache_folder = (
+                results_folder
+                / sim_name
+                / conf.FileNames.SIMULATION_CACHE_FOLDER.value
+            )
+
+
+def _read_and_cache_simulation(
+    sim_folder: _pl.Path,
+    sim_files: _abc.Sequence[_pl.Path],
+    sim_cache_folder: _pl.Path,
+    sim_logger: _logging.Logger,
+) -> ds.Simulation:
+    force_reread_prt = conf.global_settings.reader.force_reread_prt
+    with timing.stage("create_manifest"):
+        manifest = util.create_manifest(
+            sim_folder,
+            sim_files,
+            conf.global_settings.reader.hash_input_files,
+        )
+    file_cache = util.FileCache(
+        sim_folder,
+        sim_folder / conf.FileNames.FILE_CACHE_FOLDER.value,
+        manifest,
+        reuse=not force_reread_prt,
+        logger=sim_logger,
+    )
+    simulation = ps.process_sim(sim_files, sim_folder, file_cache)
+    if not sim_files:
+        return simulation
+
+    with timing.stage("save_cache"):
+        util.save_simulation_to_cache(simulation, sim_cache_folder, sim_logger)
+        util.save_manifest(manifest, sim_cache_folder, sim_logger)
+    if conf.global_settings.reader.lazy_loading:
+        return util.LazySimulation.from_simulation(
+            simulation, sim_cache_folder
+        )
+    return simulation
+
+
+def _get_cached_columns_to_read(
+    sim_cache_folder: _pl.Path,
+    columns_to_read: _tp.Optional[_abc.Collection[str]],
+) -> _tp.Optional[dict[str, list[str]]]:
+    """Columns to load per time series resolution, like reading them from the raw files.
+
+    Requested columns that are not in a resolution are skipped there, instead of failing.
+    """
+    if columns_to_read is None:
+        return None
+    requested_columns = set(columns_to_read)
+    return {
+        resolution: [
+            column
+            for column in util.get_cached_columns(sim_cache_folder, resolution)
+            if column in requested_columns
+        ]
+        for resolution in sc.TIME_SERIES_RESOLUTIONS
+    }
+
+
+def _is_cache_up_to_date(
+    sim_folder: _pl.Path,
+    sim_files: _abc.Sequence[_pl.Path],
+    sim_cache_folder: _pl.Path,
+    sim_logger: _logging.Logger,
+) -> bool:
+    if not sim_cache_folder.is_dir():
+        return False
+    manifest = util.load_manifest(sim_cache_folder)
+    if manifest is None:
+        sim_logger.info("No manifest found in cache")
+        return False
+    changed_files = util.get_changed_files(sim_folder, sim_files, manifest)
+    if changed_files:
+        sim_logger.info(
+            "Input files changed since caching: %s", ", ".join(changed_files)
+        )
+        return False
+    dtype = conf.global_settings.reader.performance.dtype
+    if not util.has_float_dtype(sim_cache_folder, dtype):
+        sim_logger.info("Cache was not stored as %s", dtype or "float64")
+        return False
+    return True
+
+
+def _is_newer_than_files(
+    file_path: _pl.Path, files: _abc.Sequence[_pl.Path]
+) -> bool:
+    if not file_path.exists():
+        return False
+    modification_time = file_path.stat().st_mtime_ns
+    return all(modification_time > f.stat().st_mtime_ns for f in files)
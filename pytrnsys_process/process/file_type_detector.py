@@ -1,18 +1,50 @@
-import datetime as _dt
+import dataclasses as _dc
 import logging as _logging
 import pathlib as _pl
 import re as _re
 
+import pandas as _pd
+
 from pytrnsys_process import config as conf
 from pytrnsys_process import log
 from pytrnsys_process import read
 
 
-def get_file_type_using_file_content(
+@_dc.dataclass(frozen=True)
+class ReaderPlan:
+    """File type of a printer file together with how it has to be read.
+
+    Determined once per file, so the file only has to be parsed a single time.
+
+    Attributes
+    __________
+    file_type: :class:`pytrnsys_process.constants.FileType`
+        The detected file type
+
+    header: int
+        Row number containing the column names
+
+    skipfooter: int
+        Number of lines at the end of the file that do not contain data
+    """
+
+    file_type: conf.FileType
+    header: int = read.PrtReader.HEADER
+    skipfooter: int = read.PrtReader.SKIPFOOTER
+
+
+_MONTHLY_PLAN = ReaderPlan(conf.FileType.MONTHLY)
+_HOURLY_PLAN = ReaderPlan(conf.FileType.HOURLY)
+_TIMESTEP_PLAN = ReaderPlan(conf.FileType.TIMESTEP, header=1, skipfooter=23)
+_HYDRAULIC_PLAN = ReaderPlan(conf.FileType.HYDRAULIC, header=0, skipfooter=0)
+_NUMBER_OF_ROWS_TO_SNIFF = 2
+
+
+def get_reader_plan(
     file_path: _pl.Path, logger: _logging.Logger = log.default_console_logger
-) -> conf.FileType:
+) -> ReaderPlan:
     """
-    Determine the file type by analyzing its content.
+    Determine how to read a file, using its name and if needed its first lines.
 
     Parameters
     __________
@@ -21,68 +53,136 @@ def get_file_type_using_file_content(
 
     Returns
     _______
-        FileType: :class:`pytrnsys_process.constants.FileType`
-            The detected file type (MONTHLY, HOURLY, or TIMESTEP)
+        ReaderPlan: :class:`pytrnsys_process.process.file_type_detector.ReaderPlan`
+            The detected file type and the header and footer to use when reading it
 
     Raises
     ______
-        ValueError: If the file type cannot be determined from the content
+        ValueError: If the file type cannot be determined
     """
-    reader = read.PrtReader()
+    try:
+        file_type = get_file_type_using_file_name(file_path, logger)
+    except ValueError:
+        return get_reader_plan_using_file_content(file_path, logger)
+
+    if file_type == conf.FileType.TIMESTEP:
+        # There are two ways to have a step file:
+        # - using type 25
+        # - using type 46
+        # The user can copy and paste both, and they would like to use '_step.prt'.
+        # Only the type 25 printer has a label line above the column names.
+        if _has_time_column(file_path, _TIMESTEP_PLAN):
+            return _TIMESTEP_PLAN
+        return _HYDRAULIC_PLAN
+
+    return _get_default_reader_plan(file_type)
 
+
+def get_reader_plan_using_file_content(
+    file_path: _pl.Path, logger: _logging.Logger = log.default_console_logger
+) -> ReaderPlan:
+    """
+    Determine the file type and how to read it by analyzing the first lines of its content.
+
+    Only the column names and the first data rows are parsed.
+
+    Parameters
+    __________
+        file_path: :class:`pathlib.Path`
+            Path to the file to analyze
+
+    Returns
+    _______
+        ReaderPlan: :class:`pytrnsys_process.process.file_type_detector.ReaderPlan`
+            The detected file type and the header and footer to use when reading it
+
+    Raises
+    ______
+        ValueError: If the file type cannot be determined from the content
+    """
     try:
-        # First try reading as regular file to check if it's monthly or hourly
-        monthly_or_hourly_df = reader.read(file_path)
-        if monthly_or_hourly_df.columns[0] == "Month":
+        # First check the column names to see if it's monthly or hourly
+        first_column = _read_first_rows(
+            file_path, _MONTHLY_PLAN.header
+        ).columns[0]
+        if first_column == "Month":
             logger.info("Detected %s as monthly file", file_path)
-            return conf.FileType.MONTHLY
-        if monthly_or_hourly_df.columns[0] == "Period":
+            return _MONTHLY_PLAN
+        if first_column == "Period":
             logger.info("Detected %s as hourly file", file_path)
-            return conf.FileType.HOURLY
-        try:
-            # Try reading as hydraulic file
-            return _try_read_as_step(
-                file_path,
-                logger,
-                conf.FileType.HYDRAULIC,
-                skipfooter=0,
-                header=0,
-            )
-        except Exception:  # pylint: disable=broad-exception-caught
-            # try reading as a step file
-            return _try_read_as_step(
-                file_path,
-                logger,
-                conf.FileType.TIMESTEP,
-                skipfooter=23,
-                header=1,
-            )
+            return _HOURLY_PLAN
+        for plan in [_HYDRAULIC_PLAN, _TIMESTEP_PLAN]:
+            if _is_step_file(file_path, plan):
+                logger.info(
+                    "Detected %s as a %s", file_path, plan.file_type.name
+                )
+                return plan
     except Exception as e:
         logger.error("Error reading file %s: %s", file_path, str(e))
         raise ValueError(f"Failed to read file {file_path}: {str(e)}") from e
 
-    # If we get here, file type could not be determined
     raise ValueError(
         f"Could not determine file type from content of {file_path}"
     )
 
 
-def _try_read_as_step(
-    file_path, logger, expected_file_type, skipfooter, header
-):
-    reader = read.PrtReader()
-    step_df = reader.read(file_path, skipfooter=skipfooter, header=header)
-    if step_df.columns[0] in ["Period", "TIME"]:
-        step_df = reader.read_step(
-            file_path, skipfooter=skipfooter, header=header
-        )
-        time_interval = step_df.index[1] - step_df.index[0]
-        if time_interval < _dt.timedelta(hours=1):
-            logger.info(
-                "Detected %s as a %s", file_path, expected_file_type.name
-            )
-            return expected_file_type
-    raise ValueError(f"Unable to read as {expected_file_type.name}")
+def get_file_type_using_file_content(
+    file_path: _pl.Path, logger: _logging.Logger = log.default_console_logger
+) -> conf.FileType:
+    """
+    Determine the file type by analyzing its content.
+
+    Parameters
+    __________
+        file_path: :class:`pathlib.Path`
+            Path to the file to analyze
+
+    Returns
+    _______
+        FileType: :class:`pytrnsys_process.constants.FileType`
+            The detected file type (MONTHLY, HOURLY, or TIMESTEP)
+
+    Raises
+    ______
+        ValueError: If the file type cannot be determined from the content
+    """
+    return get_reader_plan_using_file_content(file_path, logger).file_type
+
+
+def _read_first_rows(file_path: _pl.Path, header: int) -> _pd.DataFrame:
+    return _pd.read_csv(
+        file_path,
+        header=header,
+        nrows=_NUMBER_OF_ROWS_TO_SNIFF,
+        delimiter=read.PrtReader.DELIMITER,
+    )
+
+
+def _is_step_file(file_path: _pl.Path, plan: ReaderPlan) -> bool:
+    """Check if the first two time values are less than an hour apart."""
+    try:
+        first_rows = _read_first_rows(file_path, plan.header)
+        if first_rows.columns[0] not in ["Period", "TIME"]:
+            return False
+        time_interval = first_rows["TIME"].iloc[1] - first_rows["TIME"].iloc[0]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return False
+    return time_interval < 1
+
+
+def _has_time_column(file_path: _pl.Path, plan: ReaderPlan) -> bool:
+    try:
+        return "TIME" in _read_first_rows(file_path, plan.header).columns
+    except ValueError:
+        return False
+
+
+def _get_default_reader_plan(file_type: conf.FileType) -> ReaderPlan:
+    if file_type == conf.FileType.TIMESTEP:
+        return _TIMESTEP_PLAN
+    if file_type == conf.FileType.HYDRAULIC:
+        return _HYDRAULIC_PLAN
+    return ReaderPlan(file_type)
 
 
 def get_file_type_using_file_name(
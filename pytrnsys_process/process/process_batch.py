@@ -1,3 +1,4 @@
+import dataclasses as _dc
 import logging as _logging
 import pathlib as _pl
 import time as _time
@@ -10,15 +11,47 @@ import pandas as _pd
 
 from pytrnsys_process import config as conf
 from pytrnsys_process import log, util
+from pytrnsys_process.process import cached_processing as cp
 from pytrnsys_process.process import data_structures as ds
-from pytrnsys_process.process import process_sim as ps
+from pytrnsys_process.process import scheduler as sched
+from pytrnsys_process.process import timing
+from pytrnsys_process.process import worker_pool as wp
+from pytrnsys_process.util import simulation_cache as sc
 
 
 class UnableToProcessSimulationError(Exception):
     """Raised when a simulation cannot be processed."""
 
 
-# pylint: disable=too-many-locals
+@_dc.dataclass(frozen=True)
+class _Execution:
+    """How the simulations of a batch are run.
+
+    Attributes
+    __________
+        parallel: bool
+            Whether to process the simulations in parallel
+
+        max_workers: int, optional
+            Maximum number of worker processes for parallel execution
+
+        worker_pool: WorkerPool, optional
+            Running pool to process the simulations in, implies parallel execution and ignores max_workers
+
+        max_memory: int, optional
+            Maximum total input size in bytes of the simulations processed in parallel at the same time
+    """
+
+    parallel: bool = False
+    max_workers: int | None = None
+    worker_pool: _tp.Optional[wp.WorkerPool] = None
+    max_memory: int | None = None
+
+    @property
+    def is_parallel(self) -> bool:
+        return self.parallel or self.worker_pool is not None
+
+
 def _process_batch(
     sim_folders: list[_pl.Path],
     processing_scenario: _tp.Union[
@@ -26,14 +59,44 @@ def _process_batch(
         _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
     ],
     results_folder: _pl.Path,
-    parallel: bool = False,
-    max_workers: int | None = None,
+    execution: _Execution = _Execution(),
+    options: cp.ProcessingOptions = cp.ProcessingOptions(),
 ) -> ds.SimulationsData:
+    """Collect the results of :func:`_iterate_batch` into a SimulationsData object.
+
+    Note:
+    _____
+        This is an internal function that should not be called directly.
+        Use process_single_simulation, process_whole_result_set, or
+        process_whole_result_set_parallel instead.
+    """
+    simulations_data = ds.SimulationsData(
+        path_to_simulations=results_folder.as_posix()
+    )
+    for sim_name, simulation, _ in _iterate_batch(
+        sim_folders, processing_scenario, results_folder, execution, options
+    ):
+        simulations_data.simulations[sim_name] = simulation
+
+    return _concat_scalar(simulations_data)
+
+
+# pylint: disable-next=too-many-locals
+def _iterate_batch(
+    sim_folders: list[_pl.Path],
+    processing_scenario: _tp.Union[
+        _abc.Callable[[ds.Simulation], None],
+        _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
+    ],
+    results_folder: _pl.Path,
+    execution: _Execution = _Execution(),
+    options: cp.ProcessingOptions = cp.ProcessingOptions(),
+) -> _abc.Iterator[tuple[str, ds.Simulation, list[str]]]:
     """Common processing logic for both sequential and parallel batch processing.
 
     This internal function implements the core processing logic used by both sequential
     and parallel processing modes. It handles the setup of processing infrastructure,
-    execution of processing tasks, and collection of results.
+    execution of processing tasks, and yields the results as the simulations finish.
 
     Parameters
     __________
@@ -46,103 +109,160 @@ def _process_batch(
         results_folder:
             Root folder containing all simulations
 
-        parallel:
-            Whether to process simulations in parallel
-
-        max_workers:
-            Maximum number of worker processes for parallel execution
+        execution:
+            How to run the simulations, sequentially or in parallel
 
+        options:
+            Options for processing each simulation
 
     Returns
     _______
-        SimulationsData containing the processed simulation results and metadata
+        Iterator of (simulation name, simulation, failed scenarios), in the order of completion
 
     Note:
     _____
         This is an internal function that should not be called directly.
-        Use process_single_simulation, process_whole_result_set, or
-        process_whole_result_set_parallel instead.
+        Use process_single_simulation, process_whole_result_set,
+        process_whole_result_set_parallel or iterate_whole_result_set instead.
 
 
     """
     start_time = _time.time()
     results = ds.ProcessingResults()
-    simulations_data = ds.SimulationsData(
-        path_to_simulations=results_folder.as_posix()
-    )
 
     main_logger = log.get_main_logger(results_folder)
 
-    if parallel:
-        with _futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            tasks = {}
-            for sim_folder in sim_folders:
-                main_logger.info(
-                    "Submitting simulation folder for processing: %s",
-                    sim_folder.name,
-                )
-                tasks[
-                    executor.submit(
-                        _process_simulation,
+    if execution.worker_pool:
+        main_logger.info(
+            "Using the running pool of %d worker processes",
+            execution.worker_pool.max_workers,
+        )
+    durations: dict[str, float] = {}
+    # Consumers may stop iterating early, what was measured until then is still recorded.
+    try:
+        if execution.is_parallel:
+            with wp.get_executor(
+                execution.max_workers, execution.worker_pool
+            ) as executor:
+
+                def submit(sim_folder: _pl.Path) -> _futures.Future:
+                    main_logger.info(
+                        "Submitting simulation folder for processing: %s",
+                        sim_folder.name,
+                    )
+                    return executor.submit(
+                        _process_simulation_in_worker,
                         sim_folder,
                         processing_scenario,
-                        conf.global_settings.reader.force_reread_prt,
+                        conf.global_settings,
+                        options,
                     )
-                ] = sim_folder
 
-            for future in _futures.as_completed(tasks):
+                for sim_folder, future in sched.iterate_completed(
+                    sched.estimate_costs(
+                        sim_folders, sched.load_durations(results_folder)
+                    ),
+                    submit,
+                    execution.max_memory,
+                ):
+                    try:
+                        processed_simulation, duration = _take_worker_result(
+                            future, sim_folder, main_logger
+                        )
+                        result = _handle_simulation_result(
+                            processed_simulation, results
+                        )
+                    except Exception as e:  # pylint: disable=broad-except
+                        _handle_simulation_error(
+                            e, sim_folder, results, main_logger
+                        )
+                    else:
+                        durations[sim_folder.name] = duration
+                        yield result
+        else:
+            for sim_folder in sim_folders:
                 try:
-                    _handle_simulation_result(
-                        future.result(), results, simulations_data
+                    main_logger.info(
+                        "Processing simulation: %s", sim_folder.name
+                    )
+                    with timing.record_stages(sim_folder.name) as sim_timings:
+                        processed_simulation = _process_simulation(
+                            sim_folder, processing_scenario, options
+                        )
+                    timing.save_report(sim_folder, sim_timings, main_logger)
+                    util.convert_pending_svgs_to_emf(
+                        main_logger, only_if_batch_is_full=True
+                    )
+                    result = _handle_simulation_result(
+                        processed_simulation, results
                     )
                 except Exception as e:  # pylint: disable=broad-except
                     _handle_simulation_error(
-                        e, tasks[future], results, main_logger
+                        e, sim_folder, results, main_logger
                     )
-    else:
-        for sim_folder in sim_folders:
-            try:
-                main_logger.info("Processing simulation: %s", sim_folder.name)
-                result = _process_simulation(sim_folder, processing_scenario)
-                _handle_simulation_result(result, results, simulations_data)
-            except Exception as e:  # pylint: disable=broad-except
-                _handle_simulation_error(e, sim_folder, results, main_logger)
-
-    simulations_data = _concat_scalar(simulations_data)
-    _log_processing_results(results, main_logger)
-
-    end_time = _time.time()
-    execution_time = end_time - start_time
-    main_logger.info(
-        "%s execution time: %.2f seconds",
-        "Parallel" if parallel else "Total",
-        execution_time,
-    )
+                else:
+                    yield result
+    finally:
+        util.convert_pending_svgs_to_emf(main_logger)
+        # There is nothing to schedule for a single simulation, whose parent might not be a results folder.
+        if execution.is_parallel and len(sim_folders) > 1:
+            sched.save_durations(results_folder, durations, main_logger)
+        _log_processing_results(results, main_logger)
+
+        main_logger.info(
+            "%s execution time: %.2f seconds",
+            "Parallel" if execution.is_parallel else "Total",
+            _time.time() - start_time,
+        )
 
-    return simulations_data
+
+def _take_worker_result(
+    future: _futures.Future,
+    sim_folder: _pl.Path,
+    main_logger: _logging.Logger,
+) -> tuple[tuple[ds.Simulation, list[str]], float]:
+    """Record the timings and plots of a simulation processed by a worker.
+
+    Returns
+    _______
+        Tuple of ((simulation, failed scenarios), duration in seconds)
+    """
+    (
+        simulation,
+        failed_scenarios,
+        duration,
+        sim_timings,
+        emf_conversions,
+    ) = future.result()
+    timing.save_report(sim_folder, sim_timings, main_logger)
+    for file_no_suffix, shall_remove_svg in emf_conversions:
+        util.queue_svg_to_emf_conversion(file_no_suffix, shall_remove_svg)
+    # Inkscape is only started once enough plots are waiting, not per simulation.
+    util.convert_pending_svgs_to_emf(main_logger, only_if_batch_is_full=True)
+    return (simulation, failed_scenarios), duration
 
 
 def _handle_simulation_result(
     result: tuple[ds.Simulation, list[str]],
     results: ds.ProcessingResults,
-    simulations_data: ds.SimulationsData,
-) -> None:
+) -> tuple[str, ds.Simulation, list[str]]:
     """Handle the result of a processed simulation.
 
     Parameters
     __________
         result: Tuple of (simulation, failed_scenarios)
-        sim_folder: Path to the simulation folder
         results: ProcessingResults to update
-        simulations_data: SimulationsData to update
+
+    Returns
+    _______
+        Tuple of (simulation name, simulation, failed_scenarios)
     """
     simulation, failed_scenarios = result
+    sim_name = _pl.Path(simulation.path).name
     results.processed_count += 1
-    simulations_data.simulations[_pl.Path(simulation.path).name] = simulation
     if failed_scenarios:
-        results.failed_scenarios[_pl.Path(simulation.path).name] = (
-            failed_scenarios
-        )
+        results.failed_scenarios[sim_name] = failed_scenarios
+    return sim_name, simulation, failed_scenarios
 
 
 def _handle_simulation_error(
@@ -175,6 +295,8 @@ def process_single_simulation(
         _abc.Callable[[ds.Simulation], None],
         _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
     ],
+    worker_pool: _tp.Optional[wp.WorkerPool] = None,
+    time_window: _tp.Optional[sc.TimeWindow] = None,
 ) -> ds.Simulation:
     """Process a single simulation folder using the provided processing step/scenario.
 
@@ -187,6 +309,15 @@ def process_single_simulation(
             They should contain the processing logic for a simulation.
             Each callable should take a Simulation object as its only parameter and modify it in place.
 
+        worker_pool: WorkerPool, optional
+            Running :class:`pytrnsys_process.api.WorkerPool` to process the simulation in.
+
+        time_window: tuple of (timestamp, timestamp), optional
+            First and last timestamp of the step data to read, both included, e.g. ``("2024-07-01", "2024-07-14")``.
+            The step rows outside of it are skipped without parsing them, or filtered when loading the cache.
+            The monthly and hourly data are read completely.
+            If the simulation is read from the raw files, it is not cached.
+
     Returns
     _______
         Simulation: :class:`pytrnsys_process.api.Simulation`
@@ -209,7 +340,11 @@ def process_single_simulation(
     main_logger.info("Starting processing of simulation %s", sim_folder)
     sim_folders = [sim_folder]
     simulations_data = _process_batch(
-        sim_folders, processing_scenario, sim_folder.parent
+        sim_folders,
+        processing_scenario,
+        sim_folder.parent,
+        _Execution(worker_pool=worker_pool),
+        cp.ProcessingOptions(time_window=time_window),
     )
     try:
         return simulations_data.simulations[sim_folder.name]
@@ -225,6 +360,8 @@ def process_whole_result_set(
         _abc.Callable[[ds.Simulation], None],
         _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
     ],
+    worker_pool: _tp.Optional[wp.WorkerPool] = None,
+    columns_to_read: _tp.Optional[_abc.Sequence[str]] = None,
 ) -> ds.SimulationsData:
     """Process all simulation folders in a results directory sequentially.
 
@@ -250,6 +387,16 @@ def process_whole_result_set(
             They should containd the processing logic for a simulation.
             Each callable should take a Simulation object as its only parameter and modify it in place.
 
+        worker_pool WorkerPool, default None:
+            Running :class:`pytrnsys_process.api.WorkerPool`.
+            If given, the simulations are processed in parallel by its workers.
+
+        columns_to_read list of str, default None:
+            Names of the data columns to read from the printer files, instead of all of them.
+            Overrides ``global_settings.reader.performance.columns_to_read``.
+            Simulations with an up-to-date cache load only these columns from it,
+            the others are read without caching them.
+
     Returns
     _______
         SimulationsData: :class:`pytrnsys_process.api.SimulationsData`
@@ -291,7 +438,11 @@ def process_whole_result_set(
         if sim_folder.is_dir()
     ]
     simulations_data = _process_batch(
-        sim_folders, processing_scenario, results_folder
+        sim_folders,
+        processing_scenario,
+        results_folder,
+        _Execution(worker_pool=worker_pool),
+        cp.ProcessingOptions(columns_to_read=columns_to_read),
     )
     util.save_to_pickle(
         simulations_data,
@@ -308,11 +459,16 @@ def process_whole_result_set_parallel(
         _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
     ],
     max_workers: int | None = None,
+    worker_pool: _tp.Optional[wp.WorkerPool] = None,
+    max_memory: int | None = None,
+    columns_to_read: _tp.Optional[_abc.Sequence[str]] = None,
 ) -> ds.SimulationsData:
     """Process all simulation folders in a results directory in parallel.
 
     Uses a ProcessPoolExecutor to process multiple simulations concurrently,
     applying the provided processing step/scenario to each simulation.
+    The simulations expected to take longest are submitted first,
+    based on their duration in the previous run or the size of their input files.
 
     Using the default settings your structure should look like this:
 
@@ -336,6 +492,21 @@ def process_whole_result_set_parallel(
             Maximum number of worker processes to use.
             If None, defaults to the number of processors on the machine.
 
+        worker_pool WorkerPool, default None:
+            Running :class:`pytrnsys_process.api.WorkerPool`.
+            If given, its warmed-up workers are reused instead of starting new ones, and max_workers is ignored.
+
+        max_memory int, default None:
+            Maximum total size in bytes of the input files of the simulations processed at the same time.
+            Serves as estimate of the memory they need, to avoid running out of memory with large simulations.
+            If None, all simulations are submitted at once.
+
+        columns_to_read list of str, default None:
+            Names of the data columns to read from the printer files, instead of all of them.
+            Overrides ``global_settings.reader.performance.columns_to_read``.
+            Simulations with an up-to-date cache load only these columns from it,
+            the others are read without caching them.
+
     Returns
     _______
         SimulationsData: :class:`pytrnsys_process.api.SimulationsData`
@@ -382,8 +553,13 @@ def process_whole_result_set_parallel(
         sim_folders,
         processing_scenario,
         results_folder,
-        parallel=True,
-        max_workers=max_workers,
+        _Execution(
+            parallel=True,
+            max_workers=max_workers,
+            worker_pool=worker_pool,
+            max_memory=max_memory,
+        ),
+        cp.ProcessingOptions(columns_to_read=columns_to_read),
     )
     util.save_to_pickle(
         simulations_data,
@@ -393,6 +569,117 @@ def process_whole_result_set_parallel(
     return simulations_data
 
 
+# The options are the keyword arguments of process_whole_result_set_parallel, plus the ones of the iteration.
+# pylint: disable-next=too-many-arguments
+def iterate_whole_result_set(
+    results_folder: _pl.Path,
+    processing_scenario: _tp.Union[
+        _abc.Callable[[ds.Simulation], None],
+        _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
+    ],
+    parallel: bool = False,
+    max_workers: int | None = None,
+    keep_time_series: bool = True,
+    *,
+    worker_pool: _tp.Optional[wp.WorkerPool] = None,
+    max_memory: int | None = None,
+    columns_to_read: _tp.Optional[_abc.Sequence[str]] = None,
+) -> _abc.Iterator[tuple[str, ds.Simulation, list[str]]]:
+    """Process all simulation folders in a results directory, yielding each simulation as soon as it is processed.
+
+    Unlike :func:`process_whole_result_set`, the simulations are not collected,
+    so each one can be released after it was handled.
+    Together with ``keep_time_series=False``, this allows to process large result sets with constant memory.
+    Simulations which fail to process are logged and skipped.
+
+    Parameters
+    __________
+        results_folder pathlib.Path:
+            Path to the directory containing simulation folders.
+            Each subfolder should contain a temp folder containing valid simulation data files.
+
+        processing_scenario: collections.abc.Callable or collections.abc.Sequence of collections.abc.Callable
+            They should contain the processing logic for a simulation.
+            Each callable should take a Simulation object as its only parameter and modify it in place.
+
+        parallel bool, default False:
+            Whether to process the simulations in parallel, using a ProcessPoolExecutor.
+
+        max_workers int, default None:
+            Maximum number of worker processes to use, if running in parallel.
+            If None, defaults to the number of processors on the machine.
+
+        keep_time_series bool, default True:
+            If False, the monthly, hourly and step data are dropped after the processing scenarios ran,
+            and only the scalar values are kept.
+
+        worker_pool WorkerPool, default None:
+            Running :class:`pytrnsys_process.api.WorkerPool`.
+            If given, the simulations are processed in parallel by its workers, and max_workers is ignored.
+
+        max_memory int, default None:
+            Maximum total size in bytes of the input files of the simulations processed in parallel at the same time.
+            Serves as estimate of the memory they need, to avoid running out of memory with large simulations.
+            If None, all simulations are submitted at once.
+
+        columns_to_read list of str, default None:
+            Names of the data columns to read from the printer files, instead of all of them.
+            Overrides ``global_settings.reader.performance.columns_to_read``.
+            Simulations with an up-to-date cache load only these columns from it,
+            the others are read without caching them.
+
+    Returns
+    _______
+        Iterator of tuples (sim_name, simulation, failed_scenarios):
+            In the order in which the simulations finish processing.
+
+    Raises
+    _______
+        ValueError: If results_folder doesn't exist or is not a directory
+
+    Example
+    _______
+        >>> import pathlib as _pl
+        >>> from pytrnsys_process import api
+        ...
+        >>> def processing_step_1(sim):
+        ...     sim.scalar["QSrc1Total"] = sim.hourly["QSrc1TIn"].sum()
+        >>> for sim_name, simulation, failed_scenarios in api.iterate_whole_result_set(
+        ...     _pl.Path("path/to/results"),
+        ...     processing_step_1,
+        ...     parallel=True,
+        ...     keep_time_series=False,
+        ... ):
+        ...     print(sim_name, simulation.scalar["QSrc1Total"].iloc[0])
+    """
+    _validate_folder(results_folder)
+    log.initialize_logs(results_folder)
+    main_logger = log.get_main_logger(results_folder)
+    main_logger.info(
+        "Starting iteration over simulations in %s", results_folder
+    )
+
+    sim_folders = [
+        sim_folder
+        for sim_folder in results_folder.iterdir()
+        if sim_folder.is_dir()
+    ]
+    yield from _iterate_batch(
+        sim_folders,
+        processing_scenario,
+        results_folder,
+        _Execution(
+            parallel=parallel,
+            max_workers=max_workers,
+            worker_pool=worker_pool,
+            max_memory=max_memory,
+        ),
+        cp.ProcessingOptions(
+            keep_time_series=keep_time_series, columns_to_read=columns_to_read
+        ),
+    )
+
+
 def do_comparison(
     comparison_scenario: _tp.Union[
         _abc.Callable[[ds.SimulationsData], None],
@@ -400,6 +687,7 @@ def do_comparison(
     ],
     simulations_data: _tp.Optional[ds.SimulationsData] = None,
     results_folder: _tp.Optional[_pl.Path] = None,
+    worker_pool: _tp.Optional[wp.WorkerPool] = None,
 ) -> ds.SimulationsData:
     """Execute comparison scenarios on processed simulation results.
 
@@ -417,6 +705,10 @@ def do_comparison(
             Path to the directory containing simulation results.
             Used if simulations_data is not provided.
 
+        worker_pool: WorkerPool, optional
+            Running :class:`pytrnsys_process.api.WorkerPool`,
+            used if the simulations in results_folder need to be processed.
+
     Returns
     _______
         SimulationsData: :class:`pytrnsys_process.api.SimulationsData`
@@ -454,10 +746,11 @@ def do_comparison(
             )
             if not simulations_data.path_to_simulations == str(results_folder):
                 simulations_data.path_to_simulations = str(results_folder)
+                cp.relocate_lazy_simulations(simulations_data, results_folder)
 
         else:
             simulations_data = process_whole_result_set_parallel(
-                results_folder, []
+                results_folder, [], worker_pool=worker_pool
             )
     main_logger = log.get_main_logger(
         _pl.Path(simulations_data.path_to_simulations)
@@ -482,8 +775,10 @@ def _process_comparisons(
     )
     for step in scenario:
         try:
-            step(simulations_data)
+            with util.exporting_plots_in_background():
+                step(simulations_data)
             _plt.close("all")
+            cp.evict_lazy_simulations(simulations_data)
         except Exception as e:  # pylint: disable=broad-except
             scenario_name = getattr(step, "__name__", str(step))
             main_logger.error(
@@ -492,6 +787,7 @@ def _process_comparisons(
                 str(e),
                 exc_info=True,
             )
+    util.convert_pending_svgs_to_emf(main_logger)
 
 
 def _concat_scalar(simulation_data: ds.SimulationsData) -> ds.SimulationsData:
@@ -521,25 +817,11 @@ def _process_simulation(
         _abc.Callable[[ds.Simulation], None],
         _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
     ],
-    force_reread_prt: _tp.Optional[bool] = None,
+    options: cp.ProcessingOptions = cp.ProcessingOptions(),
 ) -> tuple[ds.Simulation, list[str]]:
-    if not force_reread_prt:
-        force_reread_prt = conf.global_settings.reader.force_reread_prt
     sim_logger = log.get_simulation_logger(sim_folder)
     sim_logger.info("Starting simulation processing")
-    sim_pickle_file = sim_folder / conf.FileNames.SIMULATION_PICKLE_FILE.value
-    simulation: ds.Simulation
-    if sim_pickle_file.exists() and not force_reread_prt:
-        sim_logger.info("Loading simulation from pickle file")
-        simulation = util.load_simulation_from_pickle(
-            sim_pickle_file, sim_logger
-        )
-    else:
-        sim_logger.info("Processing simulation from raw files")
-        sim_files = util.get_files([sim_folder])
-        simulation = ps.process_sim(sim_files, sim_folder)
-        if sim_files:
-            util.save_to_pickle(simulation, sim_pickle_file, sim_logger)
+    simulation = cp.load_simulation(sim_folder, options, sim_logger)
 
     failed_scenarios = []
 
@@ -554,7 +836,9 @@ def _process_simulation(
         try:
             scenario_name = getattr(scenario, "__name__", str(scenario))
             sim_logger.info("Running scenario: %s", scenario_name)
-            scenario(simulation)
+            with timing.stage("scenario", scenario_name):
+                with util.exporting_plots_in_background():
+                    scenario(simulation)
             sim_logger.info(
                 "Successfully completed scenario: %s", scenario_name
             )
@@ -568,6 +852,17 @@ def _process_simulation(
                 exc_info=True,
             )
 
+    if not options.keep_time_series:
+        simulation = ds.Simulation(
+            simulation.path,
+            _pd.DataFrame(),
+            _pd.DataFrame(),
+            _pd.DataFrame(),
+            simulation.scalar,
+        )
+    elif isinstance(simulation, util.LazySimulation):
+        simulation.evict()
+
     if failed_scenarios:
         sim_logger.warning(
             "Simulation completed with %d failed scenarios",
@@ -579,6 +874,40 @@ def _process_simulation(
     return simulation, failed_scenarios
 
 
+def _process_simulation_in_worker(
+    sim_folder: _pl.Path,
+    processing_scenarios: _tp.Union[
+        _abc.Callable[[ds.Simulation], None],
+        _tp.Sequence[_abc.Callable[[ds.Simulation], None]],
+    ],
+    settings: conf.Settings,
+    options: cp.ProcessingOptions,
+) -> tuple[
+    ds.Simulation,
+    list[str],
+    float,
+    list[timing.StageTiming],
+    list[tuple[_pl.Path, bool]],
+]:
+    start_time = _time.time()
+    # Workers of a long-lived pool would otherwise keep the settings of the time they were started.
+    conf.global_settings.plot = settings.plot
+    conf.global_settings.reader = settings.reader
+    with timing.record_stages(sim_folder.name) as timings:
+        simulation, failed_scenarios = _process_simulation(
+            sim_folder, processing_scenarios, options
+        )
+    # Sent back by pickle, for a lazy simulation only its loaded resolutions are pickled.
+    return (
+        simulation,
+        failed_scenarios,
+        _time.time() - start_time,
+        timings,
+        # Converted to EMF by the main process, together with the plots of other simulations.
+        util.take_pending_svg_to_emf_conversions(),
+    )
+
+
 def _log_processing_results(
     results: ds.ProcessingResults, main_logger: _logging.Logger
 ) -> None:
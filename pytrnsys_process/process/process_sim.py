@@ -1,52 +1,71 @@
+import concurrent.futures as _futures
+import functools as _ft
 import logging as _logging
 import pathlib as _pl
+import typing as _tp
 from collections import abc as _abc
 from dataclasses import dataclass, field
 
+import numpy as _np
 import pandas as _pd
 
 from pytrnsys_process import config as conf
 from pytrnsys_process import deck, log, read, util
 from pytrnsys_process.process import data_structures as ds
 from pytrnsys_process.process import file_type_detector as ftd
+from pytrnsys_process.process import timing
+from pytrnsys_process.util import file_cache as fc
+from pytrnsys_process.util import simulation_cache as sc
+
+# Decks of the simulations handled by this process, usually variations of the same deck.
+_DECK_CACHE = deck.DeckCache()
 
 
 def process_sim(
-    sim_files: _abc.Sequence[_pl.Path], sim_folder: _pl.Path
+    sim_files: _abc.Sequence[_pl.Path],
+    sim_folder: _pl.Path,
+    file_cache: _tp.Optional[fc.FileCache] = None,
+    columns_to_read: _tp.Optional[_abc.Collection[str]] = None,
+    time_window: _tp.Optional[sc.TimeWindow] = None,
 ) -> ds.Simulation:
     # Used to store the array of dataframes for each file type.
     # Later used to concatenate all into one dataframe and saving as Sim object
     simulation_data_collector = _SimulationDataCollector()
 
     sim_logger = log.get_simulation_logger(sim_folder)
-    for sim_file in sim_files:
-        try:
-            _process_file(
-                simulation_data_collector,
-                sim_file,
-                _determine_file_type(sim_file, sim_logger),
-            )
-        except ValueError as e:
-            sim_logger.error(
-                "Error reading file %s it will not be available for processing: %s",
-                sim_file,
-                str(e),
-                exc_info=True,
-            )
-        except KeyError as e:
-            sim_logger.error(
-                "Error reading file %s it will not be available for processing: %s",
-                sim_file,
-                str(e),
-                exc_info=True,
-            )
-
-    return _merge_dataframes_into_simulation(
-        simulation_data_collector, sim_folder
+    read_sim_file = _ft.partial(
+        _read_sim_file,
+        file_cache=file_cache,
+        sim_logger=sim_logger,
+        columns_to_read=columns_to_read,
+        time_window=time_window,
     )
+    max_read_workers = conf.global_settings.reader.performance.max_read_workers
+    if max_read_workers > 1 and len(sim_files) > 1:
+        with _futures.ThreadPoolExecutor(
+            max_workers=min(max_read_workers, len(sim_files))
+        ) as executor:
+            # The results are collected in the order of the files, so the merged columns don't depend on timing.
+            read_results = list(executor.map(read_sim_file, sim_files))
+    else:
+        read_results = [read_sim_file(sim_file) for sim_file in sim_files]
+
+    for read_result in read_results:
+        if read_result is not None:
+            _add_to_collector(simulation_data_collector, *read_result)
+
+    if file_cache:
+        file_cache.save_manifest()
+
+    with timing.stage("merge"):
+        return _merge_dataframes_into_simulation(
+            simulation_data_collector, sim_folder
+        )
 
 
-def handle_duplicate_columns(df: _pd.DataFrame) -> _pd.DataFrame:
+def handle_duplicate_columns(
+    df: _pd.DataFrame, validate: bool = True
+) -> _pd.DataFrame:
     """
     Process duplicate columns in a DataFrame, ensuring they contain consistent data.
 
@@ -59,6 +78,9 @@ def handle_duplicate_columns(df: _pd.DataFrame) -> _pd.DataFrame:
     df: pandas.DataFrame
         Input DataFrame to process
 
+    validate: bool, default True
+        If False, the first occurrence of a column is trusted and kept without comparing it to the others.
+
     Returns
     _______
     df: pandas.DataFrame
@@ -76,24 +98,10 @@ def handle_duplicate_columns(df: _pd.DataFrame) -> _pd.DataFrame:
     https://stackoverflow.com/questions/14984119/python-pandas-remove-duplicate-columns
     """
     remove_time_as_well = False
-    for col in df.columns[df.columns.duplicated(keep=False)]:
-        duplicate_cols = df.iloc[:, df.columns == col]
-
-        nan_mask = duplicate_cols.isna()
-        value_mask = ~nan_mask
-        if ((nan_mask.sum(axis=1) > 0) & (value_mask.sum(axis=1) > 0)).any():
-            raise ValueError(
-                f"Column '{col}' has NaN values in one column while having actual values in another"
-            )
-
-        if not duplicate_cols.apply(lambda x: x.nunique() <= 1, axis=1).all():
-            if col == "Time":
+    if validate:
+        for col in df.columns[df.columns.duplicated(keep=False)].unique():
+            if _has_conflicting_values(col, df.iloc[:, df.columns == col]):
                 remove_time_as_well = True
-                continue
-
-            raise ValueError(
-                f"Column '{col}' has conflicting values at same indices"
-            )
 
     columns_to_be_removed = df.columns.duplicated()
     if remove_time_as_well:
@@ -104,14 +112,25 @@ def handle_duplicate_columns(df: _pd.DataFrame) -> _pd.DataFrame:
     return df
 
 
-def _determine_file_type(
-    sim_file: _pl.Path, logger: _logging.Logger
-) -> conf.FileType:
-    """Determine the file type using name and content."""
-    try:
-        return ftd.get_file_type_using_file_name(sim_file, logger)
-    except ValueError:
-        return ftd.get_file_type_using_file_content(sim_file, logger)
+def _has_conflicting_values(
+    col: _tp.Hashable, duplicate_cols: _pd.DataFrame
+) -> bool:
+    """Return whether the conflicting duplicates of the Time column need to be removed, raise for other columns."""
+    nan_mask = duplicate_cols.isna().to_numpy()
+    if (nan_mask.any(axis=1) & ~nan_mask.all(axis=1)).any():
+        raise ValueError(
+            f"Column '{col}' has NaN values in one column while having actual values in another"
+        )
+
+    values = duplicate_cols.to_numpy()
+    # Rows are either NaN in all columns, or in none of them at this point.
+    if ((values == values[:, :1]) | nan_mask).all():
+        return False
+
+    if col == "Time":
+        return True
+
+    raise ValueError(f"Column '{col}' has conflicting values at same indices")
 
 
 @dataclass
@@ -122,7 +141,12 @@ class _SimulationDataCollector:
     parsed_deck: _pd.DataFrame = field(default_factory=_pd.DataFrame)
 
 
-def _read_file(file_path: _pl.Path, file_type: conf.FileType) -> _pd.DataFrame:
+def _read_file(
+    file_path: _pl.Path,
+    reader_plan: ftd.ReaderPlan,
+    columns_to_read: _tp.Optional[_abc.Collection[str]] = None,
+    time_window: _tp.Optional[sc.TimeWindow] = None,
+) -> _pd.DataFrame:
     """
     Factory method to read data from a file using the appropriate reader.
 
@@ -131,8 +155,14 @@ def _read_file(file_path: _pl.Path, file_type: conf.FileType) -> _pd.DataFrame:
     file_path: pathlib.Path
         Path to the file to be read
 
-    file_type: conf.FileType
-        Type of data in the file (MONTHLY, HOURLY, or TIMESTEP)
+    reader_plan: ftd.ReaderPlan
+        Type of data in the file (MONTHLY, HOURLY, or TIMESTEP) and how to read it
+
+    columns_to_read: collection of str, optional
+        Data columns to read, all if not given
+
+    time_window: tuple of (timestamp, timestamp), optional
+        First and last timestamp of the step data to read, all if not given
 
     Returns
     _______
@@ -144,82 +174,156 @@ def _read_file(file_path: _pl.Path, file_type: conf.FileType) -> _pd.DataFrame:
     ValueError
         If file extension is not supported
     """
-    starting_year = conf.global_settings.reader.starting_year
-    extension = file_path.suffix.lower()
-    logger = log.get_simulation_logger(file_path.parents[1])
-    if extension in [".prt", ".hr"]:
-        reader = read.PrtReader()
-        if file_type == conf.FileType.MONTHLY:
-            return reader.read_monthly(
-                file_path, logger=logger, starting_year=starting_year
-            )
-        if file_type == conf.FileType.HOURLY:
-            return reader.read_hourly(
-                file_path, logger=logger, starting_year=starting_year
-            )
-        if file_type == conf.FileType.TIMESTEP:
-            return reader.read_step(
-                file_path, starting_year=starting_year, skipfooter=23, header=1
-            )
-        if file_type == conf.FileType.HYDRAULIC:
-            return reader.read_step(file_path, starting_year=starting_year)
-    elif extension == ".csv":
-        return read.CsvReader().read_csv(file_path)
+    with timing.stage("read_file", file_path.name, file_path):
+        starting_year = conf.global_settings.reader.starting_year
+        options = read.ReadOptions(
+            dtype=conf.global_settings.reader.performance.dtype,
+            usecols=columns_to_read,
+        )
+        extension = file_path.suffix.lower()
+        logger = log.get_simulation_logger(file_path.parents[1])
+        file_type = reader_plan.file_type
+        if extension in [".prt", ".hr"]:
+            reader = read.PrtReader()
+            if file_type == conf.FileType.MONTHLY:
+                return reader.read_monthly(
+                    file_path,
+                    logger=logger,
+                    starting_year=starting_year,
+                    options=options,
+                )
+            if file_type == conf.FileType.HOURLY:
+                return reader.read_hourly(
+                    file_path,
+                    logger=logger,
+                    starting_year=starting_year,
+                    options=options,
+                )
+            if file_type in [conf.FileType.TIMESTEP, conf.FileType.HYDRAULIC]:
+                return reader.read_step(
+                    file_path,
+                    starting_year=starting_year,
+                    skipfooter=reader_plan.skipfooter,
+                    header=reader_plan.header,
+                    options=options,
+                    time_window=time_window,
+                )
+        elif extension == ".csv":
+            return read.CsvReader().read_csv(file_path, options)
 
     raise ValueError(f"Unsupported file extension: {extension}")
 
 
-def _process_file(
-    simulation_data_collector: _SimulationDataCollector,
-    file_path: _pl.Path,
-    file_type: conf.FileType,
-) -> bool:
-    if file_type == conf.FileType.MONTHLY:
-        simulation_data_collector.monthly.append(
-            _read_file(file_path, conf.FileType.MONTHLY)
+def _read_sim_file(
+    sim_file: _pl.Path,
+    file_cache: _tp.Optional[fc.FileCache],
+    sim_logger: _logging.Logger,
+    columns_to_read: _tp.Optional[_abc.Collection[str]] = None,
+    time_window: _tp.Optional[sc.TimeWindow] = None,
+) -> _tp.Optional[tuple[conf.FileType, _pd.DataFrame]]:
+    try:
+        with timing.stage("detect_file_type", sim_file.name):
+            reader_plan = ftd.get_reader_plan(sim_file, sim_logger)
+        df = _process_file(
+            sim_file, reader_plan, file_cache, columns_to_read, time_window
         )
-    elif file_type == conf.FileType.HOURLY:
-        simulation_data_collector.hourly.append(
-            _read_file(file_path, conf.FileType.HOURLY)
+    except (ValueError, KeyError) as e:
+        sim_logger.error(
+            "Error reading file %s it will not be available for processing: %s",
+            sim_file,
+            str(e),
+            exc_info=True,
         )
-    elif (
-        file_type == conf.FileType.TIMESTEP
-        and conf.global_settings.reader.read_step_files
-    ):
-        # There are two ways to have a step file:
-        # - using type 25
-        # - using type 46
-        # The user can copy and paste both, and they would like to use '_step.prt'.
-        # Here we try both, as a temporary solution, till the file reading is fully refactored.
-        try:
-            step_df = _read_file(file_path, conf.FileType.TIMESTEP)
-        except KeyError:
-            step_df = _read_file(file_path, conf.FileType.HYDRAULIC)
-        simulation_data_collector.step.append(step_df)
-    elif (
-        file_type == conf.FileType.HYDRAULIC
+        return None
+    if df is None:
+        return None
+    return reader_plan.file_type, df
+
+
+def _process_file(
+    file_path: _pl.Path,
+    reader_plan: ftd.ReaderPlan,
+    file_cache: _tp.Optional[fc.FileCache] = None,
+    columns_to_read: _tp.Optional[_abc.Collection[str]] = None,
+    time_window: _tp.Optional[sc.TimeWindow] = None,
+) -> _tp.Optional[_pd.DataFrame]:
+    file_type = reader_plan.file_type
+    read_file = _ft.partial(
+        _read_file, file_path, reader_plan, columns_to_read, time_window
+    )
+    dtype = conf.global_settings.reader.performance.dtype
+    if file_type in [conf.FileType.MONTHLY, conf.FileType.HOURLY]:
+        return _load_or_read(file_path, read_file, file_cache, dtype)
+    if (
+        file_type in [conf.FileType.TIMESTEP, conf.FileType.HYDRAULIC]
         and conf.global_settings.reader.read_step_files
     ):
-        simulation_data_collector.step.append(
-            _read_file(file_path, conf.FileType.HYDRAULIC)
-        )
-    elif (
+        return _load_or_read(file_path, read_file, file_cache, dtype)
+    if (
         file_type == conf.FileType.DECK
         and conf.global_settings.reader.read_deck_files
     ):
-        simulation_data_collector.parsed_deck = _get_deck_as_df(file_path)
-    else:
-        return False
-    return True
+        return _load_or_read(
+            file_path, _ft.partial(_get_deck_as_df, file_path), file_cache
+        )
+    return None
 
 
-def _get_deck_as_df(
+def _add_to_collector(
+    simulation_data_collector: _SimulationDataCollector,
+    file_type: conf.FileType,
+    df: _pd.DataFrame,
+) -> None:
+    if file_type == conf.FileType.MONTHLY:
+        simulation_data_collector.monthly.append(df)
+    elif file_type == conf.FileType.HOURLY:
+        simulation_data_collector.hourly.append(df)
+    elif file_type in [conf.FileType.TIMESTEP, conf.FileType.HYDRAULIC]:
+        simulation_data_collector.step.append(df)
+    elif file_type == conf.FileType.DECK:
+        simulation_data_collector.parsed_deck = df
+
+
+def _load_or_read(
     file_path: _pl.Path,
+    read_file: _abc.Callable[[], _pd.DataFrame],
+    file_cache: _tp.Optional[fc.FileCache],
+    dtype: _tp.Optional[str] = None,
 ) -> _pd.DataFrame:
-    deck_file_as_string = util.get_file_content_as_string(file_path)
-    parsed_deck: dict[str, float] = deck.parse_deck_for_constant_expressions(
-        deck_file_as_string, log.get_simulation_logger(file_path.parent)
+    if file_cache is None:
+        return read_file()
+
+    with timing.stage("load_file_cache", file_path.name):
+        df = file_cache.load(file_path)
+    if df is None or not _has_float_dtype(df, dtype):
+        df = read_file()
+        with timing.stage("save_file_cache", file_path.name):
+            file_cache.save(file_path, df)
+    return df
+
+
+def _has_float_dtype(df: _pd.DataFrame, dtype: _tp.Optional[str]) -> bool:
+    """Whether a cached DataFrame was read with the configured dtype, float64 if None."""
+    expected_dtype = _np.dtype(dtype or _np.float64)
+    return all(
+        column_dtype == expected_dtype
+        for column_dtype in df.dtypes
+        if _pd.api.types.is_float_dtype(column_dtype)
     )
+
+
+def _get_deck_as_df(
+    file_path: _pl.Path,
+) -> _pd.DataFrame:
+    with timing.stage("parse_deck", file_path.name, file_path):
+        deck_file_as_string = util.get_file_content_as_string(file_path)
+        parsed_deck: dict[str, float] = (
+            _DECK_CACHE.parse_deck_for_constant_expressions(
+                deck_file_as_string,
+                log.get_simulation_logger(file_path.parent),
+                incremental=conf.global_settings.reader.incremental_deck_parsing,
+            )
+        )
     deck_as_df = _pd.DataFrame([parsed_deck])
     return deck_as_df
 
@@ -237,8 +341,31 @@ def _merge_dataframes_into_simulation(
     )
 
 
-def _get_df_without_duplicates(dfs: _abc.Sequence[_pd.DataFrame]):
-    if len(dfs) > 0:
-        return handle_duplicate_columns(_pd.concat(dfs, axis=1))
+def _get_df_without_duplicates(
+    dfs: _abc.Sequence[_pd.DataFrame],
+) -> _pd.DataFrame:
+    """Merge the DataFrames of one resolution, dropping duplicate columns before concatenating.
 
-    return _pd.DataFrame()
+    Concatenating first and then dropping the duplicates would allocate the merged DataFrame twice.
+    """
+    if len(dfs) == 0:
+        return _pd.DataFrame()
+
+    validate = conf.global_settings.reader.validate_duplicate_columns
+    columns: dict[_tp.Hashable, _pd.Series] = {}
+    remove_time = False
+    for df in dfs:
+        for col, series in df.items():
+            if col not in columns:
+                columns[col] = series
+            elif validate and _has_conflicting_values(
+                col, _pd.concat([columns[col], series], axis=1)
+            ):
+                remove_time = True
+
+    if remove_time:
+        del columns["Time"]
+
+    if not columns:
+        return _pd.DataFrame()
+    return _pd.concat(columns.values(), axis=1)
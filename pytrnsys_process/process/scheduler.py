@@ -0,0 +1,193 @@
+"""
+Size-aware scheduling of simulations across worker processes.
+
+The simulations expected to take longest are submitted first, so no large simulation is left
+running on its own at the end of a batch, while all other workers are idle.
+The cost of a simulation is estimated from its duration in the previous run, if known,
+and otherwise from the total size of its input files.
+The durations are recorded in the results folder:
+
+| results_folder
+|     ├─ processing_durations.json
+|     ├─ sim-1
+|     ├─ sim-2
+"""
+
+import collections as _collections
+import collections.abc as _abc
+import concurrent.futures as _futures
+import dataclasses as _dc
+import json as _json
+import logging as _logging
+import pathlib as _pl
+import statistics as _statistics
+import typing as _tp
+
+from pytrnsys_process import config as conf
+from pytrnsys_process import log, util
+
+
+@_dc.dataclass(frozen=True)
+class SimulationCost:
+    """Estimated cost of processing a single simulation.
+
+    Attributes
+    __________
+        sim_folder: pathlib.Path
+            Folder of the simulation
+
+        input_size: int
+            Total size of the input files in bytes.
+            Also serves as estimate of the memory needed to process the simulation.
+
+        previous_duration: float, optional
+            Processing time of the previous run in seconds, if known
+    """
+
+    sim_folder: _pl.Path
+    input_size: int
+    previous_duration: _tp.Optional[float] = None
+
+
+def estimate_costs(
+    sim_folders: _abc.Sequence[_pl.Path],
+    durations: _tp.Optional[_abc.Mapping[str, float]] = None,
+) -> list[SimulationCost]:
+    """Estimate the cost of the simulations and sort them, the most expensive first.
+
+    Simulations without a previous duration are ranked by their input size,
+    converted to seconds with the median throughput of the simulations with a previous duration.
+
+    Parameters
+    __________
+        sim_folders: list of pathlib.Path
+            Simulation folders to process
+
+        durations: dict of {str, float}, optional
+            Processing times of the previous run in seconds, by simulation name.
+            See :func:`load_durations`.
+
+    Returns
+    _______
+        costs: list of SimulationCost
+    """
+    durations = durations or {}
+    costs = [
+        SimulationCost(
+            sim_folder,
+            sum(file.stat().st_size for file in util.get_files([sim_folder])),
+            durations.get(sim_folder.name),
+        )
+        for sim_folder in sim_folders
+    ]
+    seconds_per_byte = _get_median_seconds_per_byte(costs)
+
+    def get_estimated_duration(cost: SimulationCost) -> float:
+        if cost.previous_duration is not None:
+            return cost.previous_duration
+        return cost.input_size * seconds_per_byte
+
+    return sorted(costs, key=get_estimated_duration, reverse=True)
+
+
+def iterate_completed(
+    costs: _abc.Sequence[SimulationCost],
+    submit: _abc.Callable[[_pl.Path], _futures.Future],
+    max_memory: _tp.Optional[int] = None,
+) -> _abc.Iterator[tuple[_pl.Path, _futures.Future]]:
+    """Submit the simulations in the given order, and yield them as they complete.
+
+    Parameters
+    __________
+        costs: list of SimulationCost
+            Simulations in the order to submit them, see :func:`estimate_costs`
+
+        submit: collections.abc.Callable
+            Submits the processing of a simulation folder to an executor
+
+        max_memory: int, optional
+            Maximum input size in bytes of the simulations processed at the same time.
+            The next simulation which fits is submitted, as soon as enough memory is released.
+            A simulation larger than this on its own is processed, once no other simulation is running.
+            If None, all simulations are submitted at once.
+
+    Returns
+    _______
+        Iterator of (sim_folder, future) in the order of completion.
+        Simulations not submitted yet are dropped, and the submitted ones cancelled,
+        if the iteration is stopped early.
+    """
+    pending = _collections.deque(costs)
+    running: dict[_futures.Future, SimulationCost] = {}
+    memory_in_use = 0
+    try:
+        while pending or running:
+            for cost in list(pending):
+                fits = (
+                    max_memory is None
+                    or not running
+                    or memory_in_use + cost.input_size <= max_memory
+                )
+                if fits:
+                    pending.remove(cost)
+                    running[submit(cost.sim_folder)] = cost
+                    memory_in_use += cost.input_size
+
+            done, _ = _futures.wait(
+                running, return_when=_futures.FIRST_COMPLETED
+            )
+            for future in done:
+                cost = running.pop(future)
+                memory_in_use -= cost.input_size
+                yield cost.sim_folder, future
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def load_durations(results_folder: _pl.Path) -> dict[str, float]:
+    """Load the processing times of the previous run, an empty dict if there are none."""
+    durations_file = (
+        results_folder / conf.FileNames.PROCESSING_DURATIONS_FILE.value
+    )
+    try:
+        durations = _json.loads(durations_file.read_text(encoding="utf-8"))
+        return {
+            str(sim_name): float(duration)
+            for sim_name, duration in durations.items()
+        }
+    except (OSError, ValueError, AttributeError, TypeError):
+        return {}
+
+
+def save_durations(
+    results_folder: _pl.Path,
+    durations: _abc.Mapping[str, float],
+    logger: _logging.Logger = log.default_console_logger,
+) -> None:
+    """Record the processing times, keeping the ones of simulations not processed in this run."""
+    durations_file = (
+        results_folder / conf.FileNames.PROCESSING_DURATIONS_FILE.value
+    )
+    all_durations = load_durations(results_folder) | dict(durations)
+    try:
+        durations_file.write_text(
+            _json.dumps(dict(sorted(all_durations.items())), indent=2),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.warning("Unable to save processing durations: %s", e)
+
+
+def _get_median_seconds_per_byte(
+    costs: _abc.Sequence[SimulationCost],
+) -> float:
+    seconds_per_byte = [
+        cost.previous_duration / cost.input_size
+        for cost in costs
+        if cost.previous_duration is not None and cost.input_size
+    ]
+    if not seconds_per_byte:
+        # Only the order matters, if no simulation has a previous duration.
+        return 1.0
+    return _statistics.median(seconds_per_byte)
@@ -0,0 +1,224 @@
+"""
+Per stage timing of the processing of simulations.
+
+Every stage of processing a simulation, like reading a printer file, merging its data,
+parsing its deck, loading its cache or running a processing scenario, is timed.
+The timings of each simulation are written to a report next to its log file,
+so it is possible to see where the time of a long batch is spent:
+
+| results_folder
+|     ├─ sim-1
+|         ├─ processing_timings.csv
+|     ├─ sim-2
+|         ├─ processing_timings.csv
+
+The reports hold one row per stage, e.g. to be analyzed with pandas:
+
+    >>> timings = pd.concat(
+    ...     pd.read_csv(file)
+    ...     for file in results_folder.glob("*/processing_timings.csv")
+    ... )
+    >>> timings.groupby("stage")["wall_time"].sum().sort_values()
+"""
+
+import contextlib as _contextlib
+import ctypes as _ctypes
+import dataclasses as _dc
+import logging as _logging
+import pathlib as _pl
+import sys as _sys
+import time as _time
+import typing as _tp
+from collections import abc as _abc
+
+import pandas as _pd
+
+from pytrnsys_process import config as conf
+from pytrnsys_process import log
+
+# Timings of the simulation currently processed by this process, None if nothing is recorded.
+# pylint: disable-next=invalid-name
+_timings: _tp.Optional[list["StageTiming"]] = None
+_simulation_name: str = ""  # pylint: disable=invalid-name
+
+
+@_dc.dataclass(frozen=True)
+class StageTiming:
+    """Resources used by a single stage of processing a simulation.
+
+    Attributes
+    __________
+        simulation: str
+            Name of the simulation
+
+        stage: str
+            Name of the stage, e.g. "read_file" or "scenario"
+
+        detail: str
+            Name of the file or scenario handled in the stage, if any
+
+        wall_time: float
+            Elapsed time in seconds
+
+        cpu_time: float
+            CPU time of the thread running the stage in seconds
+
+        bytes_read: int
+            Size of the files read in the stage in bytes
+
+        peak_rss: int, optional
+            Peak resident memory of the process in bytes at the end of the stage, if available on the platform
+    """
+
+    simulation: str
+    stage: str
+    detail: str
+    wall_time: float
+    cpu_time: float
+    bytes_read: int
+    peak_rss: _tp.Optional[int]
+
+
+@_contextlib.contextmanager
+def record_stages(
+    simulation_name: str,
+) -> _abc.Iterator[list[StageTiming]]:
+    """Record the timings of all stages of a simulation run in this process within the context.
+
+    Parameters
+    __________
+        simulation_name: str
+            Name of the simulation, written to the report
+
+    Returns
+    _______
+        List of StageTiming, filled while the context is active
+    """
+    global _timings, _simulation_name  # pylint: disable=global-statement
+    previous_timings, previous_simulation_name = _timings, _simulation_name
+    timings: list[StageTiming] = []
+    _timings, _simulation_name = timings, simulation_name
+    try:
+        yield timings
+    finally:
+        _timings, _simulation_name = previous_timings, previous_simulation_name
+
+
+@_contextlib.contextmanager
+def stage(
+    name: str,
+    detail: str = "",
+    read_path: _tp.Optional[_pl.Path] = None,
+) -> _abc.Iterator[None]:
+    """Time a stage of the simulation recorded by :func:`record_stages`, if any.
+
+    Stages can run in several threads at once, the CPU time is measured per thread.
+
+    Parameters
+    __________
+        name: str
+            Name of the stage
+
+        detail: str
+            Name of the file or scenario handled in the stage
+
+        read_path: pathlib.Path, optional
+            File or folder read in the stage, whose size is recorded as bytes read
+    """
+    timings, simulation_name = _timings, _simulation_name
+    if timings is None:
+        yield
+        return
+
+    start_wall_time = _time.perf_counter()
+    start_cpu_time = _time.thread_time()
+    try:
+        yield
+    finally:
+        timings.append(
+            StageTiming(
+                simulation_name,
+                name,
+                detail,
+                _time.perf_counter() - start_wall_time,
+                _time.thread_time() - start_cpu_time,
+                _get_size(read_path) if read_path is not None else 0,
+                get_peak_rss(),
+            )
+        )
+
+
+def save_report(
+    folder: _pl.Path,
+    timings: _abc.Sequence[StageTiming],
+    logger: _logging.Logger = log.default_console_logger,
+) -> None:
+    """Write the timings to the report in the given simulation folder, replacing the one of the previous run."""
+    report_file = folder / conf.FileNames.PROCESSING_TIMINGS_FILE.value
+    report = _pd.DataFrame(
+        [_dc.astuple(timing) for timing in timings],
+        columns=[field.name for field in _dc.fields(StageTiming)],
+    )
+    try:
+        report.to_csv(report_file, index=False)
+    except OSError as e:
+        logger.warning("Unable to save processing timings: %s", e)
+        return
+    logger.debug("Saved processing timings to %s", report_file)
+
+
+def get_peak_rss() -> _tp.Optional[int]:
+    """Peak resident memory of this process in bytes, None if it can't be determined on this platform."""
+    if _sys.platform == "win32":
+        return _get_peak_working_set_size()
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes by Linux, but in bytes by macOS.
+    return max_rss if _sys.platform == "darwin" else max_rss * 1024
+
+
+class _ProcessMemoryCounters(_ctypes.Structure):
+    _fields_ = [
+        ("cb", _ctypes.c_ulong),
+        ("PageFaultCount", _ctypes.c_ulong),
+        ("PeakWorkingSetSize", _ctypes.c_size_t),
+        ("WorkingSetSize", _ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", _ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", _ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", _ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", _ctypes.c_size_t),
+        ("PagefileUsage", _ctypes.c_size_t),
+        ("PeakPagefileUsage", _ctypes.c_size_t),
+    ]
+
+
+def _get_peak_working_set_size() -> _tp.Optional[int]:
+    counters = _ProcessMemoryCounters(
+        cb=_ctypes.sizeof(_ProcessMemoryCounters)
+    )
+    try:
+        windll = getattr(_ctypes, "windll")
+        process = windll.kernel32.GetCurrentProcess()
+        if not windll.psapi.GetProcessMemoryInfo(
+            process, _ctypes.byref(counters), counters.cb
+        ):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return int(counters.PeakWorkingSetSize)
+
+
+def _get_size(path: _pl.Path) -> int:
+    try:
+        if path.is_dir():
+            return sum(
+                file.stat().st_size
+                for file in path.iterdir()
+                if file.is_file()
+            )
+        return path.stat().st_size
+    except OSError:
+        return 0
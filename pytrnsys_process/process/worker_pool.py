@@ -0,0 +1,172 @@
+"""
+Long-lived pool of worker processes, which can be reused by several batch processing calls.
+
+Starting a worker process imports pandas, matplotlib and lark, and the first deck parsed compiles the deck parsers.
+This costs several seconds per call, when every call starts its own pool.
+"""
+
+import concurrent.futures as _futures
+import contextlib as _contextlib
+import logging as _logging
+import os as _os
+import time as _time
+import typing as _tp
+from collections import abc as _abc
+
+import matplotlib as _mpl
+
+from pytrnsys_process import log
+from pytrnsys_process.deck import parser as _parser
+
+_WARM_UP_DECK = "CONSTANTS 1\nwarmUp = 1\n"
+
+_warm_up_duration: float = 0.0  # pylint: disable=invalid-name
+
+
+class WorkerPool:
+    """Pool of warmed-up worker processes, which can be passed to all batch processing functions.
+
+    The workers are started and warmed up once, when entering the context or calling :meth:`start`,
+    and are reused until the context is left or :meth:`shutdown` is called.
+    The global settings are sent along with every simulation,
+    so changes made to them while the pool is running are applied in the workers.
+    The log records of the workers are written by a :class:`pytrnsys_process.log.WorkerLogListener`,
+    which runs as long as the pool.
+
+    Parameters
+    __________
+        max_workers: int, default None
+            Number of worker processes.
+            If None, defaults to the number of processors on the machine.
+
+        logger: logging.Logger
+            Logger to report the startup cost of the workers to.
+
+    Example
+    _______
+        >>> import pathlib as _pl
+        >>> from pytrnsys_process import api
+        ...
+        >>> with api.WorkerPool(max_workers=4) as worker_pool:
+        ...     results = api.process_whole_result_set_parallel(
+        ...         _pl.Path("path/to/results"), processing_step, worker_pool=worker_pool
+        ...     )
+        ...     results = api.process_whole_result_set_parallel(
+        ...         _pl.Path("path/to/other/results"), processing_step, worker_pool=worker_pool
+        ...     )
+    """
+
+    def __init__(
+        self,
+        max_workers: _tp.Optional[int] = None,
+        logger: _logging.Logger = log.default_console_logger,
+    ):
+        self.max_workers = max_workers or _os.cpu_count() or 1
+        self._logger = logger
+        self._executor: _tp.Optional[_futures.ProcessPoolExecutor] = None
+        self._log_listener: _tp.Optional[log.WorkerLogListener] = None
+
+    @property
+    def executor(self) -> _futures.ProcessPoolExecutor:
+        """The running executor.
+
+        Raises
+        _______
+            RuntimeError: If the pool is not running
+        """
+        if self._executor is None:
+            raise RuntimeError(
+                "The worker pool is not running, use it as context manager or call start()."
+            )
+        return self._executor
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> "WorkerPool":
+        """Start and warm up all worker processes, if they aren't running yet."""
+        if self._executor is not None:
+            return self
+
+        start_time = _time.time()
+        self._log_listener = log.WorkerLogListener()
+        self._log_listener.start()
+        self._executor = _futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_warm_up_worker,
+            initargs=(self._log_listener.queue,),
+        )
+        # Every task submitted while no worker is idle starts another worker.
+        warm_up_durations = dict(
+            future.result()
+            for future in [
+                self._executor.submit(_get_warm_up_duration)
+                for _ in range(self.max_workers)
+            ]
+        )
+        self._logger.info(
+            "Started %d worker processes in %.2f seconds, warming up took at most %.2f seconds per worker",
+            self.max_workers,
+            _time.time() - start_time,
+            max(warm_up_durations.values()),
+        )
+        return self
+
+    def shutdown(self) -> None:
+        """Stop all worker processes, cancelling the simulations not started yet."""
+        if self._executor is None:
+            return
+        self._executor.shutdown(cancel_futures=True)
+        self._executor = None
+        # Only stopped once the workers are gone, so no record is left in the queue.
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+
+def get_executor(
+    max_workers: _tp.Optional[int], worker_pool: _tp.Optional[WorkerPool]
+) -> _tp.ContextManager[_futures.Executor]:
+    """The executor of the running pool, or a new one with max_workers for the duration of the context."""
+    if worker_pool:
+        # The pool outlives the batch, so it must not be shut down afterwards.
+        return _contextlib.nullcontext(worker_pool.executor)
+    return _get_executor_with_log_listener(max_workers)
+
+
+@_contextlib.contextmanager
+def _get_executor_with_log_listener(
+    max_workers: _tp.Optional[int],
+) -> _abc.Iterator[_futures.Executor]:
+    # The executor is shut down first, so the listener writes all records of the workers before it stops.
+    with (
+        log.WorkerLogListener() as log_listener,
+        _futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=log.initialize_worker_logging,
+            initargs=(log_listener.queue,),
+        ) as executor,
+    ):
+        yield executor
+
+
+def _warm_up_worker(log_queue: _tp.Any) -> None:
+    global _warm_up_duration  # pylint: disable=global-statement
+    start_time = _time.time()
+    log.initialize_worker_logging(log_queue)
+    # Workers never show figures, they only save them.
+    _mpl.use("Agg")
+    _parser.parse_equations(_WARM_UP_DECK)
+    _parser.parse_dck(_WARM_UP_DECK)
+    _warm_up_duration = _time.time() - start_time
+
+
+def _get_warm_up_duration() -> tuple[int, float]:
+    return _os.getpid(), _warm_up_duration
@@ -1,7 +1,13 @@
-from pytrnsys_process.read.readers import PrtReader, HeaderReader, CsvReader
+from pytrnsys_process.read.readers import (
+    PrtReader,
+    HeaderReader,
+    CsvReader,
+    ReadOptions,
+)
 
 __all__ = [
     "PrtReader",
     "HeaderReader",
     "CsvReader",
+    "ReadOptions",
 ]
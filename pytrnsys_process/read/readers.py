@@ -1,16 +1,68 @@
+import collections as _collections
+import collections.abc as _abc
 import dataclasses as _dc
-import datetime as _dt
+import io as _io
 import logging as _logging
 import pathlib as _pl
+import typing as _tp
 
+import numpy as _np
 import pandas as _pd
 
 from pytrnsys_process import log
 
+_MICROSECONDS_PER_HOUR = 3_600_000_000
+
+# Columns used to create the index, which are always read and keep their type regardless of the requested dtype.
+_TIME_COLUMN_DTYPES = {
+    "Month": object,
+    "Period": _np.float64,
+    "TIME": _np.float64,
+    "Time": _np.float64,
+    "Timestamp": object,
+}
+
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+_Engine = _tp.Literal["c", "python"]
 
 # TODO: Describe what to do when file name does not match any known patterns.  # pylint: disable=fixme
 
 
+@_dc.dataclass(frozen=True)
+class ReadOptions:
+    """Which data of a file to read, and how to store it.
+
+    Attributes
+    __________
+        dtype: str, optional
+            Type of the data columns, e.g. "float32" (default: inferred, float64)
+
+        usecols: collection of str, optional
+            Names of the data columns to read (default: all)
+
+        time_window: tuple of (float, float), optional
+            First and last value of the TIME column to read, in hours, both included (default: all)
+    """
+
+    dtype: _tp.Optional[str] = None
+    usecols: _tp.Optional[_abc.Collection[str]] = None
+    time_window: _tp.Optional[tuple[float, float]] = None
+
+
 @_dc.dataclass
 class ReaderBase:
     # ===================================
@@ -18,6 +70,7 @@ class ReaderBase:
     SKIPFOOTER: int = 24
     HEADER: int = 1
     DELIMITER: str = r"\s+"
+    ENGINE: _Engine = "c"
 
     # Pylint complains about these CONSTANTS, because pylint differs with PEP8 on this topic.
     # https://stackoverflow.com/questions/25184097/pylint-invalid-constant-name/51975811#51975811
@@ -29,15 +82,68 @@ class ReaderBase:
         skipfooter: int = SKIPFOOTER,
         header: int = HEADER,
         delimiter: str = DELIMITER,
+        engine: _Engine = ENGINE,
+        options: ReadOptions = ReadOptions(),
     ) -> _pd.DataFrame:
-        """Common read function for all readers"""
+        """Common read function for all readers
+
+        The "c" engine does not support ``skipfooter``.
+        Instead, the footer is cut off before parsing, by scanning backwards from the end of the file.
+        This gives the same result as the "python" engine, while being several times faster.
+
+        If a ``dtype`` like "float32" is given in the ``options``,
+        the data columns are parsed directly into this type, so no float64 copy of them is ever created.
+        The time columns keep their type, as the timestamps are created from them.
+
+        If ``usecols`` is given, only these columns and the time columns are converted and allocated.
+        Columns in it which are not in the file are ignored.
+
+        If a ``time_window`` of (start, end) hours is given, only the rows whose TIME lies within it are parsed.
+        The rows before and after it are cut off before parsing, which is only supported by the "c" engine.
+        """
+        dtypes = _get_column_dtypes(options.dtype)
+        usecols_filter = _get_usecols_filter(options.usecols)
+        if engine == "python":
+            if options.time_window is not None:
+                raise ValueError(
+                    'A time window is only supported by the "c" engine'
+                )
+            return _pd.read_csv(
+                file_path,
+                skipfooter=skipfooter,
+                header=header,
+                delimiter=delimiter,
+                engine="python",
+                dtype=dtypes,
+                usecols=usecols_filter,
+            )
+
+        body = _get_content_without_footer(
+            file_path.read_bytes(), skipfooter, header
+        )
+        if options.time_window is not None:
+            body = _get_content_in_time_window(
+                body, header, *options.time_window
+            )
         df = _pd.read_csv(
-            file_path,
-            skipfooter=skipfooter,
+            _io.BytesIO(body),
             header=header,
             delimiter=delimiter,
-            engine="python",
+            engine=engine,
+            dtype=dtypes,
+            usecols=usecols_filter,
         )
+        if df.empty:
+            # Without rows, e.g. for a time window after the end of the simulation,
+            # the parser cannot infer the types and returns object columns.
+            df = df.astype(
+                {
+                    column: _TIME_COLUMN_DTYPES.get(
+                        column, options.dtype or _np.float64
+                    )
+                    for column in df.columns
+                }
+            )
         return df
 
 
@@ -48,6 +154,7 @@ class PrtReader(ReaderBase):
         hourly_file: _pl.Path,
         starting_year: int = 1990,
         logger: _logging.Logger = log.default_console_logger,
+        options: ReadOptions = ReadOptions(),
     ) -> _pd.DataFrame:
         """Read hourly TRNSYS output data from a file.
 
@@ -59,6 +166,9 @@ class PrtReader(ReaderBase):
             starting_year:
                 Year to use as the start of the simulation (default: 1990)
 
+            options:
+                Type and names of the data columns to read (default: all, inferred type)
+
         Returns
         _______
             df: :class:`pandas.DataFrame`
@@ -70,7 +180,9 @@ class PrtReader(ReaderBase):
         """
         try:
             df = self._process_dataframe(
-                self.read(hourly_file), starting_year, "Period"
+                self.read(hourly_file, options=options),
+                starting_year,
+                "Period",
             )
             self._validate_hourly(df)
             return df
@@ -83,6 +195,7 @@ class PrtReader(ReaderBase):
         monthly_file: _pl.Path,
         starting_year: int = 1990,
         logger: _logging.Logger = log.default_console_logger,
+        options: ReadOptions = ReadOptions(),
     ) -> _pd.DataFrame:
         """Read monthly TRNSYS output data from a file.
 
@@ -94,6 +207,9 @@ class PrtReader(ReaderBase):
             starting_year:
                 Year to use as the start of the simulation (default: 1990)
 
+            options:
+                Type and names of the data columns to read (default: all, inferred type)
+
         Returns
         _______
             df: :class:`pandas.DataFrame`
@@ -106,7 +222,9 @@ class PrtReader(ReaderBase):
         """
         try:
             df = self._process_dataframe(
-                self.read(monthly_file), starting_year, "Month"
+                self.read(monthly_file, options=options),
+                starting_year,
+                "Month",
             )
             self._validate_monthly(df)
             return df
@@ -120,9 +238,53 @@ class PrtReader(ReaderBase):
         starting_year: int = 1990,
         skipfooter=0,
         header=0,
+        options: ReadOptions = ReadOptions(),
+        time_window: _tp.Optional[
+            tuple[_pd.Timestamp | str, _pd.Timestamp | str]
+        ] = None,
     ):
+        """Read step TRNSYS output data from a file.
+
+        Parameters
+        __________
+            step_file:
+                Path to the step TRNSYS output file
+
+            starting_year:
+                Year to use as the start of the simulation (default: 1990)
+
+            skipfooter:
+                Number of lines at the end of the file to skip (default: 0)
+
+            header:
+                Line containing the column names (default: 0)
+
+            options:
+                Type and names of the data columns to read (default: all, inferred type)
+
+            time_window:
+                First and last timestamp to read, both included (default: the time window of ``options``).
+                The rows outside of it are skipped without parsing them.
+
+        Returns
+        _______
+            df: :class:`pandas.DataFrame`
+                DataFrame with step data indexed by timestamp, with the 'TIME' column removed
+        """
+        if time_window is not None:
+            options = _dc.replace(
+                options,
+                time_window=_get_hours_since_start_of_year(
+                    time_window, starting_year
+                ),
+            )
         df = self._process_dataframe(
-            self.read(step_file, skipfooter=skipfooter, header=header),
+            self.read(
+                step_file,
+                skipfooter=skipfooter,
+                header=header,
+                options=options,
+            ),
             starting_year,
             "TIME",
         )
@@ -192,9 +354,7 @@ class PrtReader(ReaderBase):
         _______
             Series of datetime objects with minute intervals
         """
-        minutes = [_dt.timedelta(hours=float(m)) for m in minutes_elapsed]
-        start_of_year = _dt.datetime(day=1, month=1, year=starting_year)
-        return _pd.Series([start_of_year + m for m in minutes])
+        return _create_timestamps_from_hours(minutes_elapsed, starting_year)
 
     def _create_hourly_timestamps(
         self, hours_elapsed: _pd.Series, starting_year: int
@@ -213,9 +373,7 @@ class PrtReader(ReaderBase):
         _______
             Series of datetime objects with hourly intervals
         """
-        hours = [_dt.timedelta(hours=float(h)) for h in hours_elapsed]
-        start_of_year = _dt.datetime(day=1, month=1, year=starting_year)
-        return _pd.Series([start_of_year + h for h in hours])
+        return _create_timestamps_from_hours(hours_elapsed, starting_year)
 
     def _create_monthly_timestamps(
         self, month_names: _pd.Series, year: int = 1990
@@ -234,43 +392,21 @@ class PrtReader(ReaderBase):
         _______
             Series of datetime objects set to the first day of each month
         """
-        month_map = {
-            month: i
-            for i, month in enumerate(
-                [
-                    "January",
-                    "February",
-                    "March",
-                    "April",
-                    "May",
-                    "June",
-                    "July",
-                    "August",
-                    "September",
-                    "October",
-                    "November",
-                    "December",
-                ],
-                1,
-            )
-        }
-
-        # Convert month names to datetime objects with year handling
-        timestamps = []
-        current_year = year
-        previous_month = None
-
-        for name in month_names:
-            current_month = month_map[name.strip()]
-            # Increment year when we see January after December
-            if previous_month == 12 and current_month == 1:
-                current_year += 1
-            timestamps.append(
-                _dt.datetime(year=current_year, month=current_month, day=1)
-            )
-            previous_month = current_month
+        month_map = {month: i for i, month in enumerate(MONTH_NAMES, 1)}
+
+        months = month_names.str.strip().map(month_map)
+        if months.isna().any():
+            unknown_name = month_names[months.isna()].iloc[0].strip()
+            raise KeyError(unknown_name)
 
-        return _pd.Series(timestamps)
+        # Increment year when we see January after December
+        new_year_started = (months.shift() == 12) & (months == 1)
+        years = year + new_year_started.cumsum()
+
+        timestamps = _pd.to_datetime(
+            _pd.DataFrame({"year": years, "month": months, "day": 1})
+        )
+        return _pd.Series(timestamps.to_numpy())
 
     def _validate_hourly(self, df: _pd.DataFrame) -> None:
         """Validate that timestamps are exactly on the hour."""
@@ -315,13 +451,171 @@ class CsvReader(ReaderBase):
     HEADER: int = 0
     DELIMITER: str = ","
 
-    def read_csv(self, csv_file: _pl.Path) -> _pd.DataFrame:
+    def read_csv(
+        self,
+        csv_file: _pl.Path,
+        options: ReadOptions = ReadOptions(),
+    ) -> _pd.DataFrame:
         df = self.read(
             csv_file,
             skipfooter=self.SKIPFOOTER,
             header=self.HEADER,
             delimiter=self.DELIMITER,
+            options=options,
         )
 
         df["Timestamp"] = _pd.to_datetime(df["Timestamp"])
         return df.set_index("Timestamp")
+
+
+def _get_column_dtypes(
+    dtype: _tp.Optional[str],
+) -> _tp.Optional[_abc.Mapping[str, _tp.Any]]:
+    if dtype is None:
+        return None
+    return _collections.defaultdict(lambda: dtype, _TIME_COLUMN_DTYPES)
+
+
+def _get_usecols_filter(
+    usecols: _tp.Optional[_abc.Collection[str]],
+) -> _tp.Optional[_abc.Callable[[str], bool]]:
+    """The parser applies the filter to the column names in the header, so the file is only opened once."""
+    if usecols is None:
+        return None
+    columns_to_read = set(usecols) | _TIME_COLUMN_DTYPES.keys()
+    return lambda column: column in columns_to_read
+
+
+def _get_content_without_footer(
+    content: bytes, skipfooter: int, header: int
+) -> bytes:
+    """Remove the last `skipfooter` lines, e.g. the TRNSYS summary block at the end of printer files.
+
+    Like the "python" engine, the footer never reaches into the header lines.
+    """
+    if skipfooter <= 0:
+        return content
+
+    header_end = _get_header_end(content, header)
+    if header_end < 0:
+        return content
+
+    end = len(content) - 1 if content.endswith(b"\n") else len(content)
+    for _ in range(skipfooter):
+        end = content.rfind(b"\n", header_end, end)
+        if end <= header_end:
+            return content[: header_end + 1]
+
+    return content[: end + 1]
+
+
+def _get_content_in_time_window(
+    content: bytes, header: int, start_hours: float, end_hours: float
+) -> bytes:
+    """Keep the header and the rows whose TIME lies within [start_hours, end_hours].
+
+    The rows are sorted by time, as printed by TRNSYS.
+    The first and last row of the window are found by a binary search over the byte offsets,
+    so only a few dozen lines are split, regardless of the length of the file.
+    """
+    header_end = _get_header_end(content, header)
+    if header_end < 0:
+        return content
+
+    header_start = content.rfind(b"\n", 0, header_end) + 1
+    column_names = content[header_start:header_end].split()
+    try:
+        time_column_index = column_names.index(b"TIME")
+    except ValueError as e:
+        raise ValueError("A time window requires a TIME column") from e
+
+    def get_time(line: bytes) -> float:
+        return float(line.split()[time_column_index])
+
+    data_start = header_end + 1
+    window_start = _find_first_line(
+        content, data_start, lambda line: get_time(line) >= start_hours
+    )
+    window_end = _find_first_line(
+        content, window_start, lambda line: get_time(line) > end_hours
+    )
+    return content[:data_start] + content[window_start:window_end]
+
+
+def _find_first_line(
+    content: bytes, start: int, is_after: _abc.Callable[[bytes], bool]
+) -> int:
+    """Offset of the first line from ``start`` on, for which ``is_after`` is True, or the end of the content.
+
+    ``is_after`` must be False for all lines before this one, and True for all lines after it.
+    """
+    low, high = start, len(content)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = content.rfind(b"\n", low, middle) + 1 or low
+        line_end = content.find(b"\n", middle)
+        if line_end < 0:
+            line_end = len(content)
+        line = content[line_start:line_end]
+        if not line.strip():
+            # Blank line, e.g. at the end of the file.
+            high = line_start
+        elif is_after(line):
+            high = line_start
+        else:
+            low = line_end + 1
+    return min(low, len(content))
+
+
+def _get_header_end(content: bytes, header: int) -> int:
+    """Offset of the line break after the column names, or -1 if there is none."""
+    header_end = -1
+    for _ in range(header + 1):
+        header_end = content.find(b"\n", header_end + 1)
+        if header_end < 0:
+            return -1
+    return header_end
+
+
+def _get_hours_since_start_of_year(
+    time_window: tuple[_pd.Timestamp | str, _pd.Timestamp | str],
+    starting_year: int,
+) -> tuple[float, float]:
+    start_of_year = _pd.Timestamp(day=1, month=1, year=starting_year)
+    start, end = (
+        (_pd.Timestamp(timestamp) - start_of_year) / _pd.Timedelta(hours=1)
+        for timestamp in time_window
+    )
+    return start, end
+
+
+def _create_timestamps_from_hours(
+    hours_elapsed: _pd.Series, starting_year: int
+) -> _pd.Series:
+    """Vectorized equivalent of ``start_of_year + datetime.timedelta(hours=h)`` for each value.
+
+    The integer and fractional hours are converted separately and rounded half to even to microseconds.
+    This is the same rounding as done by :class:`datetime.timedelta`, so the timestamps are identical.
+
+    Raises
+    ______
+        ValueError: If an hour is NaN or infinite, e.g. because the last line of the file is truncated
+    """
+    hours = hours_elapsed.to_numpy(float)
+    is_finite = _np.isfinite(hours)
+    if not is_finite.all():
+        invalid_hour = hours[~is_finite][0]
+        raise ValueError(
+            f"Cannot create a timestamp from {invalid_hour} hours"
+            f" in row {int(_np.argmin(is_finite))}"
+        )
+    fractional_hours, whole_hours = _np.modf(hours)
+    whole_microseconds = whole_hours.astype(_np.int64) * _MICROSECONDS_PER_HOUR
+    fractional_microseconds = _np.rint(
+        fractional_hours * _MICROSECONDS_PER_HOUR
+    ).astype(_np.int64)
+    microseconds = whole_microseconds + fractional_microseconds
+    start_of_year = _pd.Timestamp(day=1, month=1, year=starting_year)
+    return _pd.Series(
+        start_of_year + _pd.to_timedelta(microseconds, unit="us")
+    )
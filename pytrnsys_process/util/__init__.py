@@ -1,9 +1,31 @@
 from pytrnsys_process.util.file_converter import CsvConverter
+from pytrnsys_process.util.file_cache import FileCache
+from pytrnsys_process.util.input_manifest import (
+    FileFingerprint,
+    create_manifest,
+    save_manifest,
+    load_manifest,
+    get_changed_files,
+)
+from pytrnsys_process.util.simulation_cache import (
+    LazySimulation,
+    save_simulation_to_cache,
+    load_simulation_from_cache,
+    load_resolution_from_cache,
+    get_cached_columns,
+    has_float_dtype,
+    TimeWindow,
+)
 from pytrnsys_process.util.utils import (
     get_sim_folders,
     get_files,
     export_plots_in_configured_formats,
+    exporting_plots_in_background,
+    wait_for_plot_exports,
     convert_svg_to_emf,
+    queue_svg_to_emf_conversion,
+    convert_pending_svgs_to_emf,
+    take_pending_svg_to_emf_conversions,
     get_file_content_as_string,
     save_to_pickle,
     load_simulations_data_from_pickle,
@@ -15,9 +37,27 @@ __all__ = [
     "get_sim_folders",
     "get_files",
     "export_plots_in_configured_formats",
+    "exporting_plots_in_background",
+    "wait_for_plot_exports",
     "convert_svg_to_emf",
+    "queue_svg_to_emf_conversion",
+    "convert_pending_svgs_to_emf",
+    "take_pending_svg_to_emf_conversions",
     "get_file_content_as_string",
     "save_to_pickle",
     "load_simulations_data_from_pickle",
     "load_simulation_from_pickle",
+    "save_simulation_to_cache",
+    "load_simulation_from_cache",
+    "load_resolution_from_cache",
+    "get_cached_columns",
+    "has_float_dtype",
+    "TimeWindow",
+    "LazySimulation",
+    "FileFingerprint",
+    "create_manifest",
+    "save_manifest",
+    "load_manifest",
+    "get_changed_files",
+    "FileCache",
 ]
@@ -0,0 +1,131 @@
+"""
+Cache of the DataFrames parsed from the single input files of a simulation.
+
+Every input file is stored as its own Arrow IPC (Feather) file, mirroring the layout of the simulation folder:
+
+| sim-1
+|     ├─ file_cache
+|         ├─ manifest.json
+|         ├─ deck.dck.feather
+|         ├─ temp
+|             ├─ Src_Hr.Prt.feather
+
+When a single printer file changes, only this file needs to be parsed again.
+"""
+
+import collections.abc as _abc
+import logging as _logging
+import pathlib as _pl
+import typing as _tp
+
+import pandas as _pd
+import pyarrow as _pa
+import pyarrow.feather as _feather
+
+from pytrnsys_process import log
+from pytrnsys_process.util import input_manifest as im
+
+_CACHE_FILE_SUFFIX = ".feather"
+
+
+class FileCache:
+    """Load and save the parsed DataFrames of the input files of a single simulation.
+
+    A cached DataFrame is only returned, if its input file did not change since it was cached.
+    Call :meth:`save_manifest` after all files were processed, to make the saved DataFrames available for the next run.
+
+    Parameters
+    __________
+        sim_folder: pathlib.Path
+            Simulation folder containing the input files
+
+        cache_folder: pathlib.Path
+            Folder to store the cached DataFrames in
+
+        manifest: dict of {str, FileFingerprint}
+            Manifest of the current input files, created before they are read.
+            See :func:`pytrnsys_process.util.create_manifest`.
+
+        reuse: bool, default True
+            If False, no cached DataFrames are returned, but the cache is still filled.
+    """
+
+    def __init__(
+        self,
+        sim_folder: _pl.Path,
+        cache_folder: _pl.Path,
+        manifest: _abc.Mapping[str, im.FileFingerprint],
+        reuse: bool = True,
+        logger: _logging.Logger = log.default_console_logger,
+    ):
+        self.sim_folder = sim_folder
+        self.cache_folder = cache_folder
+        self._manifest = manifest
+        self._logger = logger
+        self._unchanged_files = self._get_unchanged_files() if reuse else set()
+        self._cached_files: set[str] = set()
+
+    def load(self, file_path: _pl.Path) -> _tp.Optional[_pd.DataFrame]:
+        """Return the cached DataFrame of an input file, or None if it needs to be read again."""
+        key = self._get_key(file_path)
+        cache_file = self._get_cache_file(key)
+        if key not in self._unchanged_files or not cache_file.exists():
+            return None
+        try:
+            df = _feather.read_feather(cache_file)
+        except (OSError, _pa.ArrowException) as e:
+            self._logger.warning(
+                "Unable to load %s from file cache: %s", key, e
+            )
+            return None
+        self._logger.debug("Loaded %s from file cache", key)
+        self._cached_files.add(key)
+        return df
+
+    def save(self, file_path: _pl.Path, df: _pd.DataFrame) -> None:
+        """Save the DataFrame parsed from an input file. Failing to do so is logged, but not raised."""
+        key = self._get_key(file_path)
+        cache_file = self._get_cache_file(key)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _feather.write_feather(
+                _pa.Table.from_pandas(df),
+                cache_file,
+                compression="uncompressed",
+            )
+        except (OSError, ValueError, _pa.ArrowException) as e:
+            self._logger.warning("Unable to save %s to file cache: %s", key, e)
+            cache_file.unlink(missing_ok=True)
+            return
+        self._cached_files.add(key)
+
+    def save_manifest(self) -> None:
+        """Record the loaded and saved files in the manifest, and remove the cache files of all others."""
+        for cache_file in self.cache_folder.rglob(f"*{_CACHE_FILE_SUFFIX}"):
+            key = cache_file.relative_to(self.cache_folder).as_posix()
+            if key.removesuffix(_CACHE_FILE_SUFFIX) not in self._cached_files:
+                cache_file.unlink()
+
+        manifest = {
+            key: fingerprint
+            for key, fingerprint in self._manifest.items()
+            if key in self._cached_files
+        }
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        im.save_manifest(manifest, self.cache_folder, self._logger)
+
+    def _get_unchanged_files(self) -> set[str]:
+        previous_manifest = im.load_manifest(self.cache_folder)
+        if previous_manifest is None:
+            return set()
+        current_files = [self.sim_folder / key for key in self._manifest]
+        changed_files = im.get_changed_files(
+            self.sim_folder, current_files, previous_manifest
+        )
+        return previous_manifest.keys() - set(changed_files)
+
+    def _get_key(self, file_path: _pl.Path) -> str:
+        return file_path.relative_to(self.sim_folder).as_posix()
+
+    def _get_cache_file(self, key: str) -> _pl.Path:
+        return self.cache_folder / f"{key}{_CACHE_FILE_SUFFIX}"
@@ -0,0 +1,186 @@
+"""
+Manifest of the input files a cached simulation was processed from.
+
+The manifest is stored next to the cached data and records size, modification time
+and optionally a content hash of every input file.
+Comparing it against the files on disk tells whether a simulation needs to be reprocessed.
+
+| sim-1
+|     ├─ simulation_cache
+|         ├─ manifest.json
+"""
+
+import collections.abc as _abc
+import dataclasses as _dc
+import hashlib as _hashlib
+import json as _json
+import logging as _logging
+import pathlib as _pl
+import typing as _tp
+
+from pytrnsys_process import log
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+_MANIFEST_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@_dc.dataclass(frozen=True)
+class FileFingerprint:
+    """Size, modification time and optional content hash of a single input file."""
+
+    size: int
+    mtime_ns: int
+    content_hash: _tp.Optional[str] = None
+
+    @classmethod
+    def from_file(
+        cls, file_path: _pl.Path, hash_content: bool = False
+    ) -> "FileFingerprint":
+        stat = file_path.stat()
+        return cls(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=_hash_file(file_path) if hash_content else None,
+        )
+
+
+def create_manifest(
+    sim_folder: _pl.Path,
+    sim_files: _abc.Sequence[_pl.Path],
+    hash_content: bool = False,
+) -> dict[str, FileFingerprint]:
+    """Create the manifest of the input files of a simulation.
+
+    Parameters
+    __________
+        sim_folder: pathlib.Path
+            Simulation folder, the files are recorded relative to it.
+            This keeps the manifest valid when the results folder is moved.
+
+        sim_files: list of pathlib.Path
+            Input files of the simulation, as returned by :func:`pytrnsys_process.util.get_files`
+
+        hash_content: bool, default False
+            Whether to also record a SHA-256 hash of the file contents.
+
+    Returns
+    _______
+        manifest: dict of {str, FileFingerprint}
+    """
+    return {
+        _get_key(sim_folder, file): FileFingerprint.from_file(
+            file, hash_content
+        )
+        for file in sim_files
+    }
+
+
+def save_manifest(
+    manifest: _abc.Mapping[str, FileFingerprint],
+    cache_folder: _pl.Path,
+    logger: _logging.Logger = log.default_console_logger,
+) -> None:
+    """Save a manifest into the cache folder of a simulation.
+
+    Raises
+    _______
+        OSError: If there's an error when writing the file
+    """
+    content = {
+        "version": _MANIFEST_VERSION,
+        "files": {
+            key: _dc.asdict(fingerprint)
+            for key, fingerprint in sorted(manifest.items())
+        },
+    }
+    try:
+        (cache_folder / MANIFEST_FILE_NAME).write_text(
+            _json.dumps(content, indent=2), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.error("Error saving manifest: %s", e, exc_info=True)
+        raise
+
+
+def load_manifest(
+    cache_folder: _pl.Path,
+) -> _tp.Optional[dict[str, FileFingerprint]]:
+    """Load the manifest from the cache folder of a simulation.
+
+    Returns
+    _______
+        manifest: dict of {str, FileFingerprint}, or None
+            None if there is no readable manifest of the current version.
+    """
+    manifest_file = cache_folder / MANIFEST_FILE_NAME
+    try:
+        content = _json.loads(manifest_file.read_text(encoding="utf-8"))
+        if content["version"] != _MANIFEST_VERSION:
+            return None
+        return {
+            key: FileFingerprint(**fingerprint)
+            for key, fingerprint in content["files"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def get_changed_files(
+    sim_folder: _pl.Path,
+    sim_files: _abc.Sequence[_pl.Path],
+    manifest: _abc.Mapping[str, FileFingerprint],
+) -> list[str]:
+    """Get the input files which were added, removed or modified since the manifest was created.
+
+    Files with a different size are modified.
+    Files with the same size but a different modification time are modified,
+    unless the manifest holds a content hash and the content is still the same.
+    Only these files are hashed, so checking an unchanged simulation never reads its files.
+
+    Parameters
+    __________
+        sim_folder: pathlib.Path
+            Simulation folder the manifest was created for
+
+        sim_files: list of pathlib.Path
+            Current input files of the simulation
+
+        manifest: dict of {str, FileFingerprint}
+            Manifest recorded when the simulation was cached
+
+    Returns
+    _______
+        changed_files: list of str
+            Paths of the changed files relative to the simulation folder, sorted.
+    """
+    current_files = {_get_key(sim_folder, file): file for file in sim_files}
+    changed_files = set(manifest).symmetric_difference(current_files)
+    for key in current_files.keys() & manifest.keys():
+        if _is_modified(current_files[key], manifest[key]):
+            changed_files.add(key)
+    return sorted(changed_files)
+
+
+def _is_modified(file_path: _pl.Path, recorded: FileFingerprint) -> bool:
+    current = FileFingerprint.from_file(file_path)
+    if current.size != recorded.size:
+        return True
+    if current.mtime_ns == recorded.mtime_ns:
+        return False
+    if recorded.content_hash is None:
+        return True
+    return _hash_file(file_path) != recorded.content_hash
+
+
+def _hash_file(file_path: _pl.Path) -> str:
+    file_hash = _hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_key(sim_folder: _pl.Path, file_path: _pl.Path) -> str:
+    return file_path.relative_to(sim_folder).as_posix()
@@ -0,0 +1,393 @@
+"""
+Columnar on-disk cache for processed simulations.
+
+Each simulation is stored in its own cache folder, with one Arrow IPC (Feather) file per resolution:
+
+| sim-1
+|     ├─ simulation_cache
+|         ├─ monthly.feather
+|         ├─ hourly.feather
+|         ├─ step.feather
+|         ├─ scalar.feather
+
+The files are written uncompressed, so they can be memory-mapped when loading.
+Single columns can be loaded without reading the rest of the file,
+and a :class:`LazySimulation` only loads a resolution once it is accessed.
+"""
+
+import collections.abc as _abc
+import logging as _logging
+import pathlib as _pl
+import shutil as _sh
+import typing as _tp
+
+import numpy as _np
+import pandas as _pd
+import pyarrow as _pa
+import pyarrow.compute as _pc
+import pyarrow.feather as _feather
+
+from pytrnsys_process import log
+from pytrnsys_process.process import data_structures as ds
+
+# The functions of pyarrow.compute are generated when it is imported, so pylint cannot find them.
+# pylint: disable=no-member
+
+RESOLUTIONS = ("monthly", "hourly", "step", "scalar")
+TIME_SERIES_RESOLUTIONS = ("monthly", "hourly", "step")
+
+_CACHE_FILE_SUFFIX = ".feather"
+
+# First and last timestamp to load, both included.
+TimeWindow = tuple[
+    _tp.Union[_pd.Timestamp, str], _tp.Union[_pd.Timestamp, str]
+]
+
+
+def save_simulation_to_cache(
+    simulation: ds.Simulation,
+    cache_folder: _pl.Path,
+    logger: _logging.Logger = log.default_console_logger,
+) -> None:
+    """Save a Simulation to a columnar cache folder.
+
+    An existing cache in the folder is replaced.
+    The files are first written to a temporary folder, so an interrupted write never leaves a partial cache behind.
+
+    Parameters
+    __________
+        simulation:
+            Simulation to save
+
+        cache_folder:
+            Folder to save the cache files into
+
+    Raises
+    _______
+        OSError: If there's an error when writing the files
+    """
+    temporary_folder = cache_folder.with_name(f"{cache_folder.name}.tmp")
+    try:
+        _sh.rmtree(temporary_folder, ignore_errors=True)
+        temporary_folder.mkdir(parents=True)
+        for resolution in RESOLUTIONS:
+            df = getattr(simulation, resolution)
+            if df.empty:
+                continue
+            _feather.write_feather(
+                _pa.Table.from_pandas(df),
+                _get_cache_file(temporary_folder, resolution),
+                compression="uncompressed",
+            )
+        _sh.rmtree(cache_folder, ignore_errors=True)
+        temporary_folder.rename(cache_folder)
+    except OSError as e:
+        logger.error("Error saving Simulation to cache: %s", e, exc_info=True)
+        raise
+
+
+def load_simulation_from_cache(
+    cache_folder: _pl.Path,
+    columns: _tp.Optional[_abc.Mapping[str, _abc.Sequence[str]]] = None,
+    logger: _logging.Logger = log.default_console_logger,
+    time_window: _tp.Optional[TimeWindow] = None,
+) -> ds.Simulation:
+    """Load a Simulation from a columnar cache folder.
+
+    Parameters
+    __________
+        cache_folder: pathlib.Path
+            Folder containing the cache files
+
+        columns: dict of {str, list of str}, optional
+            Columns to load per resolution, for example ``{"hourly": ["QSrc1TIn", "QSrc1P"]}``.
+            Only these columns are read from disk.
+            Resolutions not contained in the mapping are loaded completely.
+
+        logger: logging.Logger, optional
+            Logger object that will log any messages, warnings, and/or errors
+
+        time_window: tuple of (timestamp, timestamp), optional
+            First and last timestamp of the step data to load, both included.
+            The monthly and hourly data are loaded completely.
+
+    Returns
+    _______
+        Simulation: :class:`pytrnsys_processing.data_structures.Simulation`
+            Reconstructed Simulation object
+
+    Raises
+    _______
+        OSError: If there's an error reading the files
+        KeyError: If a requested column is not in the cache
+
+    Example
+    _______
+        >>> from pytrnsys_process import api
+        >>> simulation = api.load_simulation_from_cache(
+        ...     sim_folder / "simulation_cache",
+        ...     columns={"hourly": ["QSrc1TIn", "QSrc1P"]},
+        ... )
+    """
+    if not cache_folder.is_dir():
+        raise FileNotFoundError(f"Cache folder not found: {cache_folder}")
+
+    columns = columns or {}
+    frames = {
+        resolution: load_resolution_from_cache(
+            cache_folder,
+            resolution,
+            columns.get(resolution),
+            logger,
+            time_window if resolution == "step" else None,
+        )
+        for resolution in RESOLUTIONS
+    }
+    return ds.Simulation(path=cache_folder.parent.as_posix(), **frames)
+
+
+def load_resolution_from_cache(
+    cache_folder: _pl.Path,
+    resolution: str,
+    columns: _tp.Optional[_abc.Sequence[str]] = None,
+    logger: _logging.Logger = log.default_console_logger,
+    time_window: _tp.Optional[TimeWindow] = None,
+) -> _pd.DataFrame:
+    """Load the DataFrame of a single resolution from a columnar cache folder.
+
+    Parameters
+    __________
+        cache_folder: pathlib.Path
+            Folder containing the cache files
+
+        resolution: str
+            One of 'monthly', 'hourly', 'step' or 'scalar'
+
+        columns: list of str, optional
+            Columns to load. All columns are loaded if not provided.
+
+        time_window: tuple of (timestamp, timestamp), optional
+            First and last timestamp to load, both included.
+            The rows are filtered before they are converted to a DataFrame.
+
+    Returns
+    _______
+        df: :class:`pandas.DataFrame`
+            The cached data, or an empty DataFrame if nothing was cached for this resolution.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Invalid resolution: {resolution}. Must be one of {RESOLUTIONS}"
+        )
+
+    cache_file = _get_cache_file(cache_folder, resolution)
+    if not cache_file.exists():
+        return _pd.DataFrame()
+
+    try:
+        if columns is not None:
+            columns = _with_index_columns(cache_file, columns)
+        table = _feather.read_table(
+            cache_file, columns=columns, memory_map=True
+        )
+        if time_window is not None:
+            table = _filter_time_window(table, time_window)
+        return table.to_pandas()
+    except OSError as e:
+        logger.error(
+            "Error loading %s from cache: %s", cache_file, e, exc_info=True
+        )
+        raise
+
+
+def get_cached_columns(cache_folder: _pl.Path, resolution: str) -> list[str]:
+    """Names of the data columns cached for a resolution, without the index.
+
+    Only the schema of the cache file is read. The list is empty if nothing was cached for this resolution.
+    """
+    cache_file = _get_cache_file(cache_folder, resolution)
+    if not cache_file.exists():
+        return []
+    schema = _read_schema(cache_file)
+    index_columns = set(_get_index_columns(schema))
+    return [name for name in schema.names if name not in index_columns]
+
+
+def has_float_dtype(cache_folder: _pl.Path, dtype: _tp.Optional[str]) -> bool:
+    """Whether the floating point columns of the cached time series have the given type, float64 if None.
+
+    Only the schemas of the cache files are read.
+    """
+    expected_type = _pa.from_numpy_dtype(_np.dtype(dtype or _np.float64))
+    for resolution in TIME_SERIES_RESOLUTIONS:
+        cache_file = _get_cache_file(cache_folder, resolution)
+        if not cache_file.exists():
+            continue
+        try:
+            schema = _read_schema(cache_file)
+        except (OSError, _pa.ArrowException):
+            return False
+        if any(
+            _pa.types.is_floating(field.type) and field.type != expected_type
+            for field in schema
+        ):
+            return False
+    return True
+
+
+def _filter_time_window(
+    table: _pa.Table, time_window: TimeWindow
+) -> _pa.Table:
+    index_columns = _get_index_columns(table.schema)
+    if not index_columns:
+        raise ValueError("A time window requires a timestamp index")
+    timestamps = table[index_columns[0]]
+    start, end = (
+        _pa.scalar(_pd.Timestamp(timestamp), type=timestamps.type)
+        for timestamp in time_window
+    )
+    return table.filter(
+        _pc.and_(
+            _pc.greater_equal(timestamps, start),
+            _pc.less_equal(timestamps, end),
+        )
+    )
+
+
+def _get_cache_file(cache_folder: _pl.Path, resolution: str) -> _pl.Path:
+    return cache_folder / f"{resolution}{_CACHE_FILE_SUFFIX}"
+
+
+def _with_index_columns(
+    cache_file: _pl.Path, columns: _abc.Sequence[str]
+) -> list[str]:
+    """The index is stored as a column, and needs to be loaded as well to be restored."""
+    schema = _read_schema(cache_file)
+    missing_columns = [c for c in columns if c not in schema.names]
+    if missing_columns:
+        raise KeyError(
+            f"Columns not found in {cache_file.name}: {missing_columns}"
+        )
+
+    return [*columns, *_get_index_columns(schema)]
+
+
+def _read_schema(cache_file: _pl.Path) -> _pa.Schema:
+    with _pa.memory_map(str(cache_file)) as source:
+        return _pa.ipc.open_file(source).schema
+
+
+def _get_index_columns(schema: _pa.Schema) -> list[str]:
+    """Stored index columns, a range index is only stored as metadata."""
+    return [
+        c
+        for c in schema.pandas_metadata["index_columns"]
+        if isinstance(c, str)
+    ]
+
+
+class _CachedResolution:
+    """Descriptor loading a resolution of a LazySimulation from the cache on first access."""
+
+    def __init__(self):
+        # Set to the attribute name, when the owning class is created.
+        self.resolution = ""
+
+    def __set_name__(self, owner, name):
+        self.resolution = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # pylint: disable=protected-access
+        if self.resolution not in instance._loaded_frames:
+            frame = load_resolution_from_cache(
+                instance.cache_folder, self.resolution
+            )
+            instance._loaded_frames[self.resolution] = frame
+            instance._cached_shapes[self.resolution] = _get_shape(frame)
+        return instance._loaded_frames[self.resolution]
+
+    def __set__(self, instance, value: _pd.DataFrame):
+        # pylint: disable=protected-access
+        instance._loaded_frames[self.resolution] = value
+        instance._cached_shapes.pop(self.resolution, None)
+
+
+def _get_shape(frame: _pd.DataFrame) -> tuple:
+    """Columns, number of rows and dtypes, to detect frames which changed after loading them."""
+    return tuple(frame.columns), len(frame.index), tuple(frame.dtypes)
+
+
+class LazySimulation(ds.Simulation):
+    """Simulation whose DataFrames are loaded from the simulation cache when they are first accessed.
+
+    It has the same attributes as :class:`pytrnsys_process.api.Simulation`.
+    Loaded resolutions stay in memory until :meth:`evict` is called,
+    modified resolutions until the simulation is deleted.
+    Only the loaded resolutions are pickled.
+
+    Attributes
+    __________
+    path: str
+        Path to the simulation folder containing the input files
+
+    cache_folder: pathlib.Path
+        Folder containing the cache files of this simulation
+    """
+
+    monthly = _CachedResolution()
+    hourly = _CachedResolution()
+    step = _CachedResolution()
+    scalar = _CachedResolution()
+
+    def __init__(
+        self, path: str, cache_folder: _pl.Path
+    ):  # pylint: disable=super-init-not-called
+        self.path = path
+        self.cache_folder = cache_folder
+        self._loaded_frames: dict[str, _pd.DataFrame] = {}
+        # Shapes of the loaded resolutions, which are still the same as in the cache.
+        self._cached_shapes: dict[str, tuple] = {}
+
+    @classmethod
+    def from_simulation(
+        cls, simulation: ds.Simulation, cache_folder: _pl.Path
+    ) -> "LazySimulation":
+        """Wrap an already loaded simulation, which has been saved to the cache folder."""
+        lazy_simulation = cls(simulation.path, cache_folder)
+        for resolution in RESOLUTIONS:
+            frame = getattr(simulation, resolution)
+            setattr(lazy_simulation, resolution, frame)
+            lazy_simulation._cached_shapes[resolution] = _get_shape(frame)
+        return lazy_simulation
+
+    def is_loaded(self, resolution: str) -> bool:
+        return resolution in self._loaded_frames
+
+    def is_modified(self, resolution: str) -> bool:
+        """Whether the resolution was replaced, or columns or rows were added or removed, after loading it."""
+        if resolution not in self._loaded_frames:
+            return False
+        cached_shape = self._cached_shapes.get(resolution)
+        return cached_shape != _get_shape(self._loaded_frames[resolution])
+
+    def evict(
+        self, resolutions: _abc.Sequence[str] = TIME_SERIES_RESOLUTIONS
+    ) -> None:
+        """Release loaded resolutions. They will be loaded from the cache again on the next access.
+
+        Modified resolutions (see :meth:`is_modified`) are kept, so columns added by scenarios are not lost.
+        Values changed in place in existing columns are not detected, they are lost.
+        By default, the scalar values are kept, as they are the place to store calculations.
+        """
+        for resolution in resolutions:
+            if not self.is_modified(resolution):
+                self._loaded_frames.pop(resolution, None)
+                self._cached_shapes.pop(resolution, None)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={self.path!r}, "
+            f"loaded={list(self._loaded_frames)})"
+        )
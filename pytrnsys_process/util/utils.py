@@ -1,10 +1,15 @@
+import atexit as _atexit
 import collections.abc as _abc
+import contextlib as _contextlib
+import io as _io
 import logging as _logging
 import os as _os
 import pathlib as _pl
 import pickle as _pickle
 import subprocess as _subprocess
+import threading as _threading
 import typing as _tp
+from concurrent import futures as _futures
 
 import matplotlib.pyplot as _plt
 
@@ -69,9 +74,20 @@ def get_files(
     return [x for x in sim_files if x.is_file()]
 
 
+_PLOT_EXPORT_STATE = _threading.local()
+_PLOT_EXPORT_LOCK = _threading.Lock()
+_PENDING_PLOT_EXPORTS: list[_futures.Future] = []
+_PLOT_EXPORT_EXECUTOR: _tp.Optional[_futures.ThreadPoolExecutor] = None
+_PLOT_EXPORT_EXECUTOR_KEY: _tp.Optional[tuple[int, int]] = None
+
+_MIN_SVGS_PER_INKSCAPE_PROCESS = 10
+_EMF_CONVERSION_LOCK = _threading.Lock()
+_PENDING_EMF_CONVERSIONS: list[tuple[_pl.Path, bool]] = []
+
+
 def export_plots_in_configured_formats(
     fig: _plt.Figure,
-    path_to_directory: str,
+    path_to_directory: _tp.Union[str, _pl.Path],
     plot_name: str,
     plots_folder_name: str = "plots",
 ) -> None:
@@ -80,6 +96,15 @@ def export_plots_in_configured_formats(
     Saves the figure in all configured formats (png, pdf, emf) and sizes (A4, A4_HALF)
     as specified in the plot settings (api.settings.plot).
     For EMF format, the figure is first saved as SVG and then converted using Inkscape.
+    Inside :func:`exporting_plots_in_background`, the conversion is queued and done for many plots at once,
+    see :func:`convert_pending_svgs_to_emf`.
+
+    The layout of each size is computed once and reused for all formats,
+    each format is still drawn separately by its backend.
+    Inside :func:`exporting_plots_in_background`, e.g. in the scenarios run by the processing functions,
+    a copy of the figure is exported by a background thread,
+    so the figure can be changed or closed right after this call.
+    Figures which can't be copied, e.g. with a lambda as tick formatter, are exported right away.
 
     Parameters
     __________
@@ -100,6 +125,7 @@ def export_plots_in_configured_formats(
         - Creates a 'plots' subdirectory if it doesn't exist
         - For EMF files, requires Inkscape to be installed at the configured path
         - File naming format: {plot_name}-{size_name}.{format}
+        - Set api.settings.plot.export_workers to 0 to always export in the calling thread
 
     Example
     _______
@@ -122,16 +148,175 @@ def export_plots_in_configured_formats(
     plots_folder = _pl.Path(path_to_directory) / plots_folder_name
     plots_folder.mkdir(exist_ok=True)
 
-    for size_name, size in plot_settings.figure_sizes.items():
+    figure_sizes = dict(plot_settings.figure_sizes)
+    file_formats = list(plot_settings.file_formats)
+    is_in_background = getattr(_PLOT_EXPORT_STATE, "is_in_background", False)
+    pickled_figure = None
+    if is_in_background and plot_settings.export_workers >= 1:
+        try:
+            pickled_figure = _pickle_figure_copy(fig)
+        except (_pickle.PicklingError, TypeError, AttributeError):
+            pickled_figure = None
+
+    if pickled_figure is None:
+        _export_figure_in_place(
+            fig, plots_folder, plot_name, figure_sizes, file_formats
+        )
+        if not is_in_background:
+            convert_pending_svgs_to_emf()
+        return
+
+    with _PLOT_EXPORT_LOCK:
+        future = _get_plot_export_executor(
+            plot_settings.export_workers
+        ).submit(
+            _export_figure_copy,
+            pickled_figure,
+            plots_folder,
+            plot_name,
+            figure_sizes,
+            file_formats,
+        )
+        _PENDING_PLOT_EXPORTS.append(future)
+
+
+@_contextlib.contextmanager
+def exporting_plots_in_background() -> _abc.Iterator[None]:
+    """Export the plots of the block in background threads and wait for them at its end.
+
+    Raises
+    ______
+        Exception: The first error raised by an export of the block
+    """
+    was_in_background = getattr(_PLOT_EXPORT_STATE, "is_in_background", False)
+    _PLOT_EXPORT_STATE.is_in_background = True
+    try:
+        yield
+    finally:
+        _PLOT_EXPORT_STATE.is_in_background = was_in_background
+        wait_for_plot_exports()
+
+
+def wait_for_plot_exports() -> None:
+    """Wait until all plots exported in the background are written.
+
+    Raises
+    ______
+        Exception: The first error raised by an export, after all exports finished
+    """
+    with _PLOT_EXPORT_LOCK:
+        pending_exports = list(_PENDING_PLOT_EXPORTS)
+        _PENDING_PLOT_EXPORTS.clear()
+
+    _futures.wait(pending_exports)
+    errors = [
+        error
+        for future in pending_exports
+        if (error := future.exception()) is not None
+    ]
+    if errors:
+        raise errors[0]
+
+
+def _get_plot_export_executor(
+    max_workers: int,
+) -> _futures.ThreadPoolExecutor:
+    global _PLOT_EXPORT_EXECUTOR, _PLOT_EXPORT_EXECUTOR_KEY  # pylint: disable=global-statement
+    # The threads of an executor are not copied into forked worker processes.
+    key = (_os.getpid(), max_workers)
+    if _PLOT_EXPORT_EXECUTOR is None or _PLOT_EXPORT_EXECUTOR_KEY != key:
+        _PLOT_EXPORT_EXECUTOR = _futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="plot-export"
+        )
+        _PLOT_EXPORT_EXECUTOR_KEY = key
+    return _PLOT_EXPORT_EXECUTOR
+
+
+class _FigurePickler(_pickle.Pickler):
+    """Pickles a figure without registering its copy with pyplot, which is not thread safe."""
+
+    def __init__(self, file: _tp.BinaryIO, figure: _plt.Figure):
+        super().__init__(file, protocol=_pickle.HIGHEST_PROTOCOL)
+        self._figure = figure
+
+    def reducer_override(self, obj):
+        if obj is not self._figure:
+            return NotImplemented
+        state = obj.__getstate__()
+        state.pop("_restore_to_pylab", None)
+        return type(obj).__new__, (type(obj),), state
+
+
+def _pickle_figure_copy(fig: _plt.Figure) -> bytes:
+    buffer = _io.BytesIO()
+    _FigurePickler(buffer, fig).dump(fig)
+    return buffer.getvalue()
+
+
+def _export_figure_copy(
+    pickled_figure: bytes,
+    plots_folder: _pl.Path,
+    plot_name: str,
+    figure_sizes: dict[str, tuple[float, float]],
+    file_formats: _abc.Sequence[str],
+) -> None:
+    _export_figure(
+        _pickle.loads(pickled_figure),
+        plots_folder,
+        plot_name,
+        figure_sizes,
+        file_formats,
+    )
+
+
+def _export_figure_in_place(
+    fig: _plt.Figure,
+    plots_folder: _pl.Path,
+    plot_name: str,
+    figure_sizes: dict[str, tuple[float, float]],
+    file_formats: _abc.Sequence[str],
+) -> None:
+    size = tuple(fig.get_size_inches())
+    layout_engine = fig.get_layout_engine()
+    try:
+        _export_figure(
+            fig, plots_folder, plot_name, figure_sizes, file_formats
+        )
+    finally:
+        fig.set_size_inches(size)
+        if layout_engine is not None:
+            fig.set_layout_engine(layout_engine)
+
+
+def _export_figure(
+    fig: _plt.Figure,
+    plots_folder: _pl.Path,
+    plot_name: str,
+    figure_sizes: dict[str, tuple[float, float]],
+    file_formats: _abc.Sequence[str],
+) -> None:
+    layout_engine = fig.get_layout_engine()
+    for size_name, size in figure_sizes.items():
         file_no_suffix = plots_folder / f"{plot_name}-{size_name}"
         fig.set_size_inches(size)
-        for fmt in plot_settings.file_formats:
-            if fmt == ".emf":
-                path_to_svg = file_no_suffix.with_suffix(".svg")
-                fig.savefig(path_to_svg)
-                convert_svg_to_emf(file_no_suffix)
-                if ".svg" not in plot_settings.file_formats:
-                    _os.remove(path_to_svg)
+        if layout_engine is not None:
+            fig.set_layout_engine(layout_engine)
+            # Lay out the figure once, instead of once per format. Each format is still drawn.
+            fig.draw_without_rendering()
+            fig.set_layout_engine("none")
+        path_to_svg = file_no_suffix.with_suffix(".svg")
+        is_svg_saved = False
+        for fmt in file_formats:
+            if fmt in (".svg", ".emf"):
+                # The SVG is written once, also when it is only needed for the EMF.
+                if not is_svg_saved:
+                    fig.savefig(path_to_svg)
+                    is_svg_saved = True
+                if fmt == ".emf":
+                    queue_svg_to_emf_conversion(
+                        file_no_suffix,
+                        shall_remove_svg=".svg" not in file_formats,
+                    )
             else:
                 fig.savefig(file_no_suffix.with_suffix(fmt))
 
@@ -168,6 +353,194 @@ def convert_svg_to_emf(file_no_suffix: _pl.Path) -> None:
         logger.error("System error running Inkscape: %s", e, exc_info=True)
 
 
+def queue_svg_to_emf_conversion(
+    file_no_suffix: _pl.Path, shall_remove_svg: bool = False
+) -> None:
+    """Queue the conversion of an SVG file to EMF.
+
+    The queued files are converted together by :func:`convert_pending_svgs_to_emf`,
+    which the processing functions call whenever enough files are queued and at the end of each batch.
+    Files still queued when Python exits are converted then.
+
+    Parameters
+    __________
+        file_no_suffix:
+            Path to the SVG file without its suffix, the EMF file is written next to it.
+
+        shall_remove_svg:
+            Whether to remove the SVG file after it was converted successfully.
+    """
+    with _EMF_CONVERSION_LOCK:
+        _PENDING_EMF_CONVERSIONS.append((file_no_suffix, shall_remove_svg))
+
+
+def take_pending_svg_to_emf_conversions() -> list[tuple[_pl.Path, bool]]:
+    """Remove all queued conversions from the queue and return them.
+
+    Used to hand the conversions queued in a worker process over to the main process,
+    where they are queued again with :func:`queue_svg_to_emf_conversion`.
+
+    Returns
+    _______
+        conversions: list[tuple[pathlib.Path, bool]]
+            Path to the SVG file without its suffix and whether to remove the SVG file, of each queued conversion
+    """
+    with _EMF_CONVERSION_LOCK:
+        conversions = list(_PENDING_EMF_CONVERSIONS)
+        _PENDING_EMF_CONVERSIONS.clear()
+    return conversions
+
+
+def convert_pending_svgs_to_emf(
+    logger: _logging.Logger = log.default_console_logger,
+    only_if_batch_is_full: bool = False,
+) -> dict[_pl.Path, str]:
+    """Convert all queued SVG files to EMF, using as few Inkscape processes as possible.
+
+    Each Inkscape process runs in shell mode and converts a share of the queued files,
+    so Inkscape is not started once per file.
+    Up to api.settings.plot.inkscape_processes of them run at the same time.
+
+    Parameters
+    __________
+        logger:
+            Logger to which each failed conversion is logged
+
+        only_if_batch_is_full:
+            Only convert if enough files are queued to keep all Inkscape processes busy,
+            otherwise leave the queue as it is.
+
+    Returns
+    _______
+        failures: dict[pathlib.Path, str]
+            Reason of the failure by path of each EMF file that could not be written
+    """
+    plot_settings = conf.global_settings.plot
+    with _EMF_CONVERSION_LOCK:
+        batch_size = (
+            _MIN_SVGS_PER_INKSCAPE_PROCESS * plot_settings.inkscape_processes
+        )
+        if (
+            only_if_batch_is_full
+            and len(_PENDING_EMF_CONVERSIONS) < batch_size
+        ):
+            return {}
+        conversions = list(_PENDING_EMF_CONVERSIONS)
+        _PENDING_EMF_CONVERSIONS.clear()
+    if not conversions:
+        return {}
+
+    n_processes = max(
+        1,
+        min(
+            plot_settings.inkscape_processes,
+            -(-len(conversions) // _MIN_SVGS_PER_INKSCAPE_PROCESS),
+        ),
+    )
+    chunks = [
+        [file_no_suffix for file_no_suffix, _ in conversions[i::n_processes]]
+        for i in range(n_processes)
+    ]
+    failures: dict[_pl.Path, str] = {}
+    with _futures.ThreadPoolExecutor(n_processes) as executor:
+        for chunk_failures in executor.map(
+            lambda chunk: _convert_svgs_to_emf_in_inkscape_shell(
+                plot_settings.inkscape_path, chunk
+            ),
+            chunks,
+        ):
+            failures.update(chunk_failures)
+
+    for emf_path, reason in failures.items():
+        logger.error("Inkscape conversion of %s failed: %s", emf_path, reason)
+    for file_no_suffix, shall_remove_svg in conversions:
+        is_converted = file_no_suffix.with_suffix(".emf") not in failures
+        if shall_remove_svg and is_converted:
+            file_no_suffix.with_suffix(".svg").unlink(missing_ok=True)
+    return failures
+
+
+def _convert_svgs_to_emf_in_inkscape_shell(
+    inkscape_path: str, files_no_suffix: _abc.Sequence[_pl.Path]
+) -> dict[_pl.Path, str]:
+    emf_paths = [
+        file_no_suffix.with_suffix(".emf")
+        for file_no_suffix in files_no_suffix
+    ]
+    # Only the files written by this run count as converted.
+    old_emf_stats = {
+        emf_path: _get_modification_time_and_size(emf_path)
+        for emf_path in emf_paths
+    }
+    commands = "".join(
+        f"file-open:{file_no_suffix.with_suffix('.svg')};"
+        f" export-type:emf; export-filename:{emf_path};"
+        " export-do; file-close\n"
+        for file_no_suffix, emf_path in zip(files_no_suffix, emf_paths)
+    )
+    try:
+        if not _pl.Path(inkscape_path).exists():
+            raise OSError(f"Inkscape executable not found at: {inkscape_path}")
+        completed_process = _subprocess.run(
+            [inkscape_path, "--shell"],
+            input=commands + "quit\n",
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError as e:
+        reason = f"System error running Inkscape: {e}"
+        return {emf_path: reason for emf_path in emf_paths}
+
+    error_lines = completed_process.stderr.strip().splitlines()
+    failures = {}
+    for file_no_suffix, emf_path in zip(files_no_suffix, emf_paths):
+        emf_stat = _get_modification_time_and_size(emf_path)
+        if emf_stat is not None and emf_stat != old_emf_stats[emf_path]:
+            continue
+        file_error_lines = [
+            line for line in error_lines if file_no_suffix.name in line
+        ]
+        failures[emf_path] = "\n".join(
+            [
+                "Inkscape did not write the file,"
+                f" exit code: {completed_process.returncode}",
+                *(file_error_lines or error_lines[-5:]),
+            ]
+        )
+    return failures
+
+
+def _get_modification_time_and_size(
+    path: _pl.Path,
+) -> _tp.Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _finish_plot_exports_at_exit() -> None:
+    with _PLOT_EXPORT_LOCK:
+        pending_exports = list(_PENDING_PLOT_EXPORTS)
+        _PENDING_PLOT_EXPORTS.clear()
+    _futures.wait(pending_exports)
+    for future in pending_exports:
+        if future.exception() is not None:
+            log.default_console_logger.error(
+                "Exporting plot failed: %s",
+                future.exception(),
+                exc_info=future.exception(),
+            )
+    convert_pending_svgs_to_emf()
+
+
+_atexit.register(_finish_plot_exports_at_exit)
+
+
 def get_file_content_as_string(
     file_path: _pl.Path, encoding: _tp.Optional[str] = None
 ) -> str:
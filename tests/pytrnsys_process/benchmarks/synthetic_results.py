@@ -0,0 +1,275 @@
+"""
+Generator of synthetic TRNSYS result sets,
+in the formats of the printers read by :class:`pytrnsys_process.read.PrtReader`.
+
+The size of a result set is controlled by a :class:`ResultSetSpec`:
+
+| results_folder
+|     ├─ sim-0
+|         ├─ sim-0.dck
+|         ├─ temp
+|             ├─ Printer0_Mo.Prt
+|             ├─ Printer0_Hr.Prt
+|             ├─ Printer0_T.Prt
+|     ├─ sim-1
+|     ├─ ...
+
+The first column of the printers of each resolution has the same name and values,
+like columns written by several printers of a real simulation.
+The values are random, but the same for the same spec.
+"""
+
+import dataclasses as _dc
+import pathlib as _pl
+import typing as _tp
+
+import numpy as _np
+
+from pytrnsys_process.read import readers
+
+_HOURS_AT_END_OF_MONTH = (
+    _np.cumsum([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]) * 24.0
+)
+_HOURS_PER_YEAR = 8760
+_LABEL = "\tLabel not available" + " " * 180
+_SUMMARY_BLOCKS = [
+    ("Maximum Instantaneous Values", "Maximum Value", "Time of Maximum"),
+    ("Minimum Instantaneous Values", "Minimum Value", "Time of Minimum"),
+    ("Maximum Integrated Values", "Maximum Value", "Time of Maximum"),
+    ("Minimum Integrated Values", "Minimum Value", "Time of Minimum"),
+]
+
+
+@_dc.dataclass(frozen=True)
+class ResultSetSpec:
+    """Size of a synthetic result set.
+
+    Attributes
+    __________
+        n_simulations: int
+            Number of simulation folders
+
+        n_printers: int
+            Number of printer files per resolution and simulation
+
+        n_columns: int
+            Number of data columns per printer file
+
+        n_hours: int
+            Number of rows of the hourly printers, a full year by default
+
+        n_step_rows: int
+            Number of rows of the step printers
+
+        time_step: float
+            Time step of the step printers in hours
+
+        n_deck_constants: int
+            Number of constants in the deck, the same number of equations is added
+
+        seed: int
+            Seed of the random values
+    """
+
+    n_simulations: int = 2
+    n_printers: int = 2
+    n_columns: int = 20
+    n_hours: int = _HOURS_PER_YEAR
+    n_step_rows: int = 10_000
+    time_step: float = 1 / 6
+    n_deck_constants: int = 100
+    seed: int = 0
+
+
+def write_result_set(
+    results_folder: _pl.Path, spec: ResultSetSpec = ResultSetSpec()
+) -> list[_pl.Path]:
+    """Write a synthetic result set and return its simulation folders."""
+    rng = _np.random.default_rng(spec.seed)
+    sim_folders = []
+    for sim_index in range(spec.n_simulations):
+        sim_folder = results_folder / f"sim-{sim_index}"
+        write_simulation(sim_folder, spec, rng)
+        sim_folders.append(sim_folder)
+    return sim_folders
+
+
+def write_simulation(
+    sim_folder: _pl.Path,
+    spec: ResultSetSpec = ResultSetSpec(),
+    rng: _np.random.Generator | None = None,
+) -> _pl.Path:
+    """Write the printer files and the deck of a single synthetic simulation."""
+    rng = rng if rng is not None else _np.random.default_rng(spec.seed)
+    printer_folder = sim_folder / "temp"
+    printer_folder.mkdir(parents=True, exist_ok=True)
+    shared_monthly = rng.random(len(readers.MONTH_NAMES))
+    shared_hourly = rng.random(spec.n_hours)
+    shared_step = rng.random(spec.n_step_rows)
+    for printer_index in range(spec.n_printers):
+        columns = [
+            f"Printer{printer_index}Var{column_index}"
+            for column_index in range(1, spec.n_columns)
+        ]
+        write_monthly_printer(
+            printer_folder / f"Printer{printer_index}_Mo.Prt",
+            ["QShared", *columns],
+            _with_shared_column(shared_monthly, rng, spec.n_columns),
+        )
+        write_hourly_printer(
+            printer_folder / f"Printer{printer_index}_Hr.Prt",
+            ["TShared", *columns],
+            _with_shared_column(shared_hourly, rng, spec.n_columns),
+        )
+        write_step_printer(
+            printer_folder / f"Printer{printer_index}_T.Prt",
+            ["MShared", *columns],
+            _with_shared_column(shared_step, rng, spec.n_columns),
+            spec.time_step,
+        )
+    write_deck(sim_folder / f"{sim_folder.name}.dck", spec.n_deck_constants)
+    return sim_folder
+
+
+def write_monthly_printer(
+    file_path: _pl.Path, columns: list[str], values: _np.ndarray
+) -> None:
+    """Write a monthly printer file of TRNSYS type 46, with one row per month."""
+    n_months = len(values)
+    months = [
+        readers.MONTH_NAMES[i % len(readers.MONTH_NAMES)]
+        for i in range(n_months)
+    ]
+    hours = _HOURS_AT_END_OF_MONTH[
+        _np.arange(n_months) % len(readers.MONTH_NAMES)
+    ]
+    _write_type_46_printer(file_path, "Month", months, hours, columns, values)
+
+
+def write_hourly_printer(
+    file_path: _pl.Path, columns: list[str], values: _np.ndarray
+) -> None:
+    """Write an hourly printer file of TRNSYS type 46, with one row per hour."""
+    hours = _np.arange(1, len(values) + 1, dtype=float)
+    periods = [f"{int(hour):+8d}" for hour in hours]
+    _write_type_46_printer(
+        file_path, "Period", periods, hours, columns, values
+    )
+
+
+def write_step_printer(
+    file_path: _pl.Path,
+    columns: list[str],
+    values: _np.ndarray,
+    time_step: float,
+) -> None:
+    """Write a step printer file of TRNSYS type 25, as used for mass flow rates and temperatures."""
+    times = _np.arange(len(values)) * time_step
+    header = "".join(f"{name:<25}\t" for name in [" TIME", *columns]).rstrip(
+        "\t"
+    )
+    with open(file_path, "w", encoding="utf-8") as printer_file:
+        printer_file.write(header + "\t\n")
+        rows = _np.column_stack([times, values])
+        _np.savetxt(
+            printer_file,
+            rows,
+            fmt="  %+.16E",
+            delimiter="\t",
+            newline="\t\n",
+        )
+
+
+def write_deck(deck_path: _pl.Path, n_constants: int) -> None:
+    """Write a deck with chained constants and equations, which can all be evaluated."""
+    lines = ["VERSION 17", f"CONSTANTS {n_constants}"]
+    for i in range(n_constants):
+        expression = "1.5" if i == 0 else f"constant{i - 1}*1.01 + {i}"
+        lines.append(f"constant{i} = {expression}")
+    lines.append(f"EQUATIONS {n_constants}")
+    for i in range(n_constants):
+        expression = (
+            f"constant{n_constants - 1} / 2"
+            if i == 0
+            else f"max(equation{i - 1}, constant{i}) - 0.5"
+        )
+        lines.append(f"equation{i} = {expression}")
+    lines.append("END")
+    deck_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _with_shared_column(
+    shared_column: _np.ndarray, rng: _np.random.Generator, n_columns: int
+) -> _np.ndarray:
+    return _np.column_stack(
+        [shared_column, rng.random((len(shared_column), n_columns - 1))]
+    )
+
+
+def _write_type_46_printer(  # pylint: disable=too-many-arguments
+    file_path: _pl.Path,
+    first_column_name: str,
+    first_column: list[str],
+    hours: _np.ndarray,
+    columns: list[str],
+    values: _np.ndarray,
+) -> None:
+    header = f"{first_column_name}\t" + "".join(
+        f"{name:<25}\t" for name in ["TIME", *columns]
+    )
+    rows = _np.column_stack([hours, values])
+    row_format = _get_type_46_row_format(rows.shape[1])
+    with open(file_path, "w", encoding="utf-8") as printer_file:
+        printer_file.write(f" {_LABEL}\n{header}\n")
+        for label, numbers in zip(first_column, _get_type_46_numbers(rows)):
+            printer_file.write(f"{label} \t" + row_format % tuple(numbers))
+        _write_type_46_summary(printer_file, rows, values)
+
+
+def _write_type_46_summary(
+    printer_file: _tp.TextIO, rows: _np.ndarray, values: _np.ndarray
+) -> None:
+    """The summary at the end, which is cut off by the reader."""
+    for title, value_label, time_label in _SUMMARY_BLOCKS:
+        extreme_row = (
+            rows.max(axis=0) if "Maximum" in title else rows.min(axis=0)
+        )
+        time_row = _np.full(len(extreme_row), rows[-1, 0])
+        printer_file.write(f"  \n\t{title}\n{_LABEL}\n")
+        printer_file.write(
+            f"{value_label}\t" + _format_type_46_row(extreme_row)
+        )
+        printer_file.write(f"{time_label}\t" + _format_type_46_row(time_row))
+    printer_file.write(
+        "  \n\tSum (note: sums are set to zero for inputs that were not integrated.)\n"
+        f"{_LABEL}\nTotal\t"
+        + _format_type_46_row(_np.array([0.0, *values.sum(axis=0)]))
+    )
+
+
+def _format_type_46_row(row: _np.ndarray) -> str:
+    return _get_type_46_row_format(len(row)) % tuple(
+        _get_type_46_numbers(row[None])[0]
+    )
+
+
+def _get_type_46_row_format(n_values: int) -> str:
+    # TRNSYS type 46 writes e.g. +0.7301000000000000E+004 for 7301.
+    return " %+.16fE%+04d\t" * n_values + "\n"
+
+
+def _get_type_46_numbers(rows: _np.ndarray) -> _np.ndarray:
+    """Mantissas in [0.1, 1) interleaved with their exponents, to be formatted with the row format."""
+    is_non_zero = rows != 0
+    exponents = _np.zeros_like(rows)
+    _np.log10(_np.abs(rows), where=is_non_zero, out=exponents)
+    exponents = _np.where(is_non_zero, _np.floor(exponents) + 1, 0)
+    mantissas = rows / 10.0**exponents
+    # Rounding of the logarithm can give a mantissa of 1.
+    is_one = _np.abs(mantissas) >= 1
+    mantissas[is_one] /= 10
+    exponents[is_one] += 1
+    numbers = _np.empty((rows.shape[0], 2 * rows.shape[1]))
+    numbers[:, 0::2] = mantissas
+    numbers[:, 1::2] = exponents
+    return numbers
@@ -0,0 +1,179 @@
+"""
+Benchmarks of the processing pipeline on synthetic result sets.
+
+Save a baseline on your machine with ``python dev-tools/dev_tools.py --benchmark save``
+and compare later runs to it with ``python dev-tools/dev_tools.py --benchmark``.
+The unit tests skip the benchmarks.
+"""
+
+import pandas as _pd
+import pytest as _pt
+
+from pytrnsys_process import config, deck, process, read, util
+from pytrnsys_process.config import settings
+from pytrnsys_process.process import process_sim as ps
+from tests.pytrnsys_process.benchmarks import synthetic_results as sr
+
+SPEC = sr.ResultSetSpec(
+    n_simulations=4,
+    n_printers=3,
+    n_columns=20,
+    n_step_rows=20_000,
+    n_deck_constants=200,
+)
+LARGE_DECK_CONSTANTS = 1_000
+
+
+@_pt.fixture(name="sim_folders", scope="module")
+def fixture_sim_folders(tmp_path_factory):
+    return sr.write_result_set(tmp_path_factory.mktemp("results"), SPEC)
+
+
+@_pt.fixture(name="reader_settings")
+def fixture_reader_settings(monkeypatch):
+    monkeypatch.setattr(config.global_settings, "reader", settings.Reader())
+    return config.global_settings.reader
+
+
+class TestBenchmarkReader:
+    def test_read_monthly(self, benchmark, sim_folders):
+        file_path = sim_folders[0] / "temp" / "Printer0_Mo.Prt"
+
+        df = benchmark(read.PrtReader().read_monthly, file_path)
+
+        assert df.shape == (12, SPEC.n_columns)
+
+    def test_read_hourly(self, benchmark, sim_folders):
+        file_path = sim_folders[0] / "temp" / "Printer0_Hr.Prt"
+
+        df = benchmark(read.PrtReader().read_hourly, file_path)
+
+        assert df.shape == (SPEC.n_hours, SPEC.n_columns)
+
+    def test_read_step(self, benchmark, sim_folders):
+        file_path = sim_folders[0] / "temp" / "Printer0_T.Prt"
+
+        df = benchmark(read.PrtReader().read_step, file_path)
+
+        assert df.shape == (SPEC.n_step_rows, SPEC.n_columns)
+
+
+class TestBenchmarkProcessSim:
+    @_pt.mark.parametrize("read_step_files", [False, True])
+    def test_process_sim(
+        self, benchmark, sim_folders, reader_settings, read_step_files
+    ):
+        reader_settings.read_step_files = read_step_files
+        sim_files = util.get_files([sim_folders[0]])
+
+        simulation = benchmark(ps.process_sim, sim_files, sim_folders[0])
+
+        assert simulation.hourly.shape == (
+            SPEC.n_hours,
+            SPEC.n_printers * (SPEC.n_columns - 1) + 1,
+        )
+
+    def test_handle_duplicate_columns(self, benchmark, sim_folders):
+        reader = read.PrtReader()
+        step = _pd.concat(
+            [
+                reader.read_step(step_file)
+                for step_file in sorted(
+                    (sim_folders[0] / "temp").glob("*_T.Prt")
+                )
+            ],
+            axis=1,
+        )
+
+        df = benchmark(ps.handle_duplicate_columns, step)
+
+        assert df.shape == (
+            SPEC.n_step_rows,
+            SPEC.n_printers * (SPEC.n_columns - 1) + 1,
+        )
+
+
+class TestBenchmarkDeck:
+    @_pt.mark.parametrize(
+        "n_constants", [SPEC.n_deck_constants, LARGE_DECK_CONSTANTS]
+    )
+    def test_parse_deck_for_constant_expressions(
+        self, benchmark, tmp_path, n_constants
+    ):
+        deck_path = tmp_path / "deck.dck"
+        sr.write_deck(deck_path, n_constants)
+        deck_as_string = deck_path.read_text()
+
+        values = benchmark(
+            deck.parse_deck_for_constant_expressions, deck_as_string
+        )
+
+        assert len(values) == 2 * n_constants
+
+
+@_pt.fixture(name="simulation", scope="module")
+def fixture_simulation(sim_folders):
+    config.global_settings.reader.read_step_files = True
+    try:
+        return ps.process_sim(util.get_files([sim_folders[0]]), sim_folders[0])
+    finally:
+        config.global_settings.reader.read_step_files = False
+
+
+class TestBenchmarkCache:
+    def test_pickle_round_trip(self, benchmark, simulation, tmp_path):
+        pickle_file = tmp_path / "simulation.pickle"
+
+        def round_trip():
+            util.save_to_pickle(simulation, pickle_file)
+            return util.load_simulation_from_pickle(pickle_file)
+
+        loaded_simulation = benchmark(round_trip)
+
+        _pd.testing.assert_frame_equal(loaded_simulation.step, simulation.step)
+
+    def test_cache_round_trip(self, benchmark, simulation, tmp_path):
+        cache_folder = tmp_path / "simulation_cache"
+
+        def round_trip():
+            util.save_simulation_to_cache(simulation, cache_folder)
+            return util.load_simulation_from_cache(cache_folder)
+
+        loaded_simulation = benchmark(round_trip)
+
+        _pd.testing.assert_frame_equal(
+            loaded_simulation.step, simulation.step, check_freq=False
+        )
+
+
+class TestBenchmarkBatch:
+    @_pt.mark.parametrize("force_reread_prt", [True, False])
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_iterate_whole_result_set(
+        self,
+        benchmark,
+        sim_folders,
+        reader_settings,
+        parallel,
+        force_reread_prt,
+    ):
+        reader_settings.read_step_files = True
+        reader_settings.force_reread_prt = force_reread_prt
+        results_folder = sim_folders[0].parent
+        # Fills the caches, so only the first round of reading them is not measured.
+        list(process.iterate_whole_result_set(results_folder, []))
+
+        results = benchmark.pedantic(
+            lambda: list(
+                process.iterate_whole_result_set(
+                    results_folder,
+                    [],
+                    parallel=parallel,
+                    max_workers=2,
+                    keep_time_series=False,
+                )
+            ),
+            rounds=3,
+        )
+
+        assert len(results) == SPEC.n_simulations
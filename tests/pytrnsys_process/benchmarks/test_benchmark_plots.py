@@ -0,0 +1,76 @@
+import matplotlib.pyplot as _plt
+import pytest as _pt
+
+from pytrnsys_process import read
+from pytrnsys_process.plot import plot_wrappers as plot
+from tests.pytrnsys_process.benchmarks import synthetic_results as sr
+
+SPEC = sr.ResultSetSpec(n_simulations=1, n_printers=1, n_columns=10)
+
+
+@_pt.fixture(name="printer_folder", scope="module")
+def fixture_printer_folder(tmp_path_factory):
+    sim_folder = sr.write_simulation(
+        tmp_path_factory.mktemp("results") / "sim-0", SPEC
+    )
+    return sim_folder / "temp"
+
+
+@_pt.fixture(name="monthly", scope="module")
+def fixture_monthly(printer_folder):
+    return read.PrtReader().read_monthly(printer_folder / "Printer0_Mo.Prt")
+
+
+@_pt.fixture(name="hourly", scope="module")
+def fixture_hourly(printer_folder):
+    return read.PrtReader().read_hourly(printer_folder / "Printer0_Hr.Prt")
+
+
+def _plot_and_close(plot_function, *args, **kwargs):
+    fig, _ = plot_function(*args, **kwargs)
+    fig.canvas.draw()
+    _plt.close(fig)
+
+
+class TestBenchmarkPlotWrappers:
+    def test_line_plot(self, benchmark, hourly):
+        benchmark(
+            _plot_and_close, plot.line_plot, hourly, list(hourly.columns[:5])
+        )
+
+    def test_bar_chart(self, benchmark, monthly):
+        benchmark(
+            _plot_and_close, plot.bar_chart, monthly, list(monthly.columns)
+        )
+
+    def test_stacked_bar_chart(self, benchmark, monthly):
+        benchmark(
+            _plot_and_close,
+            plot.stacked_bar_chart,
+            monthly,
+            list(monthly.columns),
+        )
+
+    def test_histogram(self, benchmark, hourly):
+        benchmark(
+            _plot_and_close, plot.histogram, hourly, list(hourly.columns[:3])
+        )
+
+    def test_energy_balance(self, benchmark, monthly):
+        columns = list(monthly.columns)
+        benchmark(
+            _plot_and_close,
+            plot.energy_balance,
+            monthly,
+            q_in_columns=columns[:5],
+            q_out_columns=columns[5:],
+        )
+
+    def test_scatter_plot(self, benchmark, hourly):
+        benchmark(
+            _plot_and_close,
+            plot.scatter_plot,
+            hourly,
+            hourly.columns[1],
+            hourly.columns[2],
+        )
@@ -0,0 +1,89 @@
+import numpy as _np
+import pandas as _pd
+import pytest as _pt
+
+from pytrnsys_process import deck, read
+from tests.pytrnsys_process.benchmarks import synthetic_results as sr
+
+SPEC = sr.ResultSetSpec(
+    n_simulations=2,
+    n_printers=2,
+    n_columns=5,
+    n_hours=48,
+    n_step_rows=30,
+    time_step=0.25,
+    n_deck_constants=10,
+)
+
+
+@_pt.fixture(name="sim_folders", scope="module")
+def fixture_sim_folders(tmp_path_factory):
+    return sr.write_result_set(tmp_path_factory.mktemp("results"), SPEC)
+
+
+class TestSyntheticResults:
+    def test_result_set_layout(self, sim_folders):
+        assert [sim_folder.name for sim_folder in sim_folders] == [
+            "sim-0",
+            "sim-1",
+        ]
+        for sim_folder in sim_folders:
+            assert sorted(
+                file.name for file in (sim_folder / "temp").iterdir()
+            ) == [
+                "Printer0_Hr.Prt",
+                "Printer0_Mo.Prt",
+                "Printer0_T.Prt",
+                "Printer1_Hr.Prt",
+                "Printer1_Mo.Prt",
+                "Printer1_T.Prt",
+            ]
+            assert (sim_folder / f"{sim_folder.name}.dck").is_file()
+
+    def test_printers_are_read_by_prt_reader(self, sim_folders):
+        printer_folder = sim_folders[0] / "temp"
+        reader = read.PrtReader()
+
+        monthly = reader.read_monthly(printer_folder / "Printer0_Mo.Prt")
+        hourly = reader.read_hourly(printer_folder / "Printer0_Hr.Prt")
+        step = reader.read_step(printer_folder / "Printer0_T.Prt")
+
+        assert monthly.shape == (12, SPEC.n_columns)
+        assert monthly.index[0] == _pd.Timestamp("1990-01-01")
+        assert hourly.shape == (SPEC.n_hours, SPEC.n_columns)
+        assert hourly.index[0] == _pd.Timestamp("1990-01-01 01:00")
+        assert step.shape == (SPEC.n_step_rows, SPEC.n_columns)
+        assert step.index[1] == _pd.Timestamp("1990-01-01 00:15")
+        assert list(step.columns) == ["MShared"] + [
+            f"Printer0Var{i}" for i in range(1, SPEC.n_columns)
+        ]
+
+    def test_shared_columns_are_equal(self, sim_folders):
+        printer_folder = sim_folders[0] / "temp"
+        reader = read.PrtReader()
+
+        hourly_0 = reader.read_hourly(printer_folder / "Printer0_Hr.Prt")
+        hourly_1 = reader.read_hourly(printer_folder / "Printer1_Hr.Prt")
+
+        _pd.testing.assert_series_equal(
+            hourly_0["TShared"], hourly_1["TShared"]
+        )
+        assert not hourly_0["Printer0Var1"].equals(hourly_1["Printer1Var1"])
+
+    def test_type_46_values_keep_their_precision(self, tmp_path):
+        values = _np.array([[0.0, 1.0, -0.99999999999999999, 123456.789]])
+
+        sr.write_hourly_printer(
+            tmp_path / "values_Hr.Prt", ["A", "B", "C", "D"], values
+        )
+
+        hourly = read.PrtReader().read_hourly(tmp_path / "values_Hr.Prt")
+        _np.testing.assert_allclose(hourly.to_numpy(), values, rtol=1e-15)
+
+    def test_deck_can_be_evaluated(self, sim_folders):
+        deck_as_string = (sim_folders[0] / "sim-0.dck").read_text()
+
+        values = deck.parse_deck_for_constant_expressions(deck_as_string)
+
+        assert len(values) == 2 * SPEC.n_deck_constants
+        assert values["constant1"] == _pt.approx(1.5 * 1.01 + 1)
@@ -1,4 +1,6 @@
 import logging as _logging
+import threading as _threading
+from unittest import mock as _mock
 
 from pytrnsys_process import util
 from pytrnsys_process.deck import extractor
@@ -209,6 +211,186 @@ def test_handling_of_visit_error_error(caplog):
     )
 
 
+def test_circular_and_unresolved_references_are_reported_once(caplog):
+    deck_as_string = """\
+CONSTANTS 6
+a = b + 1
+b = c * 2
+c = a
+d = a + 1
+e = [10,1]
+f = e + notDefined
+"""
+    with caplog.at_level(_logging.INFO):
+        result_dict = extractor.parse_deck_for_constant_expressions(
+            deck_as_string
+        )
+
+    assert not result_dict
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelno == _logging.WARNING
+    assert caplog.records[0].getMessage() == (
+        "5 of 5 equations could not be evaluated.\n"
+        "Circular references in or through: a, b, c, d\n"
+        "Unresolved references: f (e, notdefined)"
+    )
+
+
+def test_each_equation_is_evaluated_once():
+    number_of_equations = 100
+    equations = [
+        f"x{i} = x{i + 1} + 1" for i in range(number_of_equations - 1)
+    ]
+    deck_as_string = "\n".join(
+        [f"CONSTANTS {number_of_equations}", *equations, "x99 = 0"]
+    )
+
+    with _mock.patch.object(
+        extractor.EquationsTransformer,
+        "transform",
+        autospec=True,
+        side_effect=extractor.EquationsTransformer.transform,
+    ) as transform:
+        result_dict = extractor.parse_deck_for_constant_expressions(
+            deck_as_string
+        )
+
+    assert transform.call_count == number_of_equations
+    assert result_dict["x0"] == number_of_equations - 1
+
+
+class TestDeckCache:
+    TEMPLATE = """\
+CONSTANTS 3
+a = 2
+b = a * 3
+c = 7
+EQUATIONS 2
+d = b + c
+e = [10,1]
+UNIT 3 TYPE 4
+PARAMETERS 1
+a
+"""
+
+    def test_identical_deck_is_evaluated_once(self, caplog):
+        deck_cache = extractor.DeckCache()
+        deck_as_string = self.TEMPLATE + "EQUATIONS 1\nf = GTWARN(a, 0, 2)\n"
+
+        with _mock.patch.object(
+            extractor.parser,
+            "parse_equations",
+            wraps=extractor.parser.parse_equations,
+        ) as parse_equations:
+            for _ in range(2):
+                caplog.clear()
+                with caplog.at_level(_logging.WARNING):
+                    values = deck_cache.parse_deck_for_constant_expressions(
+                        deck_as_string
+                    )
+                assert "GTWARN is not supported" in caplog.text
+
+        assert parse_equations.call_count == 1
+        assert values == {"a": 2, "b": 6, "c": 7, "d": 13}
+
+    def test_records_of_other_threads_are_not_repeated(self, caplog):
+        deck_cache = extractor.DeckCache()
+        deck_as_string = self.TEMPLATE + "EQUATIONS 1\nf = GTWARN(a, 0, 2)\n"
+        logger = _logging.getLogger("deck_cache_test")
+
+        def parse_equations_while_other_thread_logs(*args, **kwargs):
+            other_thread = _threading.Thread(
+                target=logger.warning, args=("Reading other file",)
+            )
+            other_thread.start()
+            other_thread.join()
+            return parse_equations(*args, **kwargs)
+
+        parse_equations = extractor.parser.parse_equations
+        with _mock.patch.object(
+            extractor.parser,
+            "parse_equations",
+            side_effect=parse_equations_while_other_thread_logs,
+        ):
+            with caplog.at_level(_logging.WARNING):
+                deck_cache.parse_deck_for_constant_expressions(
+                    deck_as_string, logger
+                )
+            assert "Reading other file" in caplog.text
+
+            caplog.clear()
+            with caplog.at_level(_logging.WARNING):
+                deck_cache.parse_deck_for_constant_expressions(
+                    deck_as_string, logger
+                )
+
+        assert "GTWARN is not supported" in caplog.text
+        assert "Reading other file" not in caplog.text
+
+    def test_incremental_evaluates_changed_equations_and_dependents(self):
+        deck_cache = extractor.DeckCache()
+        deck_cache.parse_deck_for_constant_expressions(
+            self.TEMPLATE, incremental=True
+        )
+        sibling = self.TEMPLATE.replace("a = 2", "a = 20.0 ! changed").replace(
+            "PARAMETERS 1\na", "PARAMETERS 1\nb"
+        )
+
+        with _mock.patch.object(
+            extractor.EquationsTransformer,
+            "transform",
+            autospec=True,
+            side_effect=extractor.EquationsTransformer.transform,
+        ) as transform:
+            values = deck_cache.parse_deck_for_constant_expressions(
+                sibling, incremental=True
+            )
+
+        assert values == extractor.parse_deck_for_constant_expressions(sibling)
+        assert values == {"a": 20, "b": 60, "c": 7, "d": 67}
+        # a, b and d, but not c
+        assert transform.call_count == 3
+
+    def test_incremental_logs_errors_of_changed_lines(self, caplog):
+        deck_cache = extractor.DeckCache()
+        deck_cache.parse_deck_for_constant_expressions(
+            self.TEMPLATE, incremental=True
+        )
+        sibling = self.TEMPLATE.replace("a = 2", "a = GTWARN(c, 0, 2)")
+
+        with caplog.at_level(_logging.WARNING):
+            values = deck_cache.parse_deck_for_constant_expressions(
+                sibling, incremental=True
+            )
+
+        assert values == {"c": 7}
+        assert (
+            "On line 2, GTWARN is not supported in a=GTWARN(c, 0, 2)"
+            in caplog.text
+        )
+
+    def test_incremental_with_changed_blocks_parses_whole_deck(self):
+        deck_cache = extractor.DeckCache()
+        deck_cache.parse_deck_for_constant_expressions(
+            self.TEMPLATE, incremental=True
+        )
+        sibling = self.TEMPLATE.replace("CONSTANTS 3", "CONSTANTS 2").replace(
+            "c = 7", "c_unit = 7"
+        )
+
+        with _mock.patch.object(
+            extractor.parser,
+            "parse_equations",
+            wraps=extractor.parser.parse_equations,
+        ) as parse_equations:
+            values = deck_cache.parse_deck_for_constant_expressions(
+                sibling, incremental=True
+            )
+
+        assert parse_equations.call_count == 1
+        assert values == extractor.parse_deck_for_constant_expressions(sibling)
+
+
 def extract_equations_and_compare(deck_as_string, expected_dict):
     result_dict = extractor.parse_deck_for_constant_expressions(deck_as_string)
 
@@ -240,3 +422,43 @@ def test_benchmark_to_extract_solar_prop_ice_slurry_mfs_deck(benchmark):
         extractor.parse_deck_for_constant_expressions(file_content)
 
     benchmark(to_benchmark)
+
+
+def test_benchmark_to_evaluate_chain_of_equations(benchmark):
+    number_of_equations = 3000
+    equations = [
+        f"x{i} = x{i + 1} + 1" for i in range(number_of_equations - 1)
+    ]
+    deck_as_string = "\n".join(
+        [
+            f"CONSTANTS {number_of_equations}",
+            *equations,
+            f"x{number_of_equations - 1} = 0",
+        ]
+    )
+
+    result_dict = benchmark(
+        extractor.parse_deck_for_constant_expressions, deck_as_string
+    )
+
+    assert result_dict["x0"] == number_of_equations - 1
+
+
+def test_benchmark_to_extract_sibling_of_ice_storage_deck(benchmark):
+    file_content = util.get_file_content_as_string(
+        constants.DATA_FOLDER / "deck" / "large_icegrids_example.dck"
+    )
+    sibling = file_content.replace("START=7300.0", "START=0.0")
+    deck_cache = extractor.DeckCache(max_number_of_decks=0)
+    deck_cache.parse_deck_for_constant_expressions(
+        file_content, incremental=True
+    )
+
+    values = benchmark(
+        deck_cache.parse_deck_for_constant_expressions,
+        sibling,
+        incremental=True,
+    )
+
+    assert values == extractor.parse_deck_for_constant_expressions(sibling)
+    assert values["START"] == 0
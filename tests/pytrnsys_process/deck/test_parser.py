@@ -0,0 +1,93 @@
+import pytest as _pt
+
+from pytrnsys_process import util
+from pytrnsys_process.deck import parser
+from tests.pytrnsys_process import constants
+
+DECK_WITH_UNITS = """\
+*******************************
+**BEGIN Head.ddck
+*******************************
+VERSION 17
+CONSTANTS 3
+START = 0
+STOP = 1
+dtSim = 1/30.  ! time step in hours
+
+UNIT 441 TYPE 811 ! Passive Divider for heating
+PARAMETERS 1
+5 !Nb.of iterations before fixing the value
+INPUTS 2
+TPiDivSHCool
+TPiSHInMix
+*** INITIAL INPUT VALUES
+35.0 21.0
+EQUATIONS 2
+xFracDivSH =  1.-[441,5]
+** comment within a block
+dtSim_SI = dtSim * 3600 ! in seconds
+"""
+
+
+def _get_equations(tree):
+    return [
+        (equation, equation.meta.line, equation.meta.start_pos)
+        for equation in tree.find_data("equation")
+    ]
+
+
+def test_parse_equations_is_equal_to_parsing_the_whole_deck():
+    assert _get_equations(
+        parser.parse_equations(DECK_WITH_UNITS)
+    ) == _get_equations(parser.parse_dck(DECK_WITH_UNITS))
+
+
+@_pt.mark.parametrize(
+    "deck_as_string",
+    [
+        "CONSTANTS 2\na = 1 b = 2\n",
+        "CONSTANTS 2\na = 1\n",
+        "CONSTANTS 1 a = 1\n",
+    ],
+)
+def test_parse_equations_falls_back_to_parsing_the_whole_deck(
+    deck_as_string,
+):
+    assert parser.get_equation_lines(deck_as_string) is None
+
+
+def test_parse_equations_falls_back_if_equations_are_not_lalr_compatible():
+    deck_as_string = "CONSTANTS 1\nab-c = 1\nUNIT 3 TYPE 4\n"
+    assert parser.get_equation_lines(deck_as_string)
+
+    assert _get_equations(
+        parser.parse_equations(deck_as_string)
+    ) == _get_equations(parser.parse_dck(deck_as_string))
+
+
+def test_parse_equations_without_equations():
+    assert not _get_equations(parser.parse_equations("VERSION 17\n"))
+
+
+def test_parsers_are_created_once():
+    # Creating the parsers is internal, and not visible through the public functions.
+    # pylint: disable=protected-access
+    assert parser._get_parser() is parser._get_parser()
+    assert parser._get_equations_parser() is parser._get_equations_parser()
+
+
+class TestBenchmarkParser:
+    @_pt.mark.parametrize("parse", [parser.parse_dck, parser.parse_equations])
+    def test_parse_solar_prop_ice_slurry_mfs_deck(self, benchmark, parse):
+        file_content = util.get_file_content_as_string(
+            constants.DATA_FOLDER / "deck" / "SolarPropIceSlurry_mfs.dck"
+        )
+
+        benchmark(parse, file_content)
+
+    def test_parse_equations_of_ice_storage_deck(self, benchmark):
+        file_content = util.get_file_content_as_string(
+            constants.DATA_FOLDER / "deck" / "large_icegrids_example.dck"
+        )
+
+        benchmark(parser.parse_equations, file_content)
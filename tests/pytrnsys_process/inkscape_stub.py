@@ -0,0 +1,54 @@
+"""Stand-in for the Inkscape executable, which understands the actions used to convert SVG files to EMF."""
+
+import pathlib as _pl
+import sys as _sys
+
+_STUB_SOURCE = """
+import pathlib
+import sys
+
+with open(pathlib.Path(__file__).with_name("calls.log"), "a") as calls:
+    calls.write(" ".join(sys.argv[1:]) + "\\n")
+
+for line in sys.stdin:
+    arguments = {}
+    for action in line.split(";"):
+        name, _, value = action.strip().partition(":")
+        arguments[name] = value
+        if name != "export-do":
+            continue
+        svg_path = pathlib.Path(arguments["file-open"])
+        if "broken" in svg_path.name or not svg_path.is_file():
+            print(f"Can't open file: {svg_path}", file=sys.stderr)
+            continue
+        emf_path = pathlib.Path(arguments["export-filename"])
+        emf_path.write_bytes(svg_path.read_bytes())
+"""
+
+
+def create_inkscape_stub(folder: _pl.Path) -> _pl.Path:
+    """Write the stub into the folder and return the path to its executable.
+
+    Each start of the stub is logged as a line in ``calls.log`` in the same folder.
+    """
+    if _sys.platform == "win32":
+        script_path = folder / "inkscape_stub.py"
+        script_path.write_text(_STUB_SOURCE, encoding="utf-8")
+        executable_path = folder / "inkscape.bat"
+        executable_path.write_text(
+            f'@"{_sys.executable}" "{script_path}" %*\n', encoding="utf-8"
+        )
+        return executable_path
+    executable_path = folder / "inkscape"
+    executable_path.write_text(
+        f"#!{_sys.executable}\n{_STUB_SOURCE}", encoding="utf-8"
+    )
+    executable_path.chmod(0o755)
+    return executable_path
+
+
+def get_number_of_starts(inkscape_stub_path: _pl.Path) -> int:
+    calls_log = inkscape_stub_path.with_name("calls.log")
+    if not calls_log.exists():
+        return 0
+    return len(calls_log.read_text(encoding="utf-8").splitlines())
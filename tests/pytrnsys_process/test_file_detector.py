@@ -1,4 +1,5 @@
 import pathlib as _pl
+from unittest.mock import patch
 
 import pytest
 
@@ -115,3 +116,39 @@ class TestFileContentDetection:
             process.get_file_type_using_file_content(timestep_file)
             == conf.FileType.TIMESTEP
         )
+
+    def test_reader_plan_using_file_content(
+        self, monthly_file, hydraulic_file, timestep_file
+    ):
+        assert process.get_reader_plan_using_file_content(
+            monthly_file
+        ) == process.ReaderPlan(conf.FileType.MONTHLY, 1, 24)
+        assert process.get_reader_plan_using_file_content(
+            hydraulic_file
+        ) == process.ReaderPlan(conf.FileType.HYDRAULIC, 0, 0)
+        assert process.get_reader_plan_using_file_content(
+            timestep_file
+        ) == process.ReaderPlan(conf.FileType.TIMESTEP, 1, 23)
+
+    def test_reader_plan_for_step_file_name_of_type_46_printer(
+        self, tmp_path, hydraulic_file
+    ):
+        step_file = tmp_path / "hydraulic_step.prt"
+        step_file.write_bytes(hydraulic_file.read_bytes())
+
+        assert process.get_reader_plan(step_file) == process.ReaderPlan(
+            conf.FileType.HYDRAULIC, 0, 0
+        )
+
+    def test_detect_empty_file_raises(self, tmp_path):
+        empty_file = tmp_path / "empty.prt"
+        empty_file.touch()
+
+        with pytest.raises(ValueError, match="No columns to parse from file"):
+            process.get_reader_plan_using_file_content(empty_file)
+
+    def test_detection_only_parses_first_rows(self, hourly_file):
+        with patch("pytrnsys_process.read.PrtReader.read") as mock_read:
+            process.get_file_type_using_file_content(hourly_file)
+
+        mock_read.assert_not_called()
@@ -0,0 +1,84 @@
+import logging as _logging
+import pathlib as _pl
+from concurrent import futures as _futures
+
+import pytest as _pt
+
+from pytrnsys_process import log
+
+
+def _log_in_worker(sim_folder: _pl.Path) -> None:
+    sim_logger = log.get_simulation_logger(sim_folder)
+    for i in range(3):
+        sim_logger.info("Step %d of %s", i, sim_folder.name)
+    try:
+        raise ValueError("Reading failed")
+    except ValueError:
+        sim_logger.error("Error in %s", sim_folder.name, exc_info=True)
+        log.get_main_logger(sim_folder.parent).error(
+            "Failed to process %s", sim_folder.name, exc_info=True
+        )
+
+
+@_pt.fixture(name="main_logger_without_handlers")
+def fixture_main_logger_without_handlers():
+    """The handlers added by earlier tests would change the records before caplog sees them."""
+    main_logger = _logging.getLogger("main_logger")
+    handlers = list(main_logger.handlers)
+    for handler in handlers:
+        main_logger.removeHandler(handler)
+    yield main_logger
+    for handler in list(main_logger.handlers):
+        main_logger.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        main_logger.addHandler(handler)
+
+
+class TestWorkerLogListener:
+    @_pt.mark.usefixtures("main_logger_without_handlers")
+    def test_records_of_workers_are_written_by_listener(
+        self, tmp_path, caplog
+    ):
+        sim_folders = [tmp_path / f"sim-{i}" for i in range(40)]
+        for sim_folder in sim_folders:
+            sim_folder.mkdir()
+
+        with caplog.at_level(_logging.INFO, logger="main_logger"):
+            with (
+                log.WorkerLogListener() as log_listener,
+                _futures.ProcessPoolExecutor(
+                    max_workers=2,
+                    initializer=log.initialize_worker_logging,
+                    initargs=(log_listener.queue,),
+                ) as executor,
+            ):
+                list(executor.map(_log_in_worker, sim_folders))
+
+        for sim_folder in sim_folders:
+            log_lines = (
+                (sim_folder / "processing.log")
+                .read_text(encoding="utf-8")
+                .splitlines()
+            )
+            assert [line.split(" - ", 2)[2] for line in log_lines[:4]] == [
+                f"Step 0 of {sim_folder.name}",
+                f"Step 1 of {sim_folder.name}",
+                f"Step 2 of {sim_folder.name}",
+                f"Error in {sim_folder.name}",
+            ]
+            assert "ValueError: Reading failed" in log_lines[-1]
+
+        main_records = [
+            record for record in caplog.records if record.name == "main_logger"
+        ]
+        assert sorted(
+            record.getMessage() for record in main_records
+        ) == sorted(
+            f"Failed to process {sim_folder.name}"
+            for sim_folder in sim_folders
+        )
+        assert all(
+            "ValueError: Reading failed" in record.exc_text
+            for record in main_records
+        )
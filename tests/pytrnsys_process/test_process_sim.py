@@ -1,5 +1,8 @@
 import logging as _logging
+import shutil as _sh
+from unittest import mock as _mock
 
+import numpy as _np
 import pandas as _pd
 import pytest as _pt
 
@@ -69,6 +72,48 @@ class TestProcessSim:
         simulation = ps.process_sim(sim_files, PATH_TO_RESULTS)
         assert simulation.scalar.shape == (0, 0)
 
+    def test_process_sim_with_file_cache_rereads_changed_files(self, tmp_path):
+        sim_folder = tmp_path / "sim-1"
+        _sh.copytree(PATH_TO_RESULTS, sim_folder)
+        cache_folder = sim_folder / "file_cache"
+
+        def run_process_sim():
+            # Every file which is not loaded from the cache passes the internal _read_file.
+            # pylint: disable=protected-access
+            sim_files = util.get_files([sim_folder])
+            file_cache = util.FileCache(
+                sim_folder,
+                cache_folder,
+                util.create_manifest(sim_folder, sim_files),
+            )
+            with _mock.patch.object(
+                ps, "_read_file", wraps=ps._read_file
+            ) as read_file:
+                simulation = ps.process_sim(sim_files, sim_folder, file_cache)
+            return simulation, [
+                c.args[0].name for c in read_file.call_args_list
+            ]
+
+        expected_simulation, read_files = run_process_sim()
+        assert len(read_files) == 6
+
+        with open(
+            sim_folder / "temp" / "Src_Hr.Prt", "a", encoding="utf-8"
+        ) as printer_file:
+            printer_file.write("\n")
+        simulation, read_files = run_process_sim()
+
+        assert read_files == ["Src_Hr.Prt"]
+        _pd.testing.assert_frame_equal(
+            simulation.hourly, expected_simulation.hourly
+        )
+        _pd.testing.assert_frame_equal(
+            simulation.monthly, expected_simulation.monthly
+        )
+        _pd.testing.assert_frame_equal(
+            simulation.scalar, expected_simulation.scalar
+        )
+
     def test_process_sim_type_25_step(self, monkeypatch, caplog):
         monkeypatch.setattr(
             "pytrnsys_process.config.global_settings.reader.read_step_files",
@@ -84,6 +129,26 @@ class TestProcessSim:
 
         assert simulation.step.shape == (5, 5)
 
+    def test_process_sim_with_concurrent_reads(self, monkeypatch):
+        monkeypatch.setattr(
+            "pytrnsys_process.config.global_settings.reader.read_step_files",
+            True,
+        )
+        sim_files = util.get_files([PATH_TO_RESULTS], get_mfr_and_t=True)
+        expected_simulation = ps.process_sim(sim_files, PATH_TO_RESULTS)
+
+        monkeypatch.setattr(
+            "pytrnsys_process.config.global_settings.reader.performance.max_read_workers",
+            4,
+        )
+        simulation = ps.process_sim(sim_files, PATH_TO_RESULTS)
+
+        for attribute in ["monthly", "hourly", "step", "scalar"]:
+            _pd.testing.assert_frame_equal(
+                getattr(simulation, attribute),
+                getattr(expected_simulation, attribute),
+            )
+
     @staticmethod
     def do_assert(simulation):
         assert simulation.hourly.shape == (3, 18)
@@ -177,6 +242,77 @@ class TestHandleDuplicateColumns:
         ):
             ps.handle_duplicate_columns(_pd.concat([df1, df2, df3], axis=1))
 
+    def test_handle_without_validation_keeps_first_occurrence(self):
+        df1 = _pd.DataFrame({"A": [1, 2], "B": [3, 4]})
+        df2 = _pd.DataFrame({"A": [None, 3], "C": [5, 6]})
+
+        result = ps.handle_duplicate_columns(
+            _pd.concat([df1, df2], axis=1), validate=False
+        )
+
+        expected = _pd.DataFrame({"A": [1, 2], "B": [3, 4], "C": [5, 6]})
+        _pd.testing.assert_frame_equal(result, expected)
+
+
+class TestGetDfWithoutDuplicates:
+    # The internal merge of process_sim must give the same result as the public handle_duplicate_columns.
+    # pylint: disable=protected-access
+
+    def test_merge_equals_concat_then_deduplicate(self):
+        df1 = _pd.DataFrame({"Period": [1, 2], "Time": [1, 2], "B": [3, 4]})
+        df2 = _pd.DataFrame({"Period": [1, 2], "Time": [1, 2], "C": [5, 6]})
+        df3 = _pd.DataFrame({"Period": [1, 2], "Time": [3, 2], "D": [7, 8]})
+
+        result = ps._get_df_without_duplicates([df1, df2, df3])
+
+        expected = ps.handle_duplicate_columns(
+            _pd.concat([df1, df2, df3], axis=1)
+        )
+        _pd.testing.assert_frame_equal(result, expected)
+
+    def test_merge_with_conflicting_duplicates(self):
+        df1 = _pd.DataFrame({"A": [1, 2], "B": [3, 4]})
+        df2 = _pd.DataFrame({"A": [None, 2], "C": [5, 6]})
+
+        with _pt.raises(
+            ValueError,
+            match="Column 'A' has NaN values in one column while having actual values in another",
+        ):
+            ps._get_df_without_duplicates([df1, df2])
+
+
+class TestBenchmarkHandleDuplicateColumns:
+    @staticmethod
+    def get_step_data_with_duplicates():
+        rng = _np.random.default_rng(0)
+        shared = _pd.DataFrame(
+            rng.random((500_000, 3)), columns=["Time", "TAmb", "IrrHor"]
+        )
+        dfs = [
+            _pd.concat(
+                [
+                    shared,
+                    _pd.DataFrame(
+                        rng.random((500_000, 5)),
+                        columns=[f"Printer{i}Var{j}" for j in range(5)],
+                    ),
+                ],
+                axis=1,
+            )
+            for i in range(4)
+        ]
+        return _pd.concat(dfs, axis=1)
+
+    @_pt.mark.parametrize("validate", [True, False])
+    def test_handle_duplicate_columns(self, benchmark, validate):
+        df = self.get_step_data_with_duplicates()
+
+        result = benchmark(
+            lambda: ps.handle_duplicate_columns(df, validate=validate)
+        )
+
+        assert result.shape == (500_000, 23)
+
 
 class TestBenchmarkProcessSim:
 
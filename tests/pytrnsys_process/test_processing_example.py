@@ -1,10 +1,16 @@
 from examples.ready_to_run import processing_example as pe
+from pytrnsys_process import config as conf
+from tests.pytrnsys_process import inkscape_stub
 
 
-def test_processing_example_is_working_as_expected(caplog, monkeypatch):
+def test_processing_example_is_working_as_expected(
+    caplog, monkeypatch, tmp_path
+):
     monkeypatch.setattr("matplotlib.pyplot.show", lambda: None)
     monkeypatch.setattr(
-        "pytrnsys_process.util.utils.convert_svg_to_emf", lambda x: None
+        conf.global_settings.plot,
+        "inkscape_path",
+        str(inkscape_stub.create_inkscape_stub(tmp_path)),
     )
     pe.main()
 
@@ -1,15 +1,20 @@
+import functools as _ft
+import json as _json
 import logging as _logging
 import pathlib as _pl
+import shutil as _sh
 from unittest import mock as _mock
 
 import matplotlib.pyplot as _plt
 import matplotlib._pylab_helpers as _helpers
+import pandas as _pd
 import pytest as _pt
 
-from pytrnsys_process import process, config
+from pytrnsys_process import process, config, util
 
 # from pytrnsys_process.process import process_batch as pb
 from tests.pytrnsys_process import constants as const
+from tests.pytrnsys_process import inkscape_stub
 
 RESULTS_FOLDER = const.DATA_FOLDER / "processing-functions/results"
 INVALID_RESULTS_FOLDER = (
@@ -23,7 +28,16 @@ def setup():
     pickle_files = RESULTS_FOLDER.rglob("*.pickle")
     for file_path in pickle_files:
         file_path.unlink()
+    (RESULTS_FOLDER / "processing_durations.json").unlink(missing_ok=True)
+    for folder_name in ["simulation_cache", "file_cache"]:
+        for cache_folder in RESULTS_FOLDER.rglob(folder_name):
+            _sh.rmtree(cache_folder)
     config.global_settings.reader.force_reread_prt = False
+    config.global_settings.reader.lazy_loading = False
+    config.global_settings.reader.hash_input_files = False
+    config.global_settings.reader.performance.dtype = None
+    config.global_settings.reader.performance.columns_to_read = None
+    config.global_settings.reader.read_step_files = False
 
 
 def processing_step(
@@ -37,6 +51,10 @@ def processing_step_failing(simulation: process.Simulation):
     raise ValueError("Intentional failure for testing")
 
 
+def processing_step_adding_column(simulation: process.Simulation):
+    simulation.hourly["QSrc1TInTwice"] = simulation.hourly["QSrc1TIn"] * 2
+
+
 def comparison_step(
     simulations_data: process.SimulationsData,
 ):  # pylint: disable=unused-argument
@@ -82,9 +100,9 @@ class TestProcessingFunctions:
         run_with_caplog()
         assert "Processing simulation from raw files" in caplog.text
 
-        # second pass reading from pickle
+        # second pass reading from cache
         run_with_caplog()
-        assert "Loading simulation from pickle file" in caplog.text
+        assert "Loading simulation from cache" in caplog.text
 
         # third pass with force reread
         config.global_settings.reader.force_reread_prt = True
@@ -97,6 +115,60 @@ class TestProcessingFunctions:
         assert sim.step.shape == (0, 0)
         assert sim.scalar["mfrSolverAbsTol"][0] == -4.999999
 
+    def test_process_single_simulation_with_time_window(self, tmp_path):
+        config.global_settings.reader.read_step_files = True
+        sim_folder = tmp_path / "sim-1"
+        _sh.copytree(RESULTS_FOLDER / "sim-1", sim_folder)
+        time_window = (
+            _pd.Timestamp("2024-01-01 00:10"),
+            _pd.Timestamp("2024-01-01 00:30"),
+        )
+
+        sim_from_raw_files = process.process_single_simulation(
+            sim_folder, processing_step, time_window=time_window
+        )
+        assert not (sim_folder / "simulation_cache").exists()
+        sim = process.process_single_simulation(sim_folder, processing_step)
+        sim_from_cache = process.process_single_simulation(
+            sim_folder, processing_step, time_window=time_window
+        )
+
+        expected_step = sim.step.loc[time_window[0] : time_window[1]]
+        assert len(expected_step) == 3
+        _pd.testing.assert_frame_equal(sim_from_raw_files.step, expected_step)
+        _pd.testing.assert_frame_equal(sim_from_cache.step, expected_step)
+        _pd.testing.assert_frame_equal(sim_from_cache.hourly, sim.hourly)
+
+    def test_process_single_simulation_from_pickle_reads_only_requested_data(
+        self, tmp_path
+    ):
+        config.global_settings.reader.read_step_files = True
+        sim_folder = tmp_path / "sim-1"
+        _sh.copytree(RESULTS_FOLDER / "sim-1", sim_folder)
+        sim = process.process_single_simulation(sim_folder, processing_step)
+        # Like a simulation processed by an earlier version.
+        _sh.rmtree(sim_folder / "simulation_cache")
+        util.save_to_pickle(sim, sim_folder / "simulation.pickle")
+        time_window = (
+            _pd.Timestamp("2024-01-01 00:10"),
+            _pd.Timestamp("2024-01-01 00:30"),
+        )
+
+        sim_in_window = process.process_single_simulation(
+            sim_folder, processing_step, time_window=time_window
+        )
+        config.global_settings.reader.performance.columns_to_read = [
+            "QSrc1TIn"
+        ]
+        sim_with_columns = process.process_single_simulation(
+            sim_folder, processing_step
+        )
+
+        _pd.testing.assert_frame_equal(
+            sim_in_window.step, sim.step.loc[time_window[0] : time_window[1]]
+        )
+        assert sim_with_columns.hourly.columns.tolist() == ["QSrc1TIn"]
+
     def test_process_whole_result_set(self, caplog):
         def run_with_caplog():
             caplog.clear()
@@ -109,9 +181,9 @@ class TestProcessingFunctions:
         run_with_caplog()
         assert caplog.text.count("Processing simulation from raw files") == 2
 
-        # second pass reading from pickle
+        # second pass reading from cache
         run_with_caplog()
-        assert caplog.text.count("Loading simulation from pickle file") == 2
+        assert caplog.text.count("Loading simulation from cache") == 2
 
         # third pass with force reread
         config.global_settings.reader.force_reread_prt = True
@@ -120,6 +192,148 @@ class TestProcessingFunctions:
 
         self.assert_for_whole_result_set(simulations_data)
 
+    def test_process_whole_result_set_reprocesses_changed_simulations(
+        self, tmp_path, caplog
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+
+        def run_with_caplog():
+            caplog.clear()
+            with caplog.at_level(_logging.INFO):
+                return process.process_whole_result_set(
+                    results_folder, processing_step
+                )
+
+        run_with_caplog()
+        assert caplog.text.count("Processing simulation from raw files") == 2
+
+        with open(
+            results_folder / "sim-2" / "deck.dck", "a", encoding="utf-8"
+        ) as deck:
+            deck.write("\n")
+        simulations_data = run_with_caplog()
+        assert caplog.text.count("Loading simulation from cache") == 1
+        assert caplog.text.count("Processing simulation from raw files") == 1
+        assert "Input files changed since caching: deck.dck" in caplog.text
+        self.assert_for_whole_result_set(simulations_data)
+
+    def test_process_whole_result_set_ignores_touched_files_with_hash(
+        self, tmp_path, caplog
+    ):
+        config.global_settings.reader.hash_input_files = True
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+        process.process_whole_result_set(results_folder, processing_step)
+
+        (results_folder / "sim-1" / "temp" / "Src_Hr.Prt").touch()
+        with caplog.at_level(_logging.INFO):
+            process.process_whole_result_set(results_folder, processing_step)
+        assert caplog.text.count("Loading simulation from cache") == 2
+
+    def test_process_whole_result_set_rereads_cache_of_other_dtype(
+        self, tmp_path, caplog
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+        process.process_whole_result_set(results_folder, processing_step)
+
+        config.global_settings.reader.performance.dtype = "float32"
+        with caplog.at_level(_logging.INFO):
+            simulations_data = process.process_whole_result_set(
+                results_folder, processing_step
+            )
+
+        assert caplog.text.count("Cache was not stored as float32") == 2
+        for simulation in simulations_data.simulations.values():
+            assert (simulation.hourly.dtypes == "float32").all()
+            assert (simulation.monthly.dtypes == "float32").all()
+
+    def test_process_whole_result_set_reads_only_requested_columns(
+        self, tmp_path
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+
+        simulations_data = process.process_whole_result_set_parallel(
+            results_folder, processing_step, columns_to_read=["QSrc1TIn"]
+        )
+
+        simulation = simulations_data.simulations["sim-1"]
+        assert simulation.hourly.columns.tolist() == ["QSrc1TIn"]
+        assert simulation.monthly.empty
+        assert not simulation.scalar.empty
+        assert not list(results_folder.rglob("simulation_cache"))
+
+    def test_process_whole_result_set_reads_only_requested_columns_from_cache(
+        self, tmp_path, caplog
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+        from_raw_files = process.process_whole_result_set(
+            results_folder, processing_step, columns_to_read=["QSrc1TIn"]
+        ).simulations["sim-1"]
+        process.process_whole_result_set(results_folder, processing_step)
+
+        with caplog.at_level(_logging.INFO):
+            simulations_data = process.process_whole_result_set(
+                results_folder, processing_step, columns_to_read=["QSrc1TIn"]
+            )
+
+        assert caplog.text.count("Loading simulation from cache") == 2
+        simulation = simulations_data.simulations["sim-1"]
+        assert simulation.hourly.columns.tolist() == ["QSrc1TIn"]
+        _pd.testing.assert_frame_equal(
+            simulation.hourly, from_raw_files.hourly, check_freq=False
+        )
+        assert simulation.monthly.columns.empty
+        assert not simulation.scalar.empty
+
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_iterate_whole_result_set(self, parallel):
+        simulations_data = process.process_whole_result_set(
+            RESULTS_FOLDER, processing_step
+        )
+
+        results = list(
+            process.iterate_whole_result_set(
+                RESULTS_FOLDER,
+                [processing_step, processing_step_failing],
+                parallel=parallel,
+            )
+        )
+
+        assert sorted(sim_name for sim_name, _, _ in results) == sorted(
+            simulations_data.simulations
+        )
+        for sim_name, simulation, failed_scenarios in results:
+            assert failed_scenarios == ["processing_step_failing"]
+            _pd.testing.assert_frame_equal(
+                simulation.hourly,
+                simulations_data.simulations[sim_name].hourly,
+                check_freq=False,
+            )
+
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_iterate_whole_result_set_without_time_series(self, parallel):
+        simulations_data = process.process_whole_result_set(
+            RESULTS_FOLDER, processing_step
+        )
+
+        for sim_name, simulation, _ in process.iterate_whole_result_set(
+            RESULTS_FOLDER,
+            processing_step,
+            parallel=parallel,
+            keep_time_series=False,
+        ):
+            assert simulation.monthly.empty
+            assert simulation.hourly.empty
+            assert simulation.step.empty
+            _pd.testing.assert_frame_equal(
+                simulation.scalar,
+                simulations_data.simulations[sim_name].scalar,
+            )
+
     def test_process_whole_result_set_parallel(self, monkeypatch):
         # Caplog and monkeypatch don't support multiprocessing in spawn mode :/
         # This is a cheap workaround
@@ -179,6 +393,63 @@ class TestProcessingFunctions:
     #     assert len(results.simulations) == 0
     #     assert results.scalar.empty
 
+    def test_process_whole_result_set_with_lazy_loading(self):
+        config.global_settings.reader.lazy_loading = True
+        loaded_resolutions = []
+
+        def comparison_step_using_monthly(
+            simulations_data: process.SimulationsData,
+        ):
+            for simulation in simulations_data.simulations.values():
+                assert isinstance(simulation, util.LazySimulation)
+                assert not simulation.is_loaded("monthly")
+                assert not simulation.monthly.empty
+                loaded_resolutions.append(
+                    [
+                        resolution
+                        for resolution in ["monthly", "hourly", "step"]
+                        if simulation.is_loaded(resolution)
+                    ]
+                )
+
+        # first pass reading from raw files, second pass from cache
+        for _ in range(2):
+            simulations_data = process.process_whole_result_set(
+                RESULTS_FOLDER, [processing_step, processing_step_failing]
+            )
+            self.assert_for_whole_result_set(simulations_data)
+
+        process.do_comparison(
+            comparison_step_using_monthly, results_folder=RESULTS_FOLDER
+        )
+        assert loaded_resolutions == [["monthly"], ["monthly"]]
+
+    def test_lazy_loading_keeps_columns_added_by_scenarios(self):
+        config.global_settings.reader.lazy_loading = True
+
+        def comparison_step_using_added_column(
+            simulations_data: process.SimulationsData,
+        ):
+            hourly = simulations_data.simulations["sim-1"].hourly
+            _pd.testing.assert_series_equal(
+                hourly["QSrc1TInTwice"],
+                hourly["QSrc1TIn"] * 2,
+                check_names=False,
+            )
+
+        # first pass reading from raw files, second pass from cache
+        for _ in range(2):
+            simulations_data = process.process_whole_result_set(
+                RESULTS_FOLDER, processing_step_adding_column
+            )
+            process.do_comparison(
+                [comparison_step_using_added_column] * 2,
+                simulations_data=simulations_data,
+            )
+            assert "QSrc1TInTwice" in (
+                simulations_data.simulations["sim-1"].hourly
+            )
+
     def test_do_comparison_with_existing_results_for_comparison(self):
         results = process.process_whole_result_set(
             RESULTS_FOLDER, processing_step
@@ -210,6 +481,138 @@ class TestProcessingFunctions:
         )
 
 
+class TestWorkerPool:
+
+    def test_worker_pool_is_reused(self, caplog):
+        caplog.set_level(_logging.INFO)
+        simulations_data = process.process_whole_result_set(
+            RESULTS_FOLDER, processing_step
+        )
+
+        with process.WorkerPool(max_workers=2) as worker_pool:
+            assert "Started 2 worker processes" in caplog.text
+            executor = worker_pool.executor
+            parallel_simulations_data = (
+                process.process_whole_result_set_parallel(
+                    RESULTS_FOLDER, processing_step, worker_pool=worker_pool
+                )
+            )
+            config.global_settings.reader.lazy_loading = True
+            config.global_settings.reader.force_reread_prt = True
+            compared_simulations_data = process.do_comparison(
+                comparison_step,
+                results_folder=RESULTS_FOLDER,
+                worker_pool=worker_pool,
+            )
+            assert worker_pool.executor is executor
+
+        assert not worker_pool.is_running
+        _pd.testing.assert_frame_equal(
+            parallel_simulations_data.scalar.sort_index(),
+            simulations_data.scalar.sort_index(),
+        )
+        # Settings changed after starting the pool are used by its workers.
+        for simulation in compared_simulations_data.simulations.values():
+            assert isinstance(simulation, util.LazySimulation)
+
+    def test_worker_pool_must_be_running(self):
+        worker_pool = process.WorkerPool(max_workers=1)
+        with _pt.raises(RuntimeError):
+            process.process_whole_result_set_parallel(
+                RESULTS_FOLDER, processing_step, worker_pool=worker_pool
+            )
+
+
+class TestProcessingTimings:
+
+    def test_process_whole_result_set_parallel_records_durations(self):
+        simulations_data = process.process_whole_result_set_parallel(
+            RESULTS_FOLDER, processing_step, max_memory=1
+        )
+
+        durations = _json.loads(
+            (RESULTS_FOLDER / "processing_durations.json").read_text()
+        )
+        assert sorted(durations) == sorted(simulations_data.simulations)
+
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_iterate_whole_result_set_records_stage_timings(
+        self, tmp_path, parallel
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER / "sim-1", results_folder / "sim-1")
+
+        list(
+            process.iterate_whole_result_set(
+                results_folder, processing_step, parallel=parallel
+            )
+        )
+
+        timings = _pd.read_csv(
+            results_folder / "sim-1" / "processing_timings.csv"
+        )
+        assert set(timings["simulation"]) == {"sim-1"}
+        assert {
+            "get_files",
+            "check_cache",
+            "detect_file_type",
+            "read_file",
+            "parse_deck",
+            "merge",
+            "save_cache",
+            "scenario",
+        } <= set(timings["stage"])
+        read_files = timings[timings["stage"] == "read_file"]
+        assert "Src_Hr.Prt" in set(read_files["detail"])
+        assert (read_files["bytes_read"] > 0).all()
+        assert (timings["wall_time"] >= 0).all()
+        assert (timings["cpu_time"] >= 0).all()
+        scenarios = timings[timings["stage"] == "scenario"]
+        assert list(scenarios["detail"]) == ["processing_step"]
+
+    def test_process_single_simulation_writes_reports_to_its_folder(
+        self, tmp_path
+    ):
+        sim_folder = tmp_path / "sim-1"
+        _sh.copytree(RESULTS_FOLDER / "sim-1", sim_folder)
+
+        with process.WorkerPool(max_workers=1) as worker_pool:
+            process.process_single_simulation(
+                sim_folder, processing_step, worker_pool=worker_pool
+            )
+
+        timings = _pd.read_csv(sim_folder / "processing_timings.csv")
+        assert set(timings["simulation"]) == {"sim-1"}
+        assert not (tmp_path / "processing_timings.csv").exists()
+        assert not (tmp_path / "processing_durations.json").exists()
+
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_iterate_whole_result_set_records_timings_when_stopped_early(
+        self, tmp_path, parallel
+    ):
+        results_folder = tmp_path / "results"
+        _sh.copytree(RESULTS_FOLDER, results_folder)
+
+        sim_name, _, _ = next(
+            process.iterate_whole_result_set(
+                results_folder,
+                processing_step,
+                parallel=parallel,
+                max_memory=1,
+            )
+        )
+
+        timings = _pd.read_csv(
+            results_folder / sim_name / "processing_timings.csv"
+        )
+        assert set(timings["simulation"]) == {sim_name}
+        durations_file = results_folder / "processing_durations.json"
+        if parallel:
+            assert sim_name in _json.loads(durations_file.read_text())
+        else:
+            assert not durations_file.exists()
+
+
 # pylint: disable=unused-argument
 def processing_step_with_figure(simulation: process.Simulation):
     """Used to check whether figures are closed automatically
@@ -309,6 +712,90 @@ class TestProcessingClosesFigures:
         assert "Some windows are still active." not in caplog.text
 
 
+def processing_step_exporting_plot(
+    plots_folder: _pl.Path, simulation: process.Simulation
+):
+    fig, _ = _plt.subplots()
+    util.export_plots_in_configured_formats(
+        fig, plots_folder, _pl.Path(simulation.path).name, ""
+    )
+
+
+class TestProcessingWaitsForPlotExports:
+    @staticmethod
+    def _get_step_exporting_plot(plots_folder: _pl.Path):
+        # A partial of a module level function, so it can be sent to worker processes.
+        return _ft.update_wrapper(
+            _ft.partial(processing_step_exporting_plot, plots_folder),
+            processing_step_exporting_plot,
+        )
+
+    def test_plots_are_written_when_simulation_is_done(
+        self, tmp_path, monkeypatch
+    ):
+        inkscape_path = inkscape_stub.create_inkscape_stub(tmp_path)
+        monkeypatch.setattr(
+            config.global_settings.plot, "inkscape_path", str(inkscape_path)
+        )
+        plots_folder = tmp_path / "plots"
+        plots_folder.mkdir()
+
+        simulation = process.process_single_simulation(
+            RESULTS_FOLDER / "sim-1",
+            [self._get_step_exporting_plot(plots_folder)] * 2,
+        )
+
+        assert not simulation.monthly.empty
+        assert sorted(file.name for file in plots_folder.iterdir()) == [
+            "sim-1-A4.emf",
+            "sim-1-A4.pdf",
+            "sim-1-A4.png",
+            "sim-1-A4_HALF.emf",
+            "sim-1-A4_HALF.pdf",
+            "sim-1-A4_HALF.png",
+        ]
+        # The EMF files of all scenarios are converted together.
+        assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+
+    @_pt.mark.parametrize("parallel", [False, True])
+    def test_plots_of_batch_are_converted_to_emf_together(
+        self, tmp_path, monkeypatch, parallel
+    ):
+        inkscape_path = inkscape_stub.create_inkscape_stub(tmp_path)
+        monkeypatch.setattr(
+            config.global_settings.plot, "inkscape_path", str(inkscape_path)
+        )
+        plots_folder = tmp_path / "plots"
+        plots_folder.mkdir()
+
+        results = list(
+            process.iterate_whole_result_set(
+                RESULTS_FOLDER,
+                self._get_step_exporting_plot(plots_folder),
+                parallel=parallel,
+            )
+        )
+
+        assert len(results) > 1
+        assert len(list(plots_folder.glob("*.emf"))) == 2 * len(results)
+        assert not list(plots_folder.glob("*.svg"))
+        assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+
+    def test_failed_export_fails_scenario(self, tmp_path):
+        with _mock.patch(
+            "pytrnsys_process.util.utils.queue_svg_to_emf_conversion",
+            side_effect=OSError("disk full"),
+        ):
+            results = list(
+                process.iterate_whole_result_set(
+                    RESULTS_FOLDER, self._get_step_exporting_plot(tmp_path)
+                )
+            )
+
+        for _, _, failed_scenarios in results:
+            assert failed_scenarios == ["processing_step_exporting_plot"]
+
+
 class TestBenchmarkPytrnsysProcess:
     def test_benchmark_process_whole_result_set(self, benchmark):
         benchmark(
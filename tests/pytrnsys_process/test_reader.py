@@ -1,4 +1,8 @@
+import datetime as _dt
+
+import numpy as _np
 import pandas as _pd
+import pytest as _pt
 
 import tests.pytrnsys_process.constants as test_const
 from pytrnsys_process import read
@@ -76,6 +80,137 @@ class TestReader:
 
         _pd.testing.assert_frame_equal(actual_df, expected_df)
 
+    @_pt.mark.parametrize(
+        "file_path, skipfooter, header",
+        [
+            (HOURLY_DIR_PATH / "Src_Hr.Prt", 24, 1),
+            (MONTHLY_DIR_PATH / "PCM_MO.Prt", 24, 1),
+            (STEP_DIR_PATH / "actual_dt.Prt", 0, 0),
+            (STEP_DIR_PATH / "sink_storage_temperatures_step.prt", 23, 1),
+        ],
+    )
+    def test_c_engine_matches_python_engine(
+        self, file_path, skipfooter, header
+    ):
+        reader = read.PrtReader()
+        expected_df = reader.read(
+            file_path, skipfooter=skipfooter, header=header, engine="python"
+        )
+        actual_df = reader.read(
+            file_path, skipfooter=skipfooter, header=header, engine="c"
+        )
+
+        _pd.testing.assert_frame_equal(actual_df, expected_df)
+
+    def test_read_hourly_as_float32(self):
+        hourly_file_path = self.HOURLY_DIR_PATH / "Src_Hr.Prt"
+        expected_df = read.PrtReader().read_hourly(hourly_file_path)
+
+        actual_df = read.PrtReader().read_hourly(
+            hourly_file_path, options=read.ReadOptions(dtype="float32")
+        )
+
+        assert (actual_df.dtypes == _np.float32).all()
+        _pd.testing.assert_frame_equal(
+            actual_df, expected_df.astype("float32")
+        )
+
+    def test_read_hourly_only_requested_columns(self):
+        hourly_file_path = self.HOURLY_DIR_PATH / "Src_Hr.Prt"
+        expected_df = read.PrtReader().read_hourly(hourly_file_path)
+        columns_to_read = expected_df.columns[[3, 1]].tolist()
+
+        actual_df = read.PrtReader().read_hourly(
+            hourly_file_path,
+            options=read.ReadOptions(
+                usecols=[*columns_to_read, "not-a-column"]
+            ),
+        )
+
+        # The columns keep the order of the file.
+        _pd.testing.assert_frame_equal(
+            actual_df, expected_df[columns_to_read[::-1]]
+        )
+
+    @_pt.mark.parametrize(
+        "start, end",
+        [
+            ("1990-01-01 00:10", "1990-01-01 01:00"),
+            ("1990-01-01 00:00", "1990-01-01 00:00"),
+            ("1989-01-01", "1991-01-01"),
+        ],
+    )
+    def test_read_step_in_time_window(self, start, end):
+        step_file_path = self.STEP_DIR_PATH / "actual_dt.Prt"
+        expected_df = read.PrtReader().read_step(step_file_path)
+
+        actual_df = read.PrtReader().read_step(
+            step_file_path, time_window=(start, end)
+        )
+
+        _pd.testing.assert_frame_equal(
+            actual_df,
+            expected_df[
+                (expected_df.index >= _pd.Timestamp(start))
+                & (expected_df.index <= _pd.Timestamp(end))
+            ],
+        )
+
+    def test_read_step_outside_time_window(self):
+        step_file_path = self.STEP_DIR_PATH / "actual_dt.Prt"
+        expected_df = read.PrtReader().read_step(step_file_path)
+
+        actual_df = read.PrtReader().read_step(
+            step_file_path, time_window=("1991-01-01", "1992-01-01")
+        )
+
+        assert actual_df.empty
+        _pd.testing.assert_series_equal(actual_df.dtypes, expected_df.dtypes)
+
+    def test_create_step_timestamps_matches_timedelta(self):
+        hours_elapsed = _pd.Series(
+            _np.random.default_rng(0).uniform(0, 8760, 10_000)
+        )
+        start_of_year = _dt.datetime(day=1, month=1, year=2024)
+        expected = _pd.Series(
+            [start_of_year + _dt.timedelta(hours=h) for h in hours_elapsed]
+        )
+
+        actual = read.PrtReader()._create_step_timestamps(  # pylint: disable=protected-access
+            hours_elapsed, 2024
+        )
+
+        _pd.testing.assert_series_equal(actual, expected)
+
+    @_pt.mark.parametrize("invalid_hour", [_np.nan, _np.inf])
+    def test_create_step_timestamps_raises_for_invalid_hours(
+        self, invalid_hour
+    ):
+        hours_elapsed = _pd.Series([0.0, 0.5, invalid_hour])
+
+        with _pt.raises(ValueError, match="row 2"):
+            read.PrtReader()._create_step_timestamps(  # pylint: disable=protected-access
+                hours_elapsed, 2024
+            )
+
+    def test_create_monthly_timestamps_with_year_rollover(self):
+        month_names = _pd.Series(["November ", "December ", "January "])
+
+        actual = read.PrtReader()._create_monthly_timestamps(  # pylint: disable=protected-access
+            month_names, 1990
+        )
+
+        expected = _pd.Series(
+            _pd.to_datetime(["1990-11-01", "1990-12-01", "1991-01-01"])
+        )
+        _pd.testing.assert_series_equal(actual, expected)
+
+    def test_create_monthly_timestamps_unknown_month(self):
+        with _pt.raises(KeyError, match="Smarch"):
+            read.PrtReader()._create_monthly_timestamps(  # pylint: disable=protected-access
+                _pd.Series(["January ", "Smarch "])
+            )
+
 
 class TestBenchmarkReader:
 
@@ -91,3 +226,35 @@ class TestBenchmarkReader:
             reader.read_monthly,
             test_const.DATA_FOLDER / "reader/benchmark/PCM_MO.Prt",
         )
+
+    @_pt.mark.parametrize("engine", ["python", "c"])
+    def test_read_hourly_prt(self, benchmark, engine):
+        reader = read.PrtReader()
+        benchmark(
+            reader.read,
+            test_const.DATA_FOLDER / "reader/hourly/Src_Hr.Prt",
+            engine=engine,
+        )
+
+
+class TestBenchmarkTimestamps:
+    # pylint: disable=protected-access
+
+    def test_create_hourly_timestamps(self, benchmark):
+        hours_elapsed = _pd.Series(_np.arange(1, 8761, dtype=float))
+        benchmark(
+            read.PrtReader()._create_hourly_timestamps, hours_elapsed, 2024
+        )
+
+    def test_create_step_timestamps(self, benchmark):
+        hours_elapsed = _pd.Series(_np.arange(525_600) / 60)
+        benchmark(
+            read.PrtReader()._create_step_timestamps, hours_elapsed, 2024
+        )
+
+    def test_create_monthly_timestamps(self, benchmark):
+        # Ten years of monthly data.
+        month_names = _pd.Series(list(read.readers.MONTH_NAMES) * 10)
+        benchmark(
+            read.PrtReader()._create_monthly_timestamps, month_names, 2024
+        )
@@ -0,0 +1,79 @@
+import concurrent.futures as _futures
+import pathlib as _pl
+import threading as _threading
+import time as _time
+
+import pytest as _pt
+
+from pytrnsys_process.process import scheduler as sched
+
+
+@_pt.fixture(name="sim_folders")
+def fixture_sim_folders(tmp_path):
+    folders = []
+    for sim_name, size in [("small", 10), ("large", 1000), ("medium", 100)]:
+        printer_files_folder = tmp_path / sim_name / "temp"
+        printer_files_folder.mkdir(parents=True)
+        (printer_files_folder / "Src_Hr.Prt").write_bytes(b"0" * size)
+        folders.append(tmp_path / sim_name)
+    return folders
+
+
+def _get_names(costs):
+    return [cost.sim_folder.name for cost in costs]
+
+
+def test_estimate_costs_sorts_largest_first(sim_folders):
+    costs = sched.estimate_costs(sim_folders)
+
+    assert _get_names(costs) == ["large", "medium", "small"]
+    assert [cost.input_size for cost in costs] == [1000, 100, 10]
+
+
+def test_estimate_costs_prefers_previous_durations(sim_folders):
+    # The large simulation was quickly loaded from the cache last time.
+    costs = sched.estimate_costs(sim_folders, {"medium": 20.0, "large": 0.5})
+
+    assert _get_names(costs) == ["medium", "small", "large"]
+
+
+def test_iterate_completed_caps_memory_in_use():
+    sizes = [5, 4, 3, 2, 1, 7]
+    costs = [sched.SimulationCost(_pl.Path(str(size)), size) for size in sizes]
+    lock = _threading.Lock()
+    memory_in_use = [0]
+    max_memory_in_use = [0]
+
+    def process(size):
+        with lock:
+            memory_in_use[0] += size
+            max_memory_in_use[0] = max(max_memory_in_use[0], memory_in_use[0])
+        _time.sleep(0.02)
+        with lock:
+            memory_in_use[0] -= size
+
+    with _futures.ThreadPoolExecutor(max_workers=len(sizes)) as executor:
+        completed = list(
+            sched.iterate_completed(
+                costs,
+                lambda sim_folder: executor.submit(
+                    process, int(sim_folder.name)
+                ),
+                max_memory=6,
+            )
+        )
+
+    assert sorted(int(sim_folder.name) for sim_folder, _ in completed) == (
+        sorted(sizes)
+    )
+    # The simulation larger than the cap runs on its own.
+    assert max_memory_in_use[0] == 7
+
+
+def test_save_durations_keeps_previous_ones(tmp_path):
+    assert not sched.load_durations(tmp_path)
+
+    sched.save_durations(tmp_path, {"sim-1": 1.0, "sim-2": 2.0})
+    sched.save_durations(tmp_path, {"sim-2": 3.0})
+
+    assert sched.load_durations(tmp_path) == {"sim-1": 1.0, "sim-2": 3.0}
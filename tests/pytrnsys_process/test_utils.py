@@ -1,15 +1,20 @@
+import contextlib as _contextlib
+import os as _os
 import pathlib as _pl
 import pickle
 import subprocess
 from unittest.mock import Mock, call, patch
 
 import matplotlib.pyplot as plt
+from matplotlib import ticker
+import pandas as _pd
 import pytest as _pt
 
 from pytrnsys_process import config as conf
 from pytrnsys_process import process
 from pytrnsys_process import util
 from tests.pytrnsys_process import constants as const
+from tests.pytrnsys_process import inkscape_stub
 
 RESULTS_FOLDER = _pl.Path(const.DATA_FOLDER / "utils/results")
 
@@ -32,44 +37,173 @@ class IncompleteSimData:
         # Missing: scalar, path_to_simulations
 
 
-def test_save_plot_for_default_settings(tmp_path):
-    fig = Mock(spec=plt.Figure)
+@_pt.fixture(name="figure")
+def fixture_figure():
+    fig, ax = plt.subplots(layout="constrained")
+    ax.plot([1, 2, 3])
+    ax.set_ylabel("Temperature [°C]")
+    yield fig
+    plt.close(fig)
+
+
+def _exporting_plots(is_in_background: bool):
+    if is_in_background:
+        return util.exporting_plots_in_background()
+    return _contextlib.nullcontext()
+
+
+@_pt.mark.parametrize(
+    "is_in_background, export_workers", [(False, 2), (True, 0), (True, 2)]
+)
+def test_save_plot_for_default_settings(
+    tmp_path, figure, monkeypatch, is_in_background, export_workers
+):
+    monkeypatch.setattr(
+        conf.global_settings.plot, "export_workers", export_workers
+    )
+
+    with patch(
+        "pytrnsys_process.util.utils.queue_svg_to_emf_conversion"
+    ) as mock_queue:
+        with _exporting_plots(is_in_background):
+            util.export_plots_in_configured_formats(
+                figure, tmp_path, "test_plot"
+            )
+
+    plots_dir = tmp_path / "plots"
+    assert sorted(file.name for file in plots_dir.iterdir()) == [
+        "test_plot-A4.pdf",
+        "test_plot-A4.png",
+        "test_plot-A4.svg",
+        "test_plot-A4_HALF.pdf",
+        "test_plot-A4_HALF.png",
+        "test_plot-A4_HALF.svg",
+    ]
+    # Verify the EMF conversion was queued for each size
+    assert mock_queue.call_args_list == [
+        call(plots_dir / "test_plot-A4", shall_remove_svg=True),
+        call(plots_dir / "test_plot-A4_HALF", shall_remove_svg=True),
+    ]
+    # The figure itself is not changed by the export.
+    assert tuple(figure.get_size_inches()) == tuple(
+        plt.rcParams["figure.figsize"]
+    )
+    assert figure.get_layout_engine() is not None
+
+
+@_pt.mark.parametrize("is_in_background", [False, True])
+def test_save_plot_with_lambda_formatter(tmp_path, figure, is_in_background):
+    # The lambda can't be pickled, so the figure is exported without a copy.
+    figure.axes[0].xaxis.set_major_formatter(
+        ticker.FuncFormatter(lambda x, _: f"{x:.0f} h")
+    )
+    size = tuple(figure.get_size_inches())
+
+    with (
+        patch("pytrnsys_process.util.utils.queue_svg_to_emf_conversion"),
+        _exporting_plots(is_in_background),
+    ):
+        util.export_plots_in_configured_formats(figure, tmp_path, "test_plot")
+
+    assert (tmp_path / "plots" / "test_plot-A4.png").is_file()
+    assert (tmp_path / "plots" / "test_plot-A4_HALF.pdf").is_file()
+    assert tuple(figure.get_size_inches()) == size
+    assert figure.get_layout_engine() is not None
+
+
+def test_save_plot_writes_svg_once_for_svg_and_emf(
+    tmp_path, figure, monkeypatch
+):
+    monkeypatch.setattr(
+        conf.global_settings.plot, "file_formats", [".svg", ".emf"]
+    )
+    monkeypatch.setattr(
+        conf.global_settings.plot, "figure_sizes", {"A4": (7.8, 3.9)}
+    )
 
+    with (
+        patch("pytrnsys_process.util.utils.queue_svg_to_emf_conversion"),
+        patch("matplotlib.figure.Figure.savefig") as mock_savefig,
+    ):
+        util.export_plots_in_configured_formats(figure, tmp_path, "test_plot")
+
+    assert mock_savefig.call_args_list == [
+        call(tmp_path / "plots" / "test_plot-A4.svg")
+    ]
+
+
+def test_save_plot_outside_of_background_block_raises_export_error(
+    tmp_path, figure
+):
     with (
         patch(
-            "pytrnsys_process.util.utils.convert_svg_to_emf"
-        ) as mock_convert,
-        patch("os.remove") as mock_remove,
+            "pytrnsys_process.util.utils.queue_svg_to_emf_conversion",
+            side_effect=OSError("disk full"),
+        ),
+        _pt.raises(OSError, match="disk full"),
+    ):
+        util.export_plots_in_configured_formats(figure, tmp_path, "test_plot")
+
+
+def test_save_plot_can_close_figure_before_export_finished(tmp_path):
+    fig, ax = plt.subplots()
+    ax.plot([1, 2, 3])
+    other_figure_numbers = [
+        number for number in plt.get_fignums() if number != fig.number
+    ]
+
+    with (
+        patch("pytrnsys_process.util.utils.queue_svg_to_emf_conversion"),
+        util.exporting_plots_in_background(),
     ):
-        # Call save_plot
-        util.export_plots_in_configured_formats(fig, tmp_path, "test_plot")
-
-        # Verify plots directory was created
-        plots_dir = tmp_path / "plots"
-        assert plots_dir.exists()
-
-        # Verify figure size was set for each size
-        expected_set_size_calls = [call((7.8, 3.9)), call((3.8, 3.9))]
-        assert fig.set_size_inches.call_args_list == expected_set_size_calls
-
-        # Verify savefig was called for each format and size
-        expected_savefig_calls = [
-            call(plots_dir / "test_plot-A4.png"),
-            call(plots_dir / "test_plot-A4.pdf"),
-            call(plots_dir / "test_plot-A4.svg"),
-            call(plots_dir / "test_plot-A4_HALF.png"),
-            call(plots_dir / "test_plot-A4_HALF.pdf"),
-            call(plots_dir / "test_plot-A4_HALF.svg"),
-        ]
-        assert fig.savefig.call_args_list == expected_savefig_calls
-
-        # Verify convert_svg_to_emf was called for each size
-        expected_convert_calls = [
-            call(plots_dir / "test_plot-A4"),
-            call(plots_dir / "test_plot-A4_HALF"),
-        ]
-        assert mock_convert.call_args_list == expected_convert_calls
-        assert mock_remove.call_count == 2
+        util.export_plots_in_configured_formats(fig, tmp_path, "test_plot", "")
+        plt.close(fig)
+
+    assert (tmp_path / "test_plot-A4.png").is_file()
+    # The copy of the figure which was exported is not known to pyplot.
+    assert plt.get_fignums() == other_figure_numbers
+
+
+def test_background_block_raises_export_error(tmp_path, figure):
+    with patch(
+        "pytrnsys_process.util.utils.queue_svg_to_emf_conversion",
+        side_effect=OSError("disk full"),
+    ):
+        with _pt.raises(OSError, match="disk full"):
+            with util.exporting_plots_in_background():
+                util.export_plots_in_configured_formats(
+                    figure, tmp_path, "test_plot"
+                )
+
+    # The failed export is not reported again.
+    util.wait_for_plot_exports()
+
+
+def test_pending_exports_are_reported_at_exit(tmp_path, figure):
+    with patch(
+        "pytrnsys_process.util.utils.queue_svg_to_emf_conversion",
+        side_effect=OSError("disk full"),
+    ):
+        # Like a block which is left without waiting, e.g. when the interpreter exits.
+        util.utils._PLOT_EXPORT_STATE.is_in_background = (  # pylint: disable=protected-access
+            True
+        )
+        try:
+            util.export_plots_in_configured_formats(
+                figure, tmp_path, "test_plot"
+            )
+        finally:
+            util.utils._PLOT_EXPORT_STATE.is_in_background = (  # pylint: disable=protected-access
+                False
+            )
+
+        with patch(
+            "pytrnsys_process.log.default_console_logger"
+        ) as mock_logger:
+            util.utils._finish_plot_exports_at_exit()  # pylint: disable=protected-access
+
+    mock_logger.error.assert_called_once()
+    assert "Exporting plot failed" in mock_logger.error.call_args[0][0]
 
 
 def test_convert_svg_to_emf(tmp_path):
@@ -137,6 +271,169 @@ def test_convert_svg_to_emf_subprocess_error(tmp_path):
         )
 
 
+@_pt.fixture(name="inkscape_path")
+def fixture_inkscape_path(tmp_path, monkeypatch):
+    stub_folder = tmp_path / "inkscape"
+    stub_folder.mkdir()
+    inkscape_path = inkscape_stub.create_inkscape_stub(stub_folder)
+    monkeypatch.setattr(
+        conf.global_settings.plot, "inkscape_path", str(inkscape_path)
+    )
+    return inkscape_path
+
+
+def _write_svgs(folder: _pl.Path, names: list[str]) -> list[_pl.Path]:
+    files_no_suffix = [folder / name for name in names]
+    for file_no_suffix in files_no_suffix:
+        file_no_suffix.with_suffix(".svg").write_text("<svg/>")
+    return files_no_suffix
+
+
+def test_convert_pending_svgs_to_emf_starts_inkscape_once(
+    tmp_path, inkscape_path
+):
+    files_no_suffix = _write_svgs(tmp_path, [f"plot{i}" for i in range(5)])
+    for file_no_suffix in files_no_suffix[:-1]:
+        util.queue_svg_to_emf_conversion(file_no_suffix, shall_remove_svg=True)
+    util.queue_svg_to_emf_conversion(files_no_suffix[-1])
+
+    failures = util.convert_pending_svgs_to_emf()
+
+    assert not failures
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+    for file_no_suffix in files_no_suffix:
+        assert file_no_suffix.with_suffix(".emf").is_file()
+    assert [file.stem for file in tmp_path.glob("*.svg")] == ["plot4"]
+    # Nothing is left to convert.
+    assert not util.convert_pending_svgs_to_emf()
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+
+
+def test_convert_pending_svgs_to_emf_uses_pool_of_inkscape_processes(
+    tmp_path, inkscape_path, monkeypatch
+):
+    monkeypatch.setattr(conf.global_settings.plot, "inkscape_processes", 2)
+    files_no_suffix = _write_svgs(tmp_path, [f"plot{i}" for i in range(25)])
+    for file_no_suffix in files_no_suffix:
+        util.queue_svg_to_emf_conversion(file_no_suffix)
+
+    failures = util.convert_pending_svgs_to_emf()
+
+    assert not failures
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 2
+    assert len(list(tmp_path.glob("*.emf"))) == 25
+
+
+def test_convert_pending_svgs_to_emf_reports_failed_files(
+    tmp_path, inkscape_path
+):  # pylint: disable=unused-argument
+    files_no_suffix = _write_svgs(tmp_path, ["plot", "broken-plot"])
+    # Outdated EMF files are kept, but only the rewritten one counts as converted.
+    for emf_name in ["plot.emf", "broken-plot.emf"]:
+        (tmp_path / emf_name).write_text("outdated")
+        _os.utime(tmp_path / emf_name, ns=(0, 0))
+    for file_no_suffix in [*files_no_suffix, tmp_path / "missing-plot"]:
+        util.queue_svg_to_emf_conversion(file_no_suffix, shall_remove_svg=True)
+    logger = Mock()
+
+    failures = util.convert_pending_svgs_to_emf(logger)
+
+    assert sorted(failures) == [
+        tmp_path / "broken-plot.emf",
+        tmp_path / "missing-plot.emf",
+    ]
+    assert "Can't open file" in failures[tmp_path / "broken-plot.emf"]
+    assert (
+        str(tmp_path / "missing-plot.svg")
+        in failures[tmp_path / "missing-plot.emf"]
+    )
+    assert logger.error.call_count == 2
+    assert (tmp_path / "plot.emf").read_text() != "outdated"
+    assert not (tmp_path / "plot.svg").exists()
+    assert (tmp_path / "broken-plot.emf").read_text() == "outdated"
+    assert (tmp_path / "broken-plot.svg").is_file()
+
+
+def test_convert_pending_svgs_to_emf_inkscape_not_found(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        conf.global_settings.plot, "inkscape_path", str(tmp_path / "none")
+    )
+    files_no_suffix = _write_svgs(tmp_path, ["plot1", "plot2"])
+    for file_no_suffix in files_no_suffix:
+        util.queue_svg_to_emf_conversion(file_no_suffix, shall_remove_svg=True)
+
+    failures = util.convert_pending_svgs_to_emf(Mock())
+
+    assert len(failures) == 2
+    assert all(
+        reason.startswith("System error running Inkscape")
+        for reason in failures.values()
+    )
+    assert len(list(tmp_path.glob("*.svg"))) == 2
+
+
+def test_convert_pending_svgs_to_emf_waits_for_full_batch(
+    tmp_path, inkscape_path, monkeypatch
+):
+    monkeypatch.setattr(conf.global_settings.plot, "inkscape_processes", 1)
+    # The batch size per Inkscape process is not part of the API, but decides when a batch is full.
+    batch_size = (
+        util.utils._MIN_SVGS_PER_INKSCAPE_PROCESS  # pylint: disable=protected-access
+    )
+    files_no_suffix = _write_svgs(
+        tmp_path, [f"plot{i}" for i in range(batch_size)]
+    )
+    for file_no_suffix in files_no_suffix[:-1]:
+        util.queue_svg_to_emf_conversion(file_no_suffix)
+
+    assert not util.convert_pending_svgs_to_emf(only_if_batch_is_full=True)
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 0
+
+    util.queue_svg_to_emf_conversion(files_no_suffix[-1])
+    assert not util.convert_pending_svgs_to_emf(only_if_batch_is_full=True)
+
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+    assert len(list(tmp_path.glob("*.emf"))) == len(files_no_suffix)
+
+
+def test_take_pending_svg_to_emf_conversions(tmp_path):
+    util.queue_svg_to_emf_conversion(tmp_path / "plot1")
+    util.queue_svg_to_emf_conversion(tmp_path / "plot2", shall_remove_svg=True)
+
+    assert util.take_pending_svg_to_emf_conversions() == [
+        (tmp_path / "plot1", False),
+        (tmp_path / "plot2", True),
+    ]
+    assert not util.take_pending_svg_to_emf_conversions()
+
+
+def test_export_plots_outside_of_background_block_writes_emf(
+    tmp_path, figure, inkscape_path
+):
+    util.export_plots_in_configured_formats(figure, tmp_path, "plot")
+
+    plots_dir = tmp_path / "plots"
+    assert len(list(plots_dir.glob("*.emf"))) == 2
+    assert not util.take_pending_svg_to_emf_conversions()
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+
+
+def test_export_plots_converts_to_emf_in_one_batch(
+    tmp_path, figure, inkscape_path
+):
+    with util.exporting_plots_in_background():
+        util.export_plots_in_configured_formats(figure, tmp_path, "plot1")
+        util.export_plots_in_configured_formats(figure, tmp_path, "plot2")
+
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 0
+    assert not util.convert_pending_svgs_to_emf()
+
+    assert inkscape_stub.get_number_of_starts(inkscape_path) == 1
+    plots_dir = tmp_path / "plots"
+    assert len(list(plots_dir.glob("*.emf"))) == 4
+    assert not list(plots_dir.glob("*.svg"))
+
+
 def test_get_files_works_as_expected(tmp_path):
     # Create test directory structure
     sim_folder = tmp_path / "sim1"
@@ -244,6 +541,154 @@ def test_simulations_data_pickle(tmp_path):
     assert simulations_data_from_pickle.scalar.shape == (2, 10)
 
 
+def test_simulation_cache(tmp_path):
+    cache_folder = tmp_path / "simulation_cache"
+    sim_folder = _pl.Path(RESULTS_FOLDER / "sim-1")
+    simulation = process.process_single_simulation(sim_folder, lambda x: None)
+
+    util.save_simulation_to_cache(simulation, cache_folder)
+    sim_from_cache = util.load_simulation_from_cache(cache_folder)
+
+    _pd.testing.assert_frame_equal(sim_from_cache.monthly, simulation.monthly)
+    _pd.testing.assert_frame_equal(sim_from_cache.hourly, simulation.hourly)
+    _pd.testing.assert_frame_equal(sim_from_cache.scalar, simulation.scalar)
+    assert sim_from_cache.step.shape == (0, 0)
+    assert sim_from_cache.path == tmp_path.as_posix()
+
+
+def test_simulation_cache_with_column_projection(tmp_path):
+    cache_folder = tmp_path / "simulation_cache"
+    sim_folder = _pl.Path(RESULTS_FOLDER / "sim-1")
+    simulation = process.process_single_simulation(sim_folder, lambda x: None)
+    columns_to_load = simulation.hourly.columns[[0, 3]].tolist()
+
+    util.save_simulation_to_cache(simulation, cache_folder)
+    sim_from_cache = util.load_simulation_from_cache(
+        cache_folder, columns={"hourly": columns_to_load}
+    )
+
+    _pd.testing.assert_frame_equal(
+        sim_from_cache.hourly, simulation.hourly[columns_to_load]
+    )
+    assert sim_from_cache.monthly.shape == (14, 11)
+
+    with _pt.raises(KeyError, match="not-a-column"):
+        util.load_resolution_from_cache(
+            cache_folder, "hourly", columns=["not-a-column"]
+        )
+
+
+def test_simulation_cache_with_time_window(tmp_path):
+    cache_folder = tmp_path / "simulation_cache"
+    sim_folder = _pl.Path(RESULTS_FOLDER / "sim-1")
+    simulation = process.process_single_simulation(sim_folder, lambda x: None)
+    start, end = simulation.hourly.index[[1, 2]]
+
+    util.save_simulation_to_cache(simulation, cache_folder)
+    hourly = util.load_resolution_from_cache(
+        cache_folder, "hourly", time_window=(start, end)
+    )
+
+    _pd.testing.assert_frame_equal(hourly, simulation.hourly.iloc[1:3])
+
+
+def test_simulation_cache_has_float_dtype(tmp_path):
+    cache_folder = tmp_path / "simulation_cache"
+    sim_folder = _pl.Path(RESULTS_FOLDER / "sim-1")
+    simulation = process.process_single_simulation(sim_folder, lambda x: None)
+    simulation.hourly = simulation.hourly.astype("float32")
+
+    util.save_simulation_to_cache(simulation, cache_folder)
+
+    assert not util.has_float_dtype(cache_folder, None)
+    assert not util.has_float_dtype(cache_folder, "float64")
+    simulation.monthly = simulation.monthly.astype("float32")
+    util.save_simulation_to_cache(simulation, cache_folder)
+    assert util.has_float_dtype(cache_folder, "float32")
+
+
+def test_load_simulation_from_missing_cache(tmp_path):
+    with _pt.raises(FileNotFoundError):
+        util.load_simulation_from_cache(tmp_path / "simulation_cache")
+
+
+def test_lazy_simulation_loads_on_access(tmp_path):
+    cache_folder = tmp_path / "simulation_cache"
+    sim_folder = _pl.Path(RESULTS_FOLDER / "sim-1")
+    simulation = process.process_single_simulation(sim_folder, lambda x: None)
+    util.save_simulation_to_cache(simulation, cache_folder)
+
+    lazy_simulation = util.LazySimulation(tmp_path.as_posix(), cache_folder)
+    assert isinstance(lazy_simulation, process.Simulation)
+    assert not lazy_simulation.is_loaded("hourly")
+
+    _pd.testing.assert_frame_equal(lazy_simulation.hourly, simulation.hourly)
+    assert lazy_simulation.is_loaded("hourly")
+    assert not lazy_simulation.is_loaded("monthly")
+
+    lazy_simulation.scalar["new_value"] = 1
+    lazy_simulation.evict()
+    assert not lazy_simulation.is_loaded("hourly")
+    assert lazy_simulation.scalar["new_value"][0] == 1
+
+    lazy_simulation.hourly["new_column"] = 1
+    lazy_simulation.step = lazy_simulation.step.copy()
+    assert lazy_simulation.is_modified("hourly")
+    assert lazy_simulation.is_modified("step")
+    assert not lazy_simulation.is_modified("monthly")
+    lazy_simulation.evict()
+    assert "new_column" in lazy_simulation.hourly
+    assert lazy_simulation.is_loaded("step")
+
+    lazy_from_pickle = pickle.loads(pickle.dumps(lazy_simulation))
+    assert not lazy_from_pickle.is_loaded("monthly")
+    assert lazy_from_pickle.monthly.shape == (14, 11)
+
+
+def test_manifest_detects_changed_files(tmp_path):
+    files = []
+    for name in ["a.prt", "b.prt", "c.prt"]:
+        files.append(tmp_path / name)
+        files[-1].write_text("1 2 3")
+
+    manifest = util.create_manifest(tmp_path, files)
+    util.save_manifest(manifest, tmp_path)
+    manifest = util.load_manifest(tmp_path)
+    assert util.get_changed_files(tmp_path, files, manifest) == []
+
+    files[0].write_text("1 2 3 4")
+    files[1].unlink()
+    new_file = tmp_path / "d.prt"
+    new_file.write_text("1 2 3")
+    current_files = [files[0], files[2], new_file]
+
+    assert util.get_changed_files(tmp_path, current_files, manifest) == [
+        "a.prt",
+        "b.prt",
+        "d.prt",
+    ]
+
+
+def test_manifest_with_hash_ignores_touched_files(tmp_path):
+    file = tmp_path / "a.prt"
+    file.write_text("1 2 3")
+    manifest = util.create_manifest(tmp_path, [file], hash_content=True)
+
+    stat = file.stat()
+    _os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert util.get_changed_files(tmp_path, [file], manifest) == []
+
+    file.write_text("1 2 4")
+    _os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert util.get_changed_files(tmp_path, [file], manifest) == ["a.prt"]
+
+
+def test_load_missing_or_invalid_manifest(tmp_path):
+    assert util.load_manifest(tmp_path) is None
+    (tmp_path / "manifest.json").write_text("{not json")
+    assert util.load_manifest(tmp_path) is None
+
+
 def test_load_simulation_from_invalid_pickle(tmp_path):
     """Test loading a simulation from an invalid pickle file."""
     invalid_pickle = tmp_path / "invalid.pickle"